@@ -0,0 +1,138 @@
+"""Run the benchmarks, without network access.
+
+Usage::
+
+    python -m benchmarks [--scales 1 10 100] [--repeat 5] [--only build_]
+                         [--save NAME] [--compare NAME] [--threshold 0.1]
+
+Run from the root of the repository, with the package installed
+(or ``src`` on `PYTHONPATH`). Baselines are written to ``benchmarks/baselines``;
+comparing against one exits with status 1 if any case got slower
+or used more memory by more than the threshold.
+"""
+from pathlib import Path
+import argparse
+import gc
+import json
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+
+from benchmarks.cases import CASES, Case
+from benchmarks.fixtures import load_fixture, scale
+
+BASELINE_DIR = Path(__file__).parent / 'baselines'
+
+def _get_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'],
+            capture_output=True, text=True, check=True, cwd=Path(__file__).parent
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def measure(case: Case, data: object, repeat: int) -> tuple[float, int]:
+    """Get the fastest time of `repeat` runs, and the peak memory allocated by one run."""
+    times: list[float] = []
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        case.run(data)
+        times.append(time.perf_counter() - start)
+
+    # Tracing allocations slows everything down, so memory is measured in a separate run.
+    gc.collect()
+    tracemalloc.start()
+    try:
+        case.run(data)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return min(times), peak
+
+def run(scales: list[int], repeat: int, only: str | None) -> dict[str, dict[str, float]]:
+    fixture = load_fixture()
+    results: dict[str, dict[str, float]] = {}
+
+    print(f'{"case":<32}{"rows":>10}{"seconds":>12}{"rows/s":>14}{"peak MiB":>11}')
+    for factor in scales:
+        tabs = scale(fixture, factor)
+
+        for case in CASES:
+            if only is not None and only not in case.name:
+                continue
+
+            data, rows = case.setup(tabs)
+            seconds, peak = measure(case, data, repeat)
+
+            key = f'{case.name}@{factor}x'
+            results[key] = {'rows': rows, 'seconds': seconds, 'peak_bytes': peak}
+            print(f'{key:<32}{rows:>10}{seconds:>12.5f}{rows / seconds:>14,.0f}{peak / 2**20:>11.2f}')
+
+    return results
+
+def compare(results: dict[str, dict[str, float]], baseline_name: str, threshold: float) -> bool:
+    """Print how each case changed since the baseline.
+
+    Returns:
+        Whether no case regressed by more than `threshold`.
+    """
+    with open(BASELINE_DIR / f'{baseline_name}.json') as f:
+        baseline = json.load(f)
+
+    print(f'\nCompared to {baseline_name!r} (commit {baseline["commit"]}):')
+    print(f'{"case":<32}{"time":>10}{"memory":>10}')
+
+    passed = True
+    for key, result in results.items():
+        previous = baseline['results'].get(key)
+        if previous is None:
+            continue
+
+        time_ratio = result['seconds'] / previous['seconds']
+        memory_ratio = result['peak_bytes'] / max(previous['peak_bytes'], 1)
+
+        regressed = time_ratio > 1 + threshold or memory_ratio > 1 + threshold
+        passed = passed and not regressed
+
+        flag = '  REGRESSION' if regressed else ''
+        print(f'{key:<32}{time_ratio:>9.2f}x{memory_ratio:>9.2f}x{flag}')
+
+    return passed
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m benchmarks', description=__doc__.splitlines()[0])
+    parser.add_argument('--scales', type=int, nargs='+', default=[1, 10, 100],
+                        help='how many times the rows of the bundled fixture are repeated')
+    parser.add_argument('--repeat', type=int, default=5,
+                        help='how many times each case is timed; the fastest time is kept')
+    parser.add_argument('--only', help='only run the cases whose name contains this')
+    parser.add_argument('--save', metavar='NAME', help='save the results as a baseline')
+    parser.add_argument('--compare', metavar='NAME', help='compare the results to a baseline')
+    parser.add_argument('--threshold', type=float, default=0.1,
+                        help='the slowdown, or memory increase, counted as a regression')
+    args = parser.parse_args(argv)
+
+    results = run(args.scales, args.repeat, args.only)
+
+    if args.save is not None:
+        BASELINE_DIR.mkdir(exist_ok=True)
+        with open(BASELINE_DIR / f'{args.save}.json', 'w') as f:
+            json.dump({
+                'commit': _get_commit(),
+                'python': platform.python_version(),
+                'machine': platform.machine(),
+                'results': results
+            }, f, indent=2)
+
+    if args.compare is not None and not compare(results, args.compare, args.threshold):
+        return 1
+
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,172 @@
+"""The benchmarked operations.
+
+Each case prepares its input once per scale, outside of the timing,
+then times a function that takes that input.
+"""
+from dataclasses import dataclass
+from types import SimpleNamespace
+from typing import Any, Callable
+import json
+import os
+import tempfile
+
+from yetracker import YeTracker
+from yetracker._raw_values import RawTabDict, RawValuesFromJson
+from yetracker.column import Contributors, Date, Name, QualityEnum, Version, parse_cache
+from yetracker.tab import ReleasedTab, SamplesTab, StemsTab, Tab, UnreleasedTab
+
+@dataclass
+class Case:
+    name: str
+    #: Makes the input of `run` from the fixture's tabs, and counts the rows it covers.
+    setup: Callable[[list[RawTabDict]], tuple[Any, int]]
+    run: Callable[[Any], object]
+
+def _get_values(tabs: list[RawTabDict], tab_name: str):
+    return next(tab['values'] for tab in tabs if tab['range'] == tab_name)
+
+def _count_rows(tabs: list[RawTabDict]) -> int:
+    return sum(len(tab['values']) for tab in tabs)
+
+def _json_load_setup(tabs: list[RawTabDict]) -> tuple[Any, int]:
+    return json.dumps(tabs), _count_rows(tabs)
+
+def _json_load(text: str):
+    fetcher = RawValuesFromJson(text)
+    for tab_name in ('Unreleased', 'Released', 'Stems', 'Samples'):
+        fetcher.get_raw_values(tab_name)
+
+def _build_case(tab_name: str, tab_cls: type[Tab], fields: set[str] | None = None) -> Case:
+    def setup(tabs: list[RawTabDict]) -> tuple[Any, int]:
+        values = _get_values(tabs, tab_name)
+        return values, len(values)
+
+    def run(values):
+        # Otherwise, repeated cells would be parsed only on the first run.
+        parse_cache.clear()
+        return tab_cls(values, fields=fields)
+
+    suffix = '' if fields is None else '_projected'
+    return Case(f'build_{tab_name.lower()}{suffix}', setup, run)
+
+def _name_cells_setup(tabs: list[RawTabDict]) -> tuple[Any, int]:
+    # Only entry rows, since era, blank and end rows are never parsed as entries.
+    rules = UnreleasedTab([])
+    values = enumerate(_get_values(tabs, 'Unreleased'))
+    rows = list(rules._iter_entry_rows(values, rules._get_era_manager()))
+    return rows, len(rows)
+
+def _parse_names(rows):
+    for row in rows:
+        Name(row, 1)()
+
+def _parse_names_pipeline(rows):
+    # The separate passes that `Name` made before parsing in one pass, for comparison.
+    for row in rows:
+        name = Name(row, 1)
+        emojis, name_str = name.extract_emojis(name.base_str)
+        version, name_str = name.extract_version(name_str)
+        contribs, name_str = name.extract_contribs(name_str)
+        alt_names, name_str = name.extract_alt_names(name_str)
+        artist, name_str = name.extract_artist(name_str)
+
+def _parse_contributors(rows):
+    for row in rows:
+        Contributors(row[1])
+
+def _parse_dates(rows):
+    for row in rows:
+        Date(row, 4)._parse()
+
+def _unreleased_tab_setup(tabs: list[RawTabDict]) -> tuple[Any, int]:
+    tab = UnreleasedTab(_get_values(tabs, 'Unreleased'))
+    return tab, len(tab)
+
+def _filter_case(name: str, apply: Callable[[UnreleasedTab], object]) -> Case:
+    def run(tab: UnreleasedTab):
+        # Time building the indexes too, not only looking values up in them.
+        tab._indexes.clear()
+        return apply(tab)
+
+    return Case(name, _unreleased_tab_setup, run)
+
+# The objects that each entry holds one of, and which are copied with it.
+_PER_ENTRY = (Contributors, Version)
+
+def _get_slot_values(obj) -> dict[str, Any]:
+    slots = (slot for base in type(obj).__mro__ for slot in base.__dict__.get('__slots__', ()))
+    return {slot: getattr(obj, slot) for slot in slots if hasattr(obj, slot)}
+
+def _copy_with_slots(obj):
+    copy = type(obj).__new__(type(obj))
+    for slot, value in _get_slot_values(obj).items():
+        setattr(copy, slot, _copy_with_slots(value) if isinstance(value, _PER_ENTRY) else value)
+
+    return copy
+
+def _copy_with_dict(obj):
+    # The layout entries had before they were given `__slots__`.
+    return SimpleNamespace(**{
+        slot: _copy_with_dict(value) if isinstance(value, _PER_ENTRY) else value
+        for slot, value in _get_slot_values(obj).items()
+    })
+
+def _layout_case(name: str, copy: Callable[[Any], Any]) -> Case:
+    """Measure the memory held by a tab's entries, copied into a layout. 
+    Cell strings are shared with the tab, so only the objects themselves are counted."""
+    def run(tab: UnreleasedTab):
+        return [copy(entry) for entry in tab]
+
+    return Case(name, _unreleased_tab_setup, run)
+
+def _save_setup(tabs: list[RawTabDict]) -> tuple[Any, int]:
+    tracker = YeTracker(raw_json=json.dumps(tabs))
+    tracker.load_tabs()
+    return tracker, _count_rows(tabs)
+
+def _save_data_to_file(tracker: YeTracker):
+    fd, path = tempfile.mkstemp(suffix='.json')
+    os.close(fd)
+    try:
+        tracker.save_data_to_file(path)
+    finally:
+        os.remove(path)
+
+def _cold_load_setup(tabs: list[RawTabDict]) -> tuple[Any, int]:
+    """Save the tabs both as a snapshot and as raw values, in a directory 
+    that's removed once the input is no longer used."""
+    tracker, rows = _save_setup(tabs)
+    directory = tempfile.TemporaryDirectory()
+    tracker.save_snapshot(os.path.join(directory.name, 'tracker.snapshot'))
+    tracker.save_data_to_file(os.path.join(directory.name, 'tracker.json'))
+    return directory, rows
+
+def _load_snapshot(directory: tempfile.TemporaryDirectory):
+    return YeTracker().load_snapshot(os.path.join(directory.name, 'tracker.snapshot'))
+
+def _load_reparse(directory: tempfile.TemporaryDirectory):
+    # What a worker did before snapshots: parse every tab from the saved raw values.
+    parse_cache.clear()
+    with open(os.path.join(directory.name, 'tracker.json'), encoding='utf-8') as f:
+        return YeTracker(raw_json=f).load_tabs()
+
+CASES: list[Case] = [
+    Case('json_load', _json_load_setup, _json_load),
+    _build_case('Unreleased', UnreleasedTab),
+    _build_case('Released', ReleasedTab),
+    _build_case('Stems', StemsTab),
+    _build_case('Samples', SamplesTab),
+    _build_case('Unreleased', UnreleasedTab, fields={'main_name', 'quality', 'era'}),
+    Case('parse_name', _name_cells_setup, _parse_names),
+    Case('parse_name_pipeline', _name_cells_setup, _parse_names_pipeline),
+    Case('parse_contributors', _name_cells_setup, _parse_contributors),
+    Case('parse_date', _name_cells_setup, _parse_dates),
+    _filter_case('filter_best_of', UnreleasedTab.get_best_of),
+    _filter_case('filter_quality', lambda tab: tab.where(quality=QualityEnum.LOSSLESS)),
+    _filter_case('filter_era', lambda tab: tab.where(era=tab.eras[0])),
+    Case('save_data_to_file', _save_setup, _save_data_to_file),
+    Case('load_snapshot', _cold_load_setup, _load_snapshot),
+    Case('load_reparse', _cold_load_setup, _load_reparse),
+    _layout_case('layout_slots', _copy_with_slots),
+    _layout_case('layout_dict', _copy_with_dict)
+]
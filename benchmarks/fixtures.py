@@ -0,0 +1,239 @@
+"""Synthetic tracker sheets, for benchmarks and for testing at scale offline.
+
+Sheets can be generated at any size, with a seed, from the command line::
+
+    python -m benchmarks.fixtures --size 100 --seed 1 -o big.json
+
+The output is JSON in the format read by `use_json`, written to standard output
+unless a file is given with ``-o``. The bundled fixture, ``data/tracker.json``, 
+is the output with the default arguments; regenerate it with 
+``-o benchmarks/data/tracker.json``.
+"""
+from pathlib import Path
+import argparse
+import json
+import random
+import sys
+
+from yetracker._raw_values import RawTabDict
+from yetracker.common import Range, Row
+
+FIXTURE_PATH = Path(__file__).parent / 'data' / 'tracker.json'
+
+_WORDS = [
+    'Love', 'Lockdown', 'Heaven', 'Hell', 'Power', 'Runaway', 'Ghost', 'Town',
+    'Flashing', 'Lights', 'Street', 'Lights', 'Spaceship', 'Gold', 'Digger',
+    'Mercy', 'Famous', 'Father', 'Stretch', 'Hands', 'Moon', 'Hurricane', 'Jail',
+    'Off', 'The', 'Grid', 'Praise', 'God', 'Donda', 'Chant', 'Bound', 'Wolves'
+]
+_ARTISTS = ['Kid Cudi', 'Travis Scott', 'Pusha T', 'Mike Dean', 'Ty Dolla $ign',
+            'Jay-Z', 'Consequence', 'Nas', 'Andre 3000', 'Pi\'erre Bourne']
+_EMOJIS = ['⭐', '✨', '🏆', '🥇', '🗑️', '🤖']
+_QUALITIES = ['Not Available', 'Recording', 'Low Quality', 'High Quality', 'CD Quality', 'Lossless']
+_LENGTHS = ['Snippet', 'Partial', 'Beat Only', 'Tagged', 'Full', 'OG File', 'Confirmed']
+_RELEASE_TYPES = ['Album Track', 'Feature', 'Other', 'Production', 'Single']
+_STEM_TYPES = ['Acapellas', 'Instrumentals', 'Sessions', 'Studio Stems', 'TV Tracks']
+_MONTHS = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
+
+def _title(rng: random.Random, words: int = 3) -> str:
+    return ' '.join(rng.choice(_WORDS) for _ in range(rng.randint(1, words)))
+
+def _date(rng: random.Random) -> str:
+    choice = rng.random()
+    if choice < 0.2:
+        return ''
+    elif choice < 0.3:
+        return str(rng.randint(2004, 2024))
+
+    return f'{rng.choice(_MONTHS)} {rng.randint(1, 28):02}, {rng.randint(2004, 2024)}'
+
+def _length(rng: random.Random) -> str:
+    return '' if rng.random() < 0.1 else f'{rng.randint(0, 7)}:{rng.randint(0, 59):02}'
+
+def _name(rng: random.Random) -> str:
+    """Make a "Name" cell, with the parts that `Name` extracts."""
+    name = _title(rng)
+
+    if rng.random() < 0.2:
+        name = rng.choice(_EMOJIS) + ' ' + name
+    if rng.random() < 0.1:
+        name = f'{rng.choice(_ARTISTS)} - {name}'
+    if rng.random() < 0.3:
+        start = rng.randint(1, 5)
+        end = rng.choice(['', '', '', f'-V{start + 2}', '-V?'])
+        name += f' [V{start}{end}]'
+
+    contribs = [f'({tag} {rng.choice(_ARTISTS)})'
+                for tag in ('feat.', 'ref.', 'with', 'prod.') if rng.random() < 0.3]
+    alt_names = [_title(rng) for _ in range(rng.randint(0, 2))]
+
+    lines = [name]
+    if contribs:
+        lines.append(' '.join(contribs))
+    if alt_names:
+        lines.append(f"({', '.join(alt_names)})")
+
+    return '\n'.join(lines)
+
+def _notes(rng: random.Random) -> str:
+    return ' '.join(rng.choice(_WORDS).lower() for _ in range(rng.randint(0, 40)))
+
+def _era_row(rng: random.Random, era_name: str) -> Row:
+    stats = '\n'.join(f'{rng.randint(0, 80)} {length}' for length in _LENGTHS[:5])
+    events = f'({rng.randint(1, 12):02}/{rng.randint(1, 28):02}/{rng.randint(2004, 2024)}) ({_title(rng)})'
+    return [stats, f'{era_name}\n({_title(rng)}, {_title(rng)})', events, '', '', _notes(rng)]
+
+def _subera_row(era_name: str, rng: random.Random) -> Row:
+    return [era_name, _title(rng), f'({rng.randint(2004, 2024)}) ({_title(rng)})']
+
+#: The row that ends the entries of the Unreleased tab, and the legend that follows it.
+_END_ROWS: Range = [
+    ['Links', '', 'Quality', '', 'Available Length'],
+    ['', '', 'Lossless', '', 'OG File'],
+    ['', '', 'CD Quality', '', 'Full']
+]
+
+#: How many entries each era has, on average.
+_ERA_SIZE = 50
+
+def _make_tab(rng: random.Random,
+              header: Row,
+              entries: int,
+              make_entry,
+              has_eras: bool = True,
+              subera_row=_subera_row,
+              end_rows: Range | None = None) -> Range:
+    values: Range = [header]
+    era_name = 'Before The College Dropout'
+
+    for i in range(entries):
+        if has_eras and i % _ERA_SIZE == 0:
+            era_name = f'{_title(rng, 2)} {i}'
+            values.append(_era_row(rng, era_name))
+        if has_eras and subera_row is not None and i % 25 == 10:
+            values.append(subera_row(era_name, rng))
+        if rng.random() < 0.01:
+            # Blank rows are skipped by the parser.
+            values.append([''])
+
+        values.append(make_entry(rng, era_name))
+
+    if end_rows is not None:
+        values.extend(end_rows)
+
+    return values
+
+def generate(seed: int = 0, size: float = 1) -> list[RawTabDict]:
+    """Generate the tabs of a tracker.
+
+    Arguments:
+        seed: The seed of the random values. The same seed and size 
+            always give the same tabs.
+        size: How many entries each tab has, relative to the bundled fixture,
+            which has 1000 unreleased entries, and 300 to 400 in the other tabs.
+    """
+    rng = random.Random(seed)
+
+    def count(entries: int) -> int:
+        return max(1, round(entries * size))
+
+    def unreleased(rng: random.Random, era: str) -> Row:
+        return [era, _name(rng), _notes(rng), _length(rng), _date(rng), _date(rng),
+                rng.choice(_LENGTHS), rng.choice(_QUALITIES), 'https://example.com/u']
+
+    def released(rng: random.Random, era: str) -> Row:
+        return [era, _name(rng), _notes(rng), _length(rng), _date(rng),
+                rng.choice(_RELEASE_TYPES), rng.choice(['Yes', 'No']), 'https://example.com/r']
+
+    def stem(rng: random.Random, era: str) -> Row:
+        return [era, _name(rng), _notes(rng), _date(rng), _date(rng), _length(rng),
+                str(rng.randint(60, 180)), rng.choice(_LENGTHS), rng.choice(_QUALITIES),
+                'https://example.com/s']
+
+    def stem_subera(era: str, rng: random.Random) -> Row:
+        return [era, rng.choice(_STEM_TYPES)]
+
+    def sample(rng: random.Random, era: str) -> Row:
+        sample_count = rng.randint(1, 3)
+        samples = '\n'.join(f'{rng.choice(_ARTISTS)} - {_title(rng)}' for _ in range(sample_count))
+        notes = '\n'.join(_notes(rng)[:40] for _ in range(sample_count))
+        links = '\n'.join('https://example.com/sample' for _ in range(sample_count))
+        return [era, _name(rng), samples, notes, links]
+
+    return [
+        {'range': 'Unreleased', 'values': _make_tab(
+            rng, ['Era', 'Name', 'Notes', 'Track Length', 'File Date', 'Leak Date',
+                  'Available Length', 'Quality', 'Link(s)'],
+            count(1000), unreleased, end_rows=_END_ROWS)},
+        {'range': 'Released', 'values': _make_tab(
+            rng, ['Era', 'Name', 'Notes', 'Track Length', 'Release Date',
+                  'Type', 'Streaming', 'Link(s)'],
+            count(400), released)},
+        {'range': 'Stems', 'values': _make_tab(
+            rng, ['Era', 'Name', 'Notes', 'File Date', 'Leak Date', 'Track Length',
+                  'BPM', 'Available Length', 'Quality', 'Link(s)'],
+            count(300), stem, subera_row=stem_subera)},
+        {'range': 'Samples', 'values': _make_tab(
+            rng, ['Era', 'Name', 'Sample(s)', 'Notes', 'Link(s)'], count(300), sample, 
+            has_eras=False)}
+    ]
+
+def load_fixture() -> list[RawTabDict]:
+    """Load the bundled fixture."""
+    with open(FIXTURE_PATH, encoding='utf-8') as f:
+        return json.load(f)
+
+def scale(tabs: list[RawTabDict], factor: int) -> list[RawTabDict]:
+    """Repeat every row between the header and the end rows `factor` times.
+    Names get a suffix in each copy, so that entries stay distinct."""
+    if factor == 1:
+        return tabs
+
+    scaled: list[RawTabDict] = []
+    for tab in tabs:
+        header, *rows = tab['values']
+        end = next((i for i, row in enumerate(rows) if row[:3] == _END_ROWS[0][:3]), len(rows))
+        values: Range = [header]
+
+        for copy in range(factor):
+            for row in rows[:end]:
+                if copy > 0 and len(row) > 1:
+                    row = [row[0], f'{row[1]} #{copy}', *row[2:]]
+                values.append(row)
+
+        values.extend(rows[end:])
+        scaled.append({'range': tab['range'], 'values': values})
+
+    return scaled
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.fixtures', 
+                                     description='Generate a synthetic tracker.')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--size', type=float, default=1,
+                        help='how many entries each tab has, relative to the bundled fixture')
+    parser.add_argument('--api-format', action='store_true',
+                        help='write a `values.batchGet` response instead of a list of tabs')
+    parser.add_argument('-o', '--output', type=Path,
+                        help='the file to write; defaults to standard output')
+    args = parser.parse_args(argv)
+
+    tabs = generate(args.seed, args.size)
+
+    output: object = tabs
+    if args.api_format:
+        output = {'valueRanges': [
+            {'range': f"{tab['range']}!A1:J{len(tab['values'])}", 'values': tab['values']} 
+            for tab in tabs
+        ]}
+
+    if args.output is None:
+        json.dump(output, sys.stdout, ensure_ascii=False)
+        return
+
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(output, f, ensure_ascii=False)
+
+if __name__ == '__main__':
+    main()
@@ -1 +1,2 @@
 from .tracker import *
+from .async_tracker import *
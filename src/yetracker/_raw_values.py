@@ -1,7 +1,20 @@
 from abc import ABC, abstractmethod
+from collections import deque
 from googleapiclient.discovery import build
-from typing import Any, TextIO, TypedDict
+from googleapiclient.errors import HttpError
+from contextlib import suppress
+from dataclasses import dataclass
+from typing import Any, Iterator, TextIO, TypedDict
+import hashlib
 import json
+import os
+import re
+import sys
+import tempfile
+import threading
+import time
+
+from yetracker.instrument import count, traced
 
 type Row = list[str]
 type Range = list[Row]
@@ -19,37 +32,284 @@ class RawValuesFetcher(ABC):
     def authenticate(self, *args) -> Any:
         pass
 
+    def prefetch(self, *tab_names: str):
+        """Fetch the values of several tabs at once, so that later calls to
+        `get_raw_values` for those tabs don't each need their own round trip.
+        Does nothing by default."""
+        pass
+
+    def discard_prefetched(self):
+        """Drop the values fetched by :meth:`prefetch` that weren't used yet, 
+        so that they aren't returned once they're out of date. 
+        Does nothing by default."""
+        pass
+
+    def get_version(self, tab_name: str) -> str | None:
+        """Get a value that changes whenever the tab's values change, 
+        such as the time the spreadsheet was last modified, 
+        without fetching the values themselves.  
+        Returns `None` by default, meaning the version isn't known."""
+        return None
+
+    def iter_raw_values(self, tab_name: str) -> Iterator[Row]:
+        """Get the rows of a tab one at a time. By default, 
+        the rows come from `get_raw_values`, but a fetcher can override this 
+        to avoid holding every row in memory at once."""
+        return iter(self.get_raw_values(tab_name))
+
 class RawTabDict(TypedDict):
     values: Range
     range: str
 
 type ProvidedJson = list[RawTabDict] | dict[str, list[RawTabDict]]
 
+def _get_range_size(values: Range) -> int:
+    """Estimate the memory used by a range, in bytes."""
+    size = sys.getsizeof(values)
+    for row in values:
+        size += sys.getsizeof(row)
+        for cell in row:
+            size += sys.getsizeof(cell)
+
+    return size
+
+@dataclass(slots=True)
+class _StoredRange:
+    values: Range
+    #: The estimated memory used by the values, once it's been asked for.
+    size: int | None = None
+
+    def get_size(self) -> int:
+        if self.size is None:
+            self.size = _get_range_size(self.values)
+
+        return self.size
+
+class RawValuesStore:
+    """Keeps the values fetched for each tab. 
+    Fetching a tab again replaces its values, so memory use stays the same 
+    no matter how often tabs are fetched.
+
+    Attributes:
+        history (int): How many older versions of each tab are kept 
+            along with the latest one. Applies from the next time a tab is added.
+    """
+    def __init__(self, history: int = 0):
+        self.history = history
+        self._versions: dict[str, deque[_StoredRange]] = {}
+        self._lock = threading.Lock()
+
+    def add(self, tab_name: str, values: Range):
+        """Store the latest values of a tab, dropping versions beyond :attr:`history`."""
+        # Tabs may be fetched in a background thread.
+        with self._lock:
+            versions = self._versions.setdefault(tab_name, deque())
+            versions.append(_StoredRange(values))
+
+            while len(versions) > self.history + 1:
+                versions.popleft()
+
+    def get(self, tab_name: str) -> Range | None:
+        """Get the latest values of a tab, or `None` if it wasn't added."""
+        versions = self._versions.get(tab_name)
+        return versions[-1].values if versions else None
+
+    def get_versions(self, tab_name: str) -> list[Range]:
+        """Get the kept versions of a tab, from oldest to latest."""
+        return [version.values for version in self._versions.get(tab_name, ())]
+
+    def remove(self, tab_name: str):
+        """Drop every version of a tab."""
+        with self._lock:
+            self._versions.pop(tab_name, None)
+
+    def clear(self):
+        with self._lock:
+            self._versions.clear()
+
+    @property
+    def nbytes(self) -> int:
+        """The estimated memory used by every kept version, in bytes. 
+        See :meth:`memory_by_tab`."""
+        return sum(self.memory_by_tab().values())
+
+    def memory_by_tab(self) -> dict[str, int]:
+        """Get the estimated memory used by each tab's kept versions, in bytes.  
+        The size of a version is estimated the first time it's asked for, 
+        by going over every cell, rather than each time a tab is fetched."""
+        with self._lock:
+            return {
+                tab_name: sum(version.get_size() for version in versions) 
+                for tab_name, versions in self._versions.items()
+            }
+
+    def __contains__(self, tab_name: str) -> bool:
+        return tab_name in self._versions
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._versions)
+
+    def __len__(self) -> int:
+        return len(self._versions)
+
+    def to_list(self) -> list[RawTabDict]:
+        """Get the latest values of each tab, in the format read by `RawValuesFromJson`."""
+        with self._lock:
+            return [
+                {'range': tab_name, 'values': versions[-1].values} 
+                for tab_name, versions in self._versions.items()
+            ]
+
+# Matches a run of arrays without nested arrays or objects, such as the rows 
+# of a value range, so that the rows are skipped in one step. Otherwise, 
+# matches a string or one of the characters that give JSON its structure. 
+# Numbers and literals are skipped over, since they can't contain any of these.
+_JSON_STRING = rb'"[^"\\]*+(?:\\.[^"\\]*+)*+"'
+_JSON_TOKEN = re.compile(rb'''
+    (?:\[[^"\[\]{}]*+(?:%(string)s[^"\[\]{}]*+)*+\]\s*+(?:,\s*+)?)++
+    |%(string)s
+    |[\[\]{}:,]
+''' % {b'string': _JSON_STRING}, re.DOTALL | re.VERBOSE)
+
+_QUOTED_SHEET_NAME = re.compile(r"'((?:[^']|'')*)'")
+
+def _get_sheet_name(range_name: str) -> str:
+    """Get the name of the sheet from an A1 range such as `'Tab name'!A1:Z100`."""
+    quoted = _QUOTED_SHEET_NAME.match(range_name)
+    if quoted is not None:
+        return quoted.group(1).replace("''", "'")
+
+    return range_name.partition('!')[0]
+
+def _quote_sheet_name(sheet_name: str) -> str:
+    """Quote a sheet name for use in an A1 range, the reverse of `_get_sheet_name`."""
+    return "'" + sheet_name.replace("'", "''") + "'"
+
+_JSON_ROW = re.compile(rb'\[[^"\[\]{}]*+(?:%s[^"\[\]{}]*+)*+\]' % _JSON_STRING, re.DOTALL)
+
+@dataclass(slots=True)
+class _ValueRangeSpan:
+    """Where a value range is within the JSON it was found in."""
+    range_name: str = ''
+    start: int = 0
+    end: int = 0
+    #: Where the rows of the range's values are, without the brackets around them.
+    rows_start: int = 0
+    rows_end: int = 0
+
+def _index_value_ranges(data: bytes) -> list[_ValueRangeSpan]:
+    """Find each value range in JSON of the format of `ProvidedJson`, 
+    without decoding the values."""
+    found: list[_ValueRangeSpan] = []
+
+    depth = 0
+    # The depth inside the list of value ranges, once it's found.
+    list_depth: int | None = None
+    key: bytes | None = None
+    previous = b''
+
+    span = _ValueRangeSpan()
+    in_values = False
+
+    for match in _JSON_TOKEN.finditer(data):
+        token = match.group()
+        char = token[:1]
+
+        if len(token) > 1 and char == b'[':
+            if in_values and depth == list_depth + 2: # type: ignore[operator]
+                span.rows_start = span.rows_start or match.start()
+                span.rows_end = match.end()
+
+            key = None
+        elif char == b'[' or char == b'{':
+            if list_depth is None:
+                if char == b'[' and (depth == 0 or depth == 1 and key == b'"valueRanges"'):
+                    list_depth = depth + 1
+            elif depth == list_depth and char == b'{':
+                span = _ValueRangeSpan(start=match.start())
+            elif depth == list_depth + 1 and key == b'"values"':
+                in_values = True
+
+            depth += 1
+            key = None
+        elif char == b']' or char == b'}':
+            depth -= 1
+            key = None
+
+            if list_depth is None:
+                continue
+            elif depth < list_depth:
+                break
+            elif depth == list_depth and char == b'}':
+                span.end = match.end()
+                found.append(span)
+            elif depth == list_depth + 1:
+                in_values = False
+        elif char == b':':
+            key = previous
+        elif char == b',':
+            key = None
+        elif key == b'"range"' and list_depth is not None and depth == list_depth + 1:
+            span.range_name = json.loads(token)
+
+        previous = token
+
+    return found
+
 class RawValuesFromJson(RawValuesFetcher):
+    """Gets values from JSON in the format of an API response, 
+    or of a list of value ranges.  
+
+    The JSON is only scanned for where each value range starts and ends; 
+    a tab's values are decoded each time they're requested."""
     def __init__(self, json_arg: str | TextIO):
         self.authenticated = True
         self._parse_json_data(json_arg)
     
     def _parse_json_data(self, json_arg: str | TextIO):
         if isinstance(json_arg, str):
-            provided_json: ProvidedJson = json.loads(json_arg)
-        else:
-            provided_json: ProvidedJson = json.load(json_arg)
-        
-        if isinstance(provided_json, list):
-            self.json_data = provided_json
+            self._data = json_arg.encode()
         else:
-            inner = provided_json.get('valueRanges')
-            if isinstance(inner, list):
-                self.json_data = inner
-        
-    
+            self._data = json_arg.read().encode()
+
+        self._json_data: list[RawTabDict] | None = None
+
+        # Tabs can be looked up either by sheet name or by their full range.
+        self._spans: dict[str, _ValueRangeSpan] = {}
+        for span in _index_value_ranges(self._data):
+            self._spans.setdefault(span.range_name, span)
+            self._spans.setdefault(_get_sheet_name(span.range_name), span)
+
+    @property
+    def json_data(self) -> list[RawTabDict]:
+        """Every value range in the JSON, decoded. 
+        They're decoded the first time this is used, and kept afterwards."""
+        if self._json_data is None:
+            self._json_data = [
+                json.loads(self._data[span.start:span.end]) 
+                for span in _index_value_ranges(self._data)
+            ]
+
+        return self._json_data
+
+    def _get_span(self, tab_name: str) -> _ValueRangeSpan:
+        span = self._spans.get(tab_name)
+        if span is None:
+            raise KeyError(tab_name)
+
+        return span
+
     def get_raw_values(self, tab_name: str) -> Range:
-        for tab in self.json_data:
-            if tab_name in tab['range']:
-                return tab['values']
-        
-        raise KeyError()
+        span = self._get_span(tab_name)
+        with traced('decode', tab_name):
+            tab: RawTabDict = json.loads(self._data[span.start:span.end])
+        return tab.get('values', [])
+
+    def iter_raw_values(self, tab_name: str) -> Iterator[Row]:
+        """Decode the rows of a tab one at a time."""
+        span = self._get_span(tab_name)
+        for match in _JSON_ROW.finditer(self._data, span.rows_start, span.rows_end):
+            yield json.loads(match.group())
 
     def authenticate(self, *args) -> Any:
         pass
@@ -58,9 +318,33 @@ class AuthenticationError(Exception):
     pass
 
 class RawValuesFromAPI(RawValuesFetcher):
-    def __init__(self, spreadsheet_id: str):
+    def __init__(self, 
+                 spreadsheet_id: str, 
+                 http: Any = None, 
+                 detect_changes: bool = False,
+                 probe_range: str = 'A1:Z20'):
+        """
+        Args:
+            spreadsheet_id: The ID of the Google Sheets spreadsheet.
+            http: The HTTP transport requests are sent through, 
+                such as an `httplib2.Http` object.
+                Defaults to the one created by `googleapiclient`.
+            detect_changes: Whether to check if a tab changed, with :meth:`has_changed`, 
+                before downloading its values again. 
+                Unchanged tabs return the values downloaded last time.
+            probe_range: The cells whose values are part of a tab's signature, 
+                when the Google Drive API can't be used. See :meth:`has_changed`.
+        """
         super().__init__()
         self.spreadsheet_id = spreadsheet_id
+        self.http = http
+        self.detect_changes = detect_changes
+        self.probe_range = probe_range
+        self._prefetched: dict[str, Range] = {}
+
+        self._drive_available = True
+        # The signature of each tab when its values were last downloaded, and those values.
+        self._downloaded: dict[str, tuple[str, Range]] = {}
     
     def authenticate(self, api_key: str | None = None, *args):
         if api_key is None:
@@ -70,14 +354,327 @@ class RawValuesFromAPI(RawValuesFetcher):
         self.authenticated = True
 
     def _create_service(self, api_key: str):
-        service = build('sheets', 'v4', developerKey=api_key)
+        service = build('sheets', 'v4', developerKey=api_key, http=self.http)
         self.spreadsheets = service.spreadsheets()
         self.values = self.spreadsheets.values()
+
+        # The Drive API is only used for versions, so its client is built when first needed.
+        self._api_key = api_key
+        self.files: Any = None
+
+    def get_version(self, tab_name: str) -> str | None:
+        """Get the time the spreadsheet was last modified, from the Google Drive API.  
+        Every tab has the same version, since Drive only tracks whole spreadsheets. 
+        Returns `None` if the Drive API can't be used with the API key, 
+        or if the request failed, such as from being rate limited."""
+        if not self._drive_available:
+            return None
+
+        if self.files is None:
+            self.files = build('drive', 'v3', developerKey=self._api_key, http=self.http).files()
+
+        try:
+            response = self.files.get(
+                fileId=self.spreadsheet_id,
+                fields='modifiedTime'
+            ).execute()
+        except HttpError as e:
+            # Only errors that won't go away mean that the Drive API can't be used.
+            if e.resp.status in (403, 404):
+                self._drive_available = False
+            return None
+
+        return response.get('modifiedTime')
+
+    def _get_signature(self, tab_name: str, version: str | None = None) -> str:
+        """Get a value that changes whenever the tab's values change, 
+        at the cost of one small request, or none if `version` is given."""
+        if version is None:
+            version = self.get_version(tab_name)
+        if version is not None:
+            return version
+
+        response = self.spreadsheets.get(
+            spreadsheetId=self.spreadsheet_id,
+            ranges=[f'{_quote_sheet_name(tab_name)}!{self.probe_range}'],
+            includeGridData=True,
+            fields='sheets(properties(gridProperties),data(rowData(values(formattedValue))))'
+        ).execute()
+
+        return hashlib.sha256(json.dumps(response, sort_keys=True).encode()).hexdigest()
+
+    def has_changed(self, tab_name: str) -> bool:
+        """Check whether a tab changed since its values were last downloaded, 
+        without downloading them. Tabs that weren't downloaded yet count as changed.  
+
+        The spreadsheet's modification time, from the Google Drive API, is used if possible, 
+        in which case a change to any tab counts as a change to every tab. 
+        Otherwise, the tab's row and column counts and the values of :attr:`probe_range` 
+        are compared, which misses edits that keep the size of the tab 
+        and are outside of that range.
+
+        Raises:
+            RuntimeError: If :attr:`detect_changes` isn't set, since tabs 
+                are then downloaded without recording a signature.
+        """
+        if not self.detect_changes:
+            raise RuntimeError('has_changed() needs a fetcher created with detect_changes=True.')
+
+        downloaded = self._downloaded.get(tab_name)
+        return downloaded is None or downloaded[0] != self._get_signature(tab_name)
+
+    def _get_unchanged(self, tab_name: str, 
+                       version: str | None = None) -> tuple[Range | None, str | None]:
+        """Get the values downloaded last time if the tab hasn't changed since, 
+        along with the tab's current signature, if changes are detected."""
+        if not self.detect_changes:
+            return None, None
+
+        signature = self._get_signature(tab_name, version)
+        downloaded = self._downloaded.get(tab_name)
+        if downloaded is not None and downloaded[0] == signature:
+            return downloaded[1], signature
+
+        return None, signature
+
+    def _set_downloaded(self, tab_name: str, signature: str | None, values: Range):
+        if signature is not None:
+            self._downloaded[tab_name] = (signature, values)
     
+    def prefetch(self, *tab_names: str):
+        """Fetch the values of every given tab with a single
+        `values.batchGet` request. If :attr:`detect_changes` is set, 
+        tabs that haven't changed are left out of the request."""
+        # Drive versions cover the whole spreadsheet, so one request is enough for every tab.
+        version = None
+        if self.detect_changes and len(tab_names) > 0:
+            version = self.get_version(tab_names[0])
+
+        # Values left over from an earlier prefetch may be out of date, so they're replaced.
+        signatures: dict[str, str | None] = {}
+        changed: list[str] = []
+        for tab_name in tab_names:
+            values, signatures[tab_name] = self._get_unchanged(tab_name, version)
+            if values is not None:
+                self._prefetched[tab_name] = values
+            else:
+                self._prefetched.pop(tab_name, None)
+                changed.append(tab_name)
+
+        if len(changed) == 0:
+            return
+
+        response = self.values.batchGet(
+            spreadsheetId=self.spreadsheet_id,
+            ranges=changed
+        ).execute()
+
+        # Value ranges are returned in the same order they were requested.
+        value_ranges: list[RawTabDict] = response.get('valueRanges', [])
+        for tab_name, value_range in zip(changed, value_ranges):
+            values = value_range.get('values', [])
+            self._prefetched[tab_name] = values
+            self._set_downloaded(tab_name, signatures[tab_name], values)
+
+    def discard_prefetched(self):
+        self._prefetched.clear()
+
     def get_raw_values(self, tab_name: str) -> Range:
+        prefetched = self._prefetched.pop(tab_name, None)
+        if prefetched is not None:
+            return prefetched
+
+        # The signature is taken before downloading, so that a change made 
+        # during the download is picked up the next time.
+        values, signature = self._get_unchanged(tab_name)
+        if values is not None:
+            return values
+
         response: RawTabDict = self.values.get(
             spreadsheetId=self.spreadsheet_id,
             range=tab_name
         ).execute()
 
-        return response['values']
+        values = response['values']
+        self._set_downloaded(tab_name, signature, values)
+
+        return values
+
+
+# Only files named like these are ever removed from the cache directory, 
+# so that it can be shared with other files.
+_CACHE_SUFFIX = '.yetracker.jsonl'
+_CACHE_FILE = re.compile(r'[0-9a-f]{64}' + re.escape(_CACHE_SUFFIX))
+_TEMP_PREFIX = 'yetracker-'
+_TEMP_FILE = re.compile(re.escape(_TEMP_PREFIX) + r'\w+\.tmp')
+#: How old a temporary file must be before it's assumed that its writer was interrupted.
+_STALE_TEMP_SECONDS = 3600
+
+class _CachedTabHeader(TypedDict):
+    """The first line of a cached tab's file. The tab's values are on the second line, 
+    so that stale files can be skipped without decoding them."""
+    range: str
+    fetched_at: float
+
+class CachedRawValues(RawValuesFetcher):
+    """Wraps another fetcher, keeping each tab's values in a directory on disk.  
+    Values younger than the TTL are read from disk instead of the wrapped fetcher, 
+    so several processes sharing the directory also share the cache.
+    """
+    def __init__(self, 
+                 fetcher: RawValuesFetcher, 
+                 cache_dir: str, 
+                 ttl: float = 3600, 
+                 max_bytes: int = 256 * 2**20,
+                 namespace: str | None = None):
+        """
+        Args:
+            fetcher: The fetcher to get values from when they aren't cached.
+            cache_dir: The directory the cached values are stored in.
+            ttl: How long, in seconds, cached values stay fresh.
+            max_bytes: The total size of the cached tabs is kept under this.
+                The least recently used tabs are evicted first, 
+                but the tab that was just written is always kept.
+                Other files in the directory are neither counted nor evicted.
+            namespace: Distinguishes the cached tabs of different spreadsheets.
+                Defaults to the wrapped fetcher's spreadsheet ID, if it has one.
+        """
+        self.fetcher = fetcher
+        self.cache_dir = cache_dir
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+
+        if namespace is None:
+            namespace = getattr(fetcher, 'spreadsheet_id', '')
+        self.namespace = namespace
+
+        self._prefetched: dict[str, Range] = {}
+
+        os.makedirs(cache_dir, exist_ok=True)
+
+    @property
+    def authenticated(self) -> bool:
+        return self.fetcher.authenticated
+
+    def authenticate(self, *args) -> Any:
+        return self.fetcher.authenticate(*args)
+
+    def get_version(self, tab_name: str) -> str | None:
+        return self.fetcher.get_version(tab_name)
+
+    def prefetch(self, *tab_names: str):
+        missing: list[str] = []
+        for tab_name in tab_names:
+            values = self._read(tab_name)
+            if values is None:
+                missing.append(tab_name)
+            else:
+                self._prefetched[tab_name] = values
+
+        self.fetcher.prefetch(*missing)
+
+    def discard_prefetched(self):
+        self._prefetched.clear()
+        self.fetcher.discard_prefetched()
+
+    def get_raw_values(self, tab_name: str) -> Range:
+        values = self._prefetched.pop(tab_name, None)
+        if values is None:
+            values = self._read(tab_name)
+
+        if values is None:
+            count('raw_cache.miss', tab=tab_name)
+            values = self.fetcher.get_raw_values(tab_name)
+            self._write(tab_name, values)
+        else:
+            count('raw_cache.hit', tab=tab_name)
+
+        return values
+
+    def _path(self, tab_name: str) -> str:
+        key = hashlib.sha256(f'{self.namespace}\0{tab_name}'.encode()).hexdigest()
+        return os.path.join(self.cache_dir, f'{key}{_CACHE_SUFFIX}')
+
+    def _read(self, tab_name: str) -> Range | None:
+        path = self._path(tab_name)
+
+        # Files of the wrong shape, such as ones written by another version, count as misses.
+        try:
+            with open(path, 'r') as f:
+                header: _CachedTabHeader = json.loads(f.readline())
+                if time.time() - header['fetched_at'] > self.ttl:
+                    return None
+
+                with traced('decode', tab_name):
+                    values: Range = json.loads(f.read())
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+        if not isinstance(values, list):
+            return None
+
+        # The modification time doubles as the last time the tab was used.
+        with suppress(OSError):
+            os.utime(path)
+
+        return values
+
+    def _write(self, tab_name: str, values: Range):
+        header: _CachedTabHeader = {
+            'range': tab_name,
+            'fetched_at': time.time()
+        }
+
+        path = self._path(tab_name)
+
+        # Write to a temporary file first, so that readers never see a partial file.
+        fd, temp_path = tempfile.mkstemp(dir=self.cache_dir, prefix=_TEMP_PREFIX, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(header, f)
+                f.write('\n')
+                json.dump(values, f)
+            os.replace(temp_path, path)
+        except BaseException:
+            with suppress(OSError):
+                os.remove(temp_path)
+            raise
+
+        self._evict(keep=path)
+
+    def _evict(self, keep: str):
+        """Remove the least recently used cached tabs until the directory is 
+        under :attr:`max_bytes`, along with temporary files left by writers 
+        that were interrupted. Files that the cache didn't write are left alone, 
+        and so is `keep`, the file that was just written."""
+        now = time.time()
+        total_size = 0
+        cached_files: list[tuple[float, int, str]] = []
+        for dir_entry in os.scandir(self.cache_dir):
+            is_cached = _CACHE_FILE.fullmatch(dir_entry.name) is not None
+            is_temp = _TEMP_FILE.fullmatch(dir_entry.name) is not None
+            if not (is_cached or is_temp):
+                continue
+
+            try:
+                stat = dir_entry.stat()
+            except OSError:
+                continue
+
+            if is_temp:
+                if now - stat.st_mtime > _STALE_TEMP_SECONDS:
+                    with suppress(OSError):
+                        os.remove(dir_entry.path)
+                continue
+
+            total_size += stat.st_size
+            if dir_entry.path != keep:
+                cached_files.append((stat.st_mtime, stat.st_size, dir_entry.path))
+
+        for _, size, path in sorted(cached_files):
+            if total_size <= self.max_bytes:
+                break
+
+            with suppress(OSError):
+                os.remove(path)
+            total_size -= size
@@ -0,0 +1,154 @@
+import asyncio
+from concurrent.futures import Executor, ProcessPoolExecutor
+from contextvars import copy_context
+from functools import partial
+from typing import AsyncIterator, Awaitable, Callable, Iterable
+
+from yetracker.tracker import *
+from yetracker.tracker import Tracker, YeTracker
+from yetracker.tab import ChangeSet, Tab
+from yetracker.instrument import traced
+from yetracker.watch import ChangeEvent
+from yetracker.watch import _WatchSchedule, _add_pending, get_events
+
+__all__ = [
+    'AsyncTracker',
+    'AsyncYeTracker'
+]
+
+class AsyncTracker(Tracker):
+    """Base class for a tracker whose getters are coroutines.  
+
+    Fetching runs in a worker thread, and parsing runs in an executor, 
+    so neither blocks the event loop. 
+    Fetches are made one at a time, as the Google Sheets API client 
+    is not thread-safe, but any number of tabs can be parsed at once.
+    """
+
+    def __init__(self, *, executor: Executor | None = None, **kwargs):
+        """
+        Arguments:
+            executor: The executor tabs are parsed in. 
+                Defaults to the event loop's default executor.
+                A `ProcessPoolExecutor` parses tabs in parallel.
+            **kwargs: Passed on to :class:`Tracker`.
+        """
+        self.executor = executor
+        self._fetch_lock = asyncio.Lock()
+
+        super().__init__(**kwargs)
+
+    async def _get_general[T: Tab](self, sheet_name: str, tab_cls: type[T],  # type: ignore[override]
+                                   fields: Iterable[str] | None = None) -> T:
+        # Expired tabs are always revalidated in the background, so as not to block the event loop.
+        tab = self._get_cached(sheet_name, tab_cls, background=True)
+        if tab is not None:
+            return tab
+
+        with traced('get', sheet_name):
+            async with self._fetch_lock:
+                version = await asyncio.to_thread(self._get_tab_version, sheet_name)
+                raw_values = await asyncio.to_thread(self._fetch_raw_values, sheet_name)
+
+            loop = asyncio.get_running_loop()
+            build_tab = partial(tab_cls, raw_values, workers=self.workers, fields=fields)
+
+            # So that parsing is traced, like with `asyncio.to_thread`. 
+            # Contexts can't be sent to other processes.
+            if not isinstance(self.executor, ProcessPoolExecutor):
+                build_tab = partial(copy_context().run, build_tab)
+
+            tab = await loop.run_in_executor(self.executor, build_tab)
+            self._store_built(sheet_name, raw_values, tab, version)
+
+        return tab
+
+    async def refresh(self, tab_name: str) -> ChangeSet: # type: ignore[override]
+        """Asynchronous version of :meth:`Tracker.refresh`. 
+        Only the changed rows are parsed, in a worker thread."""
+        if tab_name not in self._built_tabs:
+            tab = await self.get_tab(tab_name)
+            return ChangeSet(tab, added=list(tab))
+
+        async with self._fetch_lock:
+            return await asyncio.to_thread(self._refresh_built, tab_name)
+
+    async def watch(self,  # type: ignore[override]
+                    tab_names: list[str] | None = None,
+                    interval: float = 60,
+                    max_interval: float | None = None,
+                    settle: float = 5,
+                    max_settle_polls: int = 12,
+                    sleep: Callable[[float], Awaitable[object]] = asyncio.sleep
+                    ) -> AsyncIterator[ChangeEvent]:
+        """Asynchronous version of :meth:`Tracker.watch`, polling with :meth:`refresh`
+        and waiting between polls without blocking the event loop.  
+        Use it with ``async for event in tracker.watch():``.
+
+        Arguments:
+            tab_names: The tabs to watch. Defaults to every tab in :attr:`tab_classes`.
+            interval: The shortest time, in seconds, between polls.
+            max_interval: The longest time between polls. Defaults to 16 times `interval`.
+            settle: The time between polls while the tabs are changing.
+            max_settle_polls: The most polls made while waiting for changes to stop.
+            sleep: The coroutine function used to wait between polls.
+        """
+        if tab_names is None:
+            tab_names = list(self.tab_classes)
+
+        schedule = _WatchSchedule(interval, max_interval, settle, max_settle_polls)
+        tabs = {tab_name: (await self.refresh(tab_name)).tab for tab_name in tab_names}
+        pending: dict[str, ChangeSet] = {}
+
+        while True:
+            await sleep(schedule.wait)
+
+            changed = _add_pending(pending, {tab_name: await self.refresh(tab_name) for tab_name in tab_names})
+            if not schedule.record(changed):
+                continue
+
+            for tab_name, changes in pending.items():
+                for event in get_events(tab_name, tabs[tab_name], changes):
+                    yield event
+                tabs[tab_name] = changes.tab
+            pending = {}
+
+    async def load_tabs(self, tab_names: list[str] | None = None) -> dict[str, Tab]: # type: ignore[override]
+        """Fetch several tabs at once, then parse all of them concurrently.  
+        With the Google Sheets API, all of the tabs are fetched in one request.
+
+        Arguments:
+            tab_names: The names of the tabs to load. 
+                Defaults to every tab in :attr:`tab_classes`.
+
+        Returns:
+            The parsed tabs, mapped to their names.
+        """
+        if not self.raw_values_fetcher.authenticated:
+            raise NotAuthenticatedError()
+
+        if tab_names is None:
+            tab_names = list(self.tab_classes)
+
+        # Tabs returned from the tab cache would leave their prefetched values unused.
+        to_fetch = [tab_name for tab_name in tab_names if self._needs_fetch(tab_name, background=True)]
+        async with self._fetch_lock:
+            await asyncio.to_thread(self._prefetch, *to_fetch)
+
+        try:
+            tabs = await asyncio.gather(
+                *(self.get_tab(tab_name) for tab_name in tab_names)
+            )
+        finally:
+            await asyncio.to_thread(self._discard_prefetched)
+
+        return dict(zip(tab_names, tabs))
+
+    async def load_all(self) -> dict[str, Tab]:
+        """Load every tab of the tracker. See :meth:`load_tabs`."""
+        return await self.load_tabs()
+
+class AsyncYeTracker(AsyncTracker, YeTracker):
+    """Asynchronous version of :class:`YeTracker`.  
+    Every getter has to be awaited, e.g. ``await tracker.get_unreleased()``.
+    """
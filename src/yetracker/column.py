@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from contextlib import suppress
 from typing import TypedDict, override, Self, overload, Protocol, Literal
 import pprint
 import datetime
@@ -7,6 +8,7 @@ import re
 from enum import Enum, StrEnum
 
 from yetracker.common import Row, Range, add_repr
+from yetracker.diagnostics import report_error, report_unknown_value
 
 __all__ = [
     "AvailableLengthEnum",
@@ -17,7 +19,9 @@ __all__ = [
     "Version",
     "ContribTag",
     "Contributors",
-    "StemTypeEnum"
+    "StemTypeEnum",
+    "ParseCache",
+    "parse_cache"
 ]
 
 class Column(ABC):
@@ -28,19 +32,96 @@ class Column(ABC):
         """"""
         try:
             self.base_str = row[column_num]
-        except:
+        except IndexError:
+            # Rows end at their last non-empty cell.
+            self.base_str = ""
+        except Exception:
             self.base_str = ""
+            report_error(type(self).__name__, repr(row)[:200])
     
     @abstractmethod
     def __call__(self) -> object:
         pass
 
+class ParseCache:
+    """A bounded cache of parsed cell values, keyed by column type and cell string.  
+    Cells that repeat across rows, such as qualities or dates, are only parsed once,
+    and every such cell shares the same parsed object.
+
+    Only columns whose values are immutable are cached.
+
+    Attributes:
+        maxsize (int): The maximum number of values kept. 
+            The least recently used values are dropped first.
+        enabled (bool): Whether the cache is used.
+        hits (int): The number of values found in the cache.
+        misses (int): The number of values that had to be parsed.
+    """
+    def __init__(self, maxsize: int = 4096):
+        self.maxsize = maxsize
+        self.enabled = True
+        self.hits = 0
+        self.misses = 0
+
+        self._values: dict[tuple[type[Column], str], object] = {}
+
+    def get(self, column: 'CachedColumn') -> object:
+        """Get the parsed value of a column's cell, parsing it if needed."""
+        key = (type(column), column.base_str)
+
+        # Dicts keep insertion order, so re-inserting a value marks it as most recently used.
+        try:
+            value = self._values.pop(key)
+            self.hits += 1
+        except KeyError:
+            value = column._parse()
+            self.misses += 1
+
+            if len(self._values) >= self.maxsize:
+                with suppress(KeyError, RuntimeError, StopIteration):
+                    del self._values[next(iter(self._values))]
+
+        self._values[key] = value
+        return value
+
+    def clear(self):
+        """Remove every cached value, and reset the counters."""
+        self._values.clear()
+        self.hits = 0
+        self.misses = 0
+
+#: The cache used by every :class:`CachedColumn`.
+parse_cache = ParseCache()
+
+class CachedColumn(Column, ABC):
+    """Base class for a Column whose parsed value is immutable, 
+    and can be shared through :data:`parse_cache`."""
+
+    def __call__(self) -> object:
+        if parse_cache.enabled:
+            value = parse_cache.get(self)
+        else:
+            value = self._parse()
+
+        if value is None and self.base_str:
+            self._report_failure()
+
+        return value
+
+    def _report_failure(self):
+        """Record that the cell couldn't be parsed, in the active :class:`Diagnostics`."""
+        report_error(type(self).__name__, self.base_str)
+
+    @abstractmethod
+    def _parse(self) -> object:
+        pass
+
 class SimpleColumn(Column):
     def __call__(self) -> str:
         return self.base_str
 
-class TrackLength(Column):
-    def __call__(self):
+class TrackLength(CachedColumn):
+    def _parse(self) -> datetime.timedelta | None:
         regex_match = re.search(r'(\d{1,2}):(\d{2})', self.base_str)
 
         if regex_match is None:
@@ -52,10 +133,10 @@ class TrackLength(Column):
         
         return datetime.timedelta(seconds=duration)
     
-class Date(Column):
+class Date(CachedColumn):
     def parse_date_str(self, date_str: str) -> datetime.datetime | str | None:
         months = ['Jan', 'Feb', 'Mar', 'Apr',
-                  'May', 'Jun', 'Jul', 'Aug'
+                  'May', 'Jun', 'Jul', 'Aug',
                   'Sep', 'Oct', 'Nov', 'Dec']
         
         regex_match = re.search(r'(\w{3}) (\d{2}), (\d{4})', date_str)
@@ -64,7 +145,7 @@ class Date(Column):
             return None
         
         try:
-            month = months.index(regex_match.group(1))
+            month = months.index(regex_match.group(1)) + 1
             day = int(regex_match.group(2))
             year = int(regex_match.group(3))
 
@@ -72,16 +153,31 @@ class Date(Column):
         except:
             return date_str
         
-    def __call__(self):
+    def _parse(self):
         return self.parse_date_str(self.base_str)
 
-class Category[T: Enum](Column, ABC):
+    def __call__(self) -> datetime.datetime | str | None:
+        value = super().__call__()
+
+        # Dates that match the pattern but aren't valid are kept as strings.
+        if value.__class__ is str:
+            self._report_failure()
+
+        return value # type: ignore
+
+class Category[T: Enum](CachedColumn, ABC):
     @property
     @abstractmethod
     def category_cls(self) -> type[T]:
         pass
 
     def __call__(self) -> T | None:
+        return super().__call__() # type: ignore
+
+    def _report_failure(self):
+        report_unknown_value(self.category_cls.__name__, self.base_str)
+
+    def _parse(self) -> T | None:
         try:
             return self.category_cls(self.base_str)
         except ValueError:
@@ -145,7 +241,7 @@ class ReleasedType(Category):
     def __call__(self) -> ReleasedTypeEnum | None:
         return super().__call__()
 
-@dataclass
+@dataclass(slots=True)
 class SampleUsed:
     """Represents a used sample."""
     name: str | None #: The sample's name.
@@ -225,6 +321,11 @@ class Version:
         version_count_unknown (bool): Whether the entry has an 
             unknown amount of versions or not.
     """
+    __slots__ = (
+        'version_start', 'version_end', 'multiple_versions', 
+        'version', 'version_count_unknown'
+    )
+
     def __init__(self, version_start: int, version_end: int | Literal['?'] | None = None):
         self.version_start = version_start
         self.version_end = version_end
@@ -241,12 +342,16 @@ class Version:
 
     @classmethod
     def _extract_version(cls, name_str: str) -> tuple[Self | None, str]:
-        pattern = r'\[V(\d+)(-V(\d+|\?))*\]'
-
-        regex_match = re.search(pattern, name_str)
+        regex_match = _VERSION_PATTERN.search(name_str)
         if regex_match is None:
             return None, name_str
 
+        name_str = _VERSION_PATTERN.sub('', name_str)
+
+        return cls._from_match(regex_match), name_str
+
+    @classmethod
+    def _from_match(cls, regex_match: re.Match[str]) -> Self:
         version_start = int(regex_match.group(1))
         version_end = str(regex_match.group(3))
 
@@ -256,10 +361,10 @@ class Version:
             version_end = None
         else:
             version_end = int(version_end)
-        
-        name_str = re.sub(pattern, '', name_str)
 
-        return cls(version_start, version_end), name_str
+        return cls(version_start, version_end)
+
+_VERSION_PATTERN = re.compile(r'\[V(\d+)(-V(\d+|\?))*\]')
 
 class ContribTag(Enum):
     FEAT = "feat."
@@ -268,6 +373,9 @@ class ContribTag(Enum):
     PROD = "prod."
     QUES = "???."
 
+_CONTRIB_TAGS = {tag.value: tag for tag in ContribTag}
+_CONTRIB_OPENERS = {f'({tag.value}' for tag in ContribTag}
+
 @add_repr
 class Contributors:
     r"""Represents the contributors a entry has.
@@ -281,15 +389,26 @@ class Contributors:
         ques (str | None): The artists who contributed to an entry,
             but whose exact roles are unknown.
     """
+    __slots__ = ('feat', 'ref', 'with_', 'prod', 'ques', '_after_parsing')
+
     def __init__(self, name_str: str):
+        line, name_str = self._get_contrib_line(name_str)
+        self._set_contribs(line, name_str)
+
+    @classmethod
+    def _from_line(cls, line: str | None, after_parsing: str) -> Self:
+        contribs = cls.__new__(cls)
+        contribs._set_contribs(line, after_parsing)
+        return contribs
+
+    def _set_contribs(self, line: str | None, after_parsing: str):
         self.feat: str | None = None
         self.ref: str | None = None
         self.with_: str | None = None
         self.prod: str | None = None
         self.ques: str | None = None
 
-        line, name_str = self._get_contrib_line(name_str)
-        self._after_parsing = name_str
+        self._after_parsing = after_parsing
         if line is None:
             return
         
@@ -299,31 +418,21 @@ class Contributors:
         return self._after_parsing
 
     def _parse_contrib(self, line: str):
-        words = line.split()
-
         contrib_word_dict: dict[ContribTag, list[str]] = {
             tag: [] for tag in ContribTag
         }
 
         mode: ContribTag | None = None
-
-        def add_to_dict(word: str):
-            if mode is None:
-                return
-
-            contrib_word_dict[mode].append(word)
         
-        for word in words:
+        for word in line.split():
             if word[0] == '(':
-                try:
-                    mode = ContribTag(word[1:])
-                except:
-                    mode = None
+                mode = _CONTRIB_TAGS.get(word[1:])
             elif word[-1] == ')':
-                add_to_dict(word[:-1])
+                if mode is not None:
+                    contrib_word_dict[mode].append(word[:-1])
                 mode = None
-            else:
-                add_to_dict(word)
+            elif mode is not None:
+                contrib_word_dict[mode].append(word)
         
         self.feat = ' '.join(contrib_word_dict[ContribTag.FEAT])
         self.ref = ' '.join(contrib_word_dict[ContribTag.REF])
@@ -349,13 +458,8 @@ class Contributors:
 
 class Name(Column):
     def __call__(self):
-        self.emojis, name_str = self.extract_emojis(self.base_str)
-        self.version, name_str = self.extract_version(name_str)
-        self.contribs, name_str = self.extract_contribs(name_str)
-        self.alt_names, name_str = self.extract_alt_names(name_str)
-        self.artist, name_str = self.extract_artist(name_str)
-
-        self.main_name = name_str
+        (self.emojis, self.version, self.contribs, 
+         self.alt_names, self.artist, self.main_name) = _parse_name(self.base_str)
 
         return self.base_str
     
@@ -396,6 +500,57 @@ class Name(Column):
         
         return None, name_str
 
+_EMOJI_VALUES = [(emoji, emoji.value) for emoji in Emoji]
+
+def _parse_name(name_str: str) -> tuple[list[Emoji], Version | None, Contributors, 
+                                        list[str], str | None, str]:
+    """Does the work of the `Name.extract_*` methods in one pass, 
+    splitting the cell into lines only once.
+
+    Returns:
+        The emojis, version, contributors, alternative names, 
+        artist and main name of the entry.
+    """
+    emojis: list[Emoji] = []
+    for emoji, value in _EMOJI_VALUES:
+        if name_str.startswith(value):
+            emojis.append(emoji)
+            name_str = name_str.replace(value, '')
+
+    version: Version | None = None
+    version_match = _VERSION_PATTERN.search(name_str)
+    if version_match is not None:
+        version = Version._from_match(version_match)
+        name_str = name_str[:version_match.start()] \
+            + _VERSION_PATTERN.sub('', name_str[version_match.end():])
+
+    # Each time `name_str` changes below, `lines` is kept equal to `name_str.splitlines()`.
+    lines = name_str.splitlines()
+
+    contrib_line: str | None = None
+    if len(lines) == 3:
+        contrib_line = lines[1]
+        name_str = f'{lines[0]}\n{lines[2]}'
+        lines = [lines[0], lines[2]] if lines[2] != '' else [lines[0]]
+    elif len(lines) == 2 and lines[1].split()[0] in _CONTRIB_OPENERS:
+        contrib_line = lines[1]
+        name_str = lines[0]
+        lines = [lines[0]] if lines[0] != '' else []
+
+    contribs = Contributors._from_line(contrib_line, name_str)
+
+    alt_names: list[str] = []
+    if len(lines) != 1:
+        alt_names = lines[1].strip('(').strip(')').split(', ')
+        name_str = lines[0]
+
+    artist: str | None = None
+    if ' - ' in name_str:
+        split = name_str.split(' - ')
+        artist, name_str = split[0], split[1]
+
+    return emojis, version, contribs, alt_names, artist, name_str
+
 class EraStats(Column):
     def __call__(self) -> dict[str, int]:
         stats: dict[str, int] = {}
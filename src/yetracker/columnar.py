@@ -0,0 +1,284 @@
+from array import array
+from collections import Counter
+from datetime import datetime, timedelta
+from enum import Enum
+from typing import TYPE_CHECKING, Any, Iterable, Literal, Self
+
+from yetracker.column import AvailableLengthEnum, QualityEnum, ReleasedTypeEnum
+
+if TYPE_CHECKING:
+    from yetracker.tab import Tab
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+__all__ = [
+    'ColumnarTab',
+    'MISSING',
+    'NAT'
+]
+
+#: The code of a missing category, or the value of a missing length.
+MISSING = -1
+#: The value of a missing date, or of a date that couldn't be parsed.
+NAT = -2**63
+
+type Kind = Literal['category', 'label', 'seconds', 'timestamp', 'flag']
+
+_CATEGORIES: dict[str, type[Enum]] = {
+    'available_length': AvailableLengthEnum,
+    'quality': QualityEnum,
+    'type': ReleasedTypeEnum
+}
+
+_FIELD_KINDS: dict[str, Kind] = {
+    'era_name': 'label',
+    'main_name': 'label',
+    'artist': 'label',
+    'era': 'label',
+    'subera': 'label',
+    'available_length': 'category',
+    'quality': 'category',
+    'type': 'category',
+    'length': 'seconds',
+    'file_date': 'timestamp',
+    'leak_date': 'timestamp',
+    'release_date': 'timestamp',
+    'streaming': 'flag'
+}
+
+_EPOCH = datetime(1970, 1, 1)
+
+def _to_array(values: list[int]) -> Any:
+    if np is not None:
+        return np.array(values, dtype=np.int64)
+
+    return array('q', values)
+
+def _encode_number(kind: Kind, value: object) -> int:
+    if kind == 'seconds':
+        return int(value.total_seconds()) if isinstance(value, timedelta) else MISSING
+    elif kind == 'timestamp':
+        return int((value - _EPOCH).total_seconds()) if isinstance(value, datetime) else NAT
+    else:
+        return int(bool(value))
+
+class ColumnarTab:
+    """A struct-of-arrays view of a tab, for aggregate queries 
+    that don't need to go through each entry.  
+
+    Each field is stored as an array of integers:
+
+    - categories (such as quality), strings, eras and suberas 
+      are stored as codes, which index into :meth:`labels`. 
+      Missing values have the code :data:`MISSING`.
+    - lengths are stored as seconds, or :data:`MISSING`.
+    - dates are stored as seconds since the epoch, or :data:`NAT`
+      if the date is missing or not exact.
+    - booleans are stored as 0 or 1.
+
+    The arrays are NumPy arrays if NumPy is installed, 
+    in which case queries are vectorized. 
+    Otherwise, they are `array.array` objects.
+
+    Attributes:
+        fields (list[str]): The names of the stored fields.
+        eras (list[Era]): The eras of the tab.
+    """
+    def __init__(self, tab: 'Tab'):
+        """
+        Args:
+            tab: The tab to take the values of.
+        """
+        self.eras = list(tab.eras)
+        self.fields: list[str] = []
+        self._labels: dict[str, list] = {}
+        self._columns: dict[str, Any] = {}
+
+        entry_attrs: list[str] = []
+        for cls in reversed(tab._entry_cls.__mro__):
+            entry_attrs.extend(cls.__dict__.get('__slots__', ()))
+
+        for field in entry_attrs:
+            if field not in _FIELD_KINDS or field in self._columns:
+                continue
+
+            values = [getattr(entry, field) for entry in tab]
+            self.fields.append(field)
+            self._columns[field] = _to_array(self._encode_all(field, values))
+
+    def _encode_all(self, field: str, values: list) -> list[int]:
+        kind = _FIELD_KINDS[field]
+
+        if kind == 'category':
+            labels = list(_CATEGORIES[field])
+        elif field == 'era':
+            labels = list(self.eras)
+        elif kind == 'label':
+            labels = []
+        else:
+            return [_encode_number(kind, value) for value in values]
+
+        # Eras are hashed by identity, and strings by value.
+        codes = {label: i for i, label in enumerate(labels)}
+        encoded: list[int] = []
+        for value in values:
+            if value is None:
+                encoded.append(MISSING)
+                continue
+
+            code = codes.get(value)
+            if code is None:
+                if kind == 'category':
+                    encoded.append(MISSING)
+                    continue
+
+                code = codes[value] = len(labels)
+                labels.append(value)
+
+            encoded.append(code)
+
+        self._labels[field] = labels
+        return encoded
+
+    def _encode(self, field: str, value: object) -> int | None:
+        kind = _FIELD_KINDS[field]
+        if kind not in ('category', 'label'):
+            return _encode_number(kind, value)
+
+        if value is None:
+            return MISSING
+
+        for i, label in enumerate(self._labels[field]):
+            if label is value or label == value:
+                return i
+
+        return None
+
+    def _decode(self, field: str, code: int) -> object:
+        if field not in self._labels:
+            return code
+
+        return None if code == MISSING else self._labels[field][code]
+
+    def __len__(self) -> int:
+        return len(self._columns[self.fields[0]]) if self.fields else 0
+
+    def __getitem__(self, field: str) -> Any:
+        """Get the array of a field."""
+        return self._columns[field]
+
+    def labels(self, field: str) -> list:
+        """Get the values that the codes of a field stand for. 
+        The code of a value is its index in this list."""
+        return self._labels[field]
+
+    def mask(self, **conditions: object) -> Any:
+        """Get a boolean mask of the rows where every field equals the given value,
+        e.g. ``mask(quality=QualityEnum.LOSSLESS, era=era)``."""
+        result: Any = [True] * len(self) if np is None else np.ones(len(self), dtype=bool)
+
+        for field, value in conditions.items():
+            code = self._encode(field, value)
+            column = self._columns[field]
+
+            if np is not None:
+                result &= (column == code)
+            else:
+                result = [matched and x == code for matched, x in zip(result, column)]
+
+        return result
+
+    def filter(self, mask: Iterable[bool]) -> Self:
+        """Get the rows where `mask` is true, as a new `ColumnarTab`."""
+        filtered = object.__new__(type(self))
+        filtered.eras = self.eras
+        filtered.fields = self.fields
+        filtered._labels = self._labels
+
+        if np is not None:
+            mask = np.asarray(mask, dtype=bool)
+            filtered._columns = {
+                field: column[mask] for field, column in self._columns.items()
+            }
+        else:
+            mask = list(mask)
+            filtered._columns = {
+                field: array('q', (x for x, keep in zip(column, mask) if keep))
+                for field, column in self._columns.items()
+            }
+
+        return filtered
+
+    def where(self, **conditions: object) -> Self:
+        """Get the rows where every field equals the given value. See :meth:`mask`."""
+        return self.filter(self.mask(**conditions))
+
+    def _group_keys(self, fields: tuple[str, ...]) -> tuple[list[tuple], Any]:
+        """Get the distinct combinations of values of the fields, 
+        and the index of each row's combination."""
+        columns = [self._columns[field] for field in fields]
+
+        if np is not None:
+            if len(self) == 0:
+                return [], np.zeros(0, dtype=np.int64)
+
+            keys, inverse = np.unique(np.stack(columns, axis=1), axis=0, return_inverse=True)
+            return [tuple(int(x) for x in key) for key in keys], inverse.reshape(-1)
+
+        key_indices: dict[tuple, int] = {}
+        inverse = [key_indices.setdefault(key, len(key_indices)) for key in zip(*columns)]
+        return list(key_indices), inverse
+
+    def _decode_key(self, fields: tuple[str, ...], key: tuple) -> object:
+        decoded = tuple(self._decode(field, code) for field, code in zip(fields, key))
+        return decoded[0] if len(decoded) == 1 else decoded
+
+    def count_by(self, *fields: str) -> dict:
+        """Count the rows with each combination of values of the fields, 
+        e.g. ``count_by('era', 'quality')``.  
+        Keys are single values when one field is given, and tuples otherwise."""
+        keys, inverse = self._group_keys(fields)
+
+        if np is not None:
+            counts = np.bincount(inverse, minlength=len(keys)).tolist()
+        else:
+            counter = Counter(inverse)
+            counts = [counter[i] for i in range(len(keys))]
+
+        return {self._decode_key(fields, key): count for key, count in zip(keys, counts)}
+
+    def sum(self, field: str, by: str | tuple[str, ...] | None = None) -> int | dict:
+        """Sum a length or boolean field, ignoring missing values, 
+        e.g. ``where(available_length=AvailableLengthEnum.FULL).sum('length')``.
+
+        Arguments:
+            field: The field to sum.
+            by: A field, or fields, to group the sums by.
+        """
+        if _FIELD_KINDS[field] not in ('seconds', 'flag'):
+            raise ValueError(f"Can't sum the {field!r} field.")
+
+        column = self._columns[field]
+
+        if np is not None:
+            values = np.where(column == MISSING, 0, column)
+        else:
+            values = [0 if x == MISSING else x for x in column]
+
+        if by is None:
+            return int(sum(values)) if np is None else int(values.sum())
+
+        fields = (by,) if isinstance(by, str) else by
+        keys, inverse = self._group_keys(fields)
+
+        if np is not None:
+            sums = np.bincount(inverse, weights=values, minlength=len(keys)).astype(np.int64).tolist()
+        else:
+            sums = [0] * len(keys)
+            for i, value in zip(inverse, values):
+                sums[i] += value
+
+        return {self._decode_key(fields, key): total for key, total in zip(keys, sums)}
@@ -1,4 +1,5 @@
 import typing
+from typing import Iterator
 import pprint
 
 __all__ = [
@@ -8,12 +9,28 @@ __all__ = [
 type Row = list[str]
 type Range = list[Row]
 
+def _get_attributes(obj: object) -> Iterator[tuple[str, object]]:
+    """Yield the attributes of an object, whether they're 
+    stored in slots or in the object's `__dict__`."""
+    for cls in reversed(type(obj).__mro__):
+        slots = cls.__dict__.get('__slots__', ())
+        if isinstance(slots, str):
+            slots = (slots,)
+
+        for attr in slots:
+            try:
+                yield attr, getattr(obj, attr)
+            except AttributeError:
+                continue
+
+    yield from getattr(obj, '__dict__', {}).items()
+
 def add_repr[T](cls: type[T]):
     """Decorator that adds a simple __repr__ method."""
     def get_obj_repr(obj):
         obj_repr = repr(obj)
 
-        if not getattr(obj, '__repr_special', False):
+        if not getattr(type(obj).__repr__, '_add_repr', False):
             return obj_repr
 
         repr_by_line = obj_repr.splitlines()
@@ -29,11 +46,9 @@ def add_repr[T](cls: type[T]):
         return '\n'.join(repr_by_line)
 
     def __repr__(self: T):
-        setattr(self, '__repr_special', True)
-
         attributes: list[str] = []
 
-        for attr, obj in self.__dict__.items():
+        for attr, obj in _get_attributes(self):
             if attr[0] == '_':
                 continue
 
@@ -50,5 +65,8 @@ def add_repr[T](cls: type[T]):
 
         return result
 
+    # Marks the objects whose representations are nested with indentation.
+    __repr__._add_repr = True # type: ignore
+
     cls.__repr__ = __repr__
     return cls
\ No newline at end of file
@@ -0,0 +1,111 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import ClassVar, Iterator
+
+__all__ = [
+    'Diagnostics'
+]
+
+@dataclass
+class Diagnostics:
+    """The cells that couldn't be parsed while a tab was built.
+    Parsing falls back to a default value, such as `None`, for these cells,
+    so a rising count is a sign that the format of the sheet changed.
+
+    Only failures are recorded, so this costs nothing for cells that parse.
+    For a tab rebuilt by :meth:`Tracker.refresh`, only the rows
+    that were parsed again are counted.
+
+    Attributes:
+        errors (dict[str, int]): How many non-empty cells each column class
+            couldn't parse.
+        samples (dict[str, list[str]]): The first few of those cells,
+            for each column class.
+        unknown_values (dict[str, dict[str, int]]): Values that aren't options
+            of an enum, by the enum's name, with how many times each one was found.
+        unmatched_eras (int): How many entry rows name a different era
+            than the era row above them.
+        unmatched_era_samples (list[tuple[str, str]]): The first few of those,
+            as pairs of the entry's era cell and the name of the era above it.
+    """
+    #: How many cells are kept in each list of samples.
+    max_samples: ClassVar[int] = 5
+    #: How many distinct unknown values are counted for each enum.
+    max_unknown_values: ClassVar[int] = 100
+
+    errors: dict[str, int] = field(default_factory=dict)
+    samples: dict[str, list[str]] = field(default_factory=dict)
+    unknown_values: dict[str, dict[str, int]] = field(default_factory=dict)
+    unmatched_eras: int = 0
+    unmatched_era_samples: list[tuple[str, str]] = field(default_factory=list)
+
+    @property
+    def total(self) -> int:
+        """The number of problems found."""
+        unknown = sum(sum(counts.values()) for counts in self.unknown_values.values())
+        return sum(self.errors.values()) + unknown + self.unmatched_eras
+
+    def __bool__(self) -> bool:
+        return self.total > 0
+
+    def add_error(self, column: str, value: str):
+        """Record a cell of `column` that couldn't be parsed."""
+        self.errors[column] = self.errors.get(column, 0) + 1
+
+        samples = self.samples.setdefault(column, [])
+        if len(samples) < self.max_samples:
+            samples.append(value)
+
+    def add_unknown_value(self, enum: str, value: str, count: int = 1):
+        """Record a value that isn't an option of `enum`."""
+        counts = self.unknown_values.setdefault(enum, {})
+        if value in counts or len(counts) < self.max_unknown_values:
+            counts[value] = counts.get(value, 0) + count
+
+    def add_unmatched_era(self, era_cell: str, era_name: str):
+        """Record an entry row whose era cell doesn't name the era it's under."""
+        self.unmatched_eras += 1
+        if len(self.unmatched_era_samples) < self.max_samples:
+            self.unmatched_era_samples.append((era_cell, era_name))
+
+    def merge(self, other: 'Diagnostics'):
+        """Add the problems found in `other` to these."""
+        for column, count in other.errors.items():
+            self.errors[column] = self.errors.get(column, 0) + count
+            samples = self.samples.setdefault(column, [])
+            samples.extend(other.samples.get(column, [])[:self.max_samples - len(samples)])
+
+        for enum, counts in other.unknown_values.items():
+            for value, count in counts.items():
+                self.add_unknown_value(enum, value, count)
+
+        self.unmatched_eras += other.unmatched_eras
+        room = self.max_samples - len(self.unmatched_era_samples)
+        self.unmatched_era_samples.extend(other.unmatched_era_samples[:room])
+
+_active_diagnostics: ContextVar[Diagnostics | None] = ContextVar('yetracker_diagnostics', default=None)
+
+@contextmanager
+def collecting(diagnostics: Diagnostics) -> Iterator[Diagnostics]:
+    """Record the problems found in the body of the `with` statement in `diagnostics`."""
+    token = _active_diagnostics.set(diagnostics)
+    try:
+        yield diagnostics
+    finally:
+        _active_diagnostics.reset(token)
+
+def report_error(column: str, value: str):
+    diagnostics = _active_diagnostics.get()
+    if diagnostics is not None:
+        diagnostics.add_error(column, value)
+
+def report_unknown_value(enum: str, value: str):
+    diagnostics = _active_diagnostics.get()
+    if diagnostics is not None:
+        diagnostics.add_unknown_value(enum, value)
+
+def report_unmatched_era(era_cell: str, era_name: str):
+    diagnostics = _active_diagnostics.get()
+    if diagnostics is not None:
+        diagnostics.add_unmatched_era(era_cell, era_name)
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import Any, ClassVar, Self
 import pprint
 
 from yetracker.common import Row, add_repr
@@ -13,10 +14,34 @@ from yetracker.era import Era, SubEra
 
 @add_repr
 class Entry(ABC):
+    __slots__ = ()
+
+    #: The attributes parsed from the entry's row.
+    _fields: ClassVar[frozenset[str]] = frozenset()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+
+        slots = (base.__dict__.get('__slots__', ()) for base in cls.__mro__)
+        cls._fields = frozenset(
+            slot for base_slots in slots for slot in base_slots if not slot.startswith('_')
+        )
+
     @abstractmethod
     def __init__(self, row: Row):
         pass
 
+    def _parse(self, row: Row, fields: frozenset[str]):
+        """Parse the attributes in `fields` from the entry's row. 
+        Attributes that cost nothing to get, such as plain-text cells, may be set either way.  
+        Entry classes that don't override this always parse every attribute."""
+        type(self).__init__(self, row)
+
+#: The attributes parsed from the "Name" column, which are all parsed at once.
+_NAME_FIELDS = frozenset({
+    'full_name', 'main_name', 'emojis', 'version', 'contribs', 'alt_names', 'artist'
+})
+
 class WithNames:
     """Base class used to derive various attributes
     from the "Name" column in multiple tabs.
@@ -31,6 +56,8 @@ class WithNames:
         artist (str | None): The artist of the entry 
             (if not the tracker's main artist)
     """
+    __slots__ = ()
+
     def _set_name_attrs(self, row: Row):
         name_column = Name(row, 1)
         self.full_name = name_column()
@@ -51,6 +78,7 @@ class WithEras:
             or an Era object.
         subera (SubEra | None): The subera of the entry.
     """
+    __slots__ = ()
 
     def _set_era_attrs(self, era_name: str):
         self.era: str | Era = era_name
@@ -71,14 +99,28 @@ class Song(Entry, WithNames, WithEras):
         length (timedelta | None): The length of the entry.
         link (str): Audio link of the entry.
     """
+    __slots__ = (
+        'era_name', 'notes', 'length', 'link',
+        'full_name', 'main_name', 'emojis', 'version', 'contribs', 'alt_names', 'artist',
+        'era', 'subera'
+    )
+
+    #: The column of the entry's length.
+    _length_column: ClassVar[int] = 3
+
     def __init__(self, row: Row):
+        self._parse(row, self._fields)
+
+    def _parse(self, row: Row, fields: frozenset[str]):
         self.era_name = SimpleColumn(row, 0)()
 
         self.notes = SimpleColumn(row, 2)()
-        self.length = TrackLength(row, 3)()
+        if 'length' in fields:
+            self.length = TrackLength(row, self._length_column)()
         self.link = SimpleColumn(row, 8)()
 
-        self._set_name_attrs(row)
+        if not fields.isdisjoint(_NAME_FIELDS):
+            self._set_name_attrs(row)
         self._set_era_attrs(self.era_name)
 
 class Unreleased(Song):
@@ -94,14 +136,20 @@ class Unreleased(Song):
             How much of the song is available.
         quality (QualityEnum | None): The audio quality of the song.
     """
-    def __init__(self, row: Row):
-        super().__init__(row)
+    __slots__ = ('file_date', 'leak_date', 'available_length', 'quality')
+
+    def _parse(self, row: Row, fields: frozenset[str]):
+        super()._parse(row, fields)
 
-        self.file_date = Date(row, 4)()
-        self.leak_date = Date(row, 5)()
+        if 'file_date' in fields:
+            self.file_date = Date(row, 4)()
+        if 'leak_date' in fields:
+            self.leak_date = Date(row, 5)()
 
-        self.available_length = AvailableLength(row, 6)()
-        self.quality = Quality(row, 7)()
+        if 'available_length' in fields:
+            self.available_length = AvailableLength(row, 6)()
+        if 'quality' in fields:
+            self.quality = Quality(row, 7)()
 
 class Released(Song):
     """Represents an entry in the Released tab.  
@@ -112,13 +160,17 @@ class Released(Song):
         type (ReleasedTypeEnum | None): The type of the release.
         streaming (bool): Whether the song is streaming or not.
     """
-    def __init__(self, row: Row):
-        super().__init__(row)
+    __slots__ = ('release_date', 'type', 'streaming')
+
+    def _parse(self, row: Row, fields: frozenset[str]):
+        super()._parse(row, fields)
 
         self.link = SimpleColumn(row, 7)()
 
-        self.release_date = Date(row, 4)()
-        self.type = ReleasedType(row, 5)()
+        if 'release_date' in fields:
+            self.release_date = Date(row, 4)()
+        if 'type' in fields:
+            self.type = ReleasedType(row, 5)()
         self.streaming = Streaming(row, 6)()
 
 class Stem(Song):
@@ -131,17 +183,24 @@ class Stem(Song):
     Attributes:
         bpm (str): The BPM of the stems.
     """
-    def __init__(self, row: Row):
-        super().__init__(row)
+    __slots__ = ('file_date', 'leak_date', 'bpm', 'available_length', 'quality')
+
+    _length_column = 5
+
+    def _parse(self, row: Row, fields: frozenset[str]):
+        super()._parse(row, fields)
 
         self.link = SimpleColumn(row, 9)()
-        self.length = TrackLength(row, 5)()
 
-        self.file_date = Date(row, 3)()
-        self.leak_date = Date(row, 4)()
+        if 'file_date' in fields:
+            self.file_date = Date(row, 3)()
+        if 'leak_date' in fields:
+            self.leak_date = Date(row, 4)()
         self.bpm = SimpleColumn(row, 6)()
-        self.available_length = AvailableLength(row, 7)()
-        self.quality = Quality(row, 8)()
+        if 'available_length' in fields:
+            self.available_length = AvailableLength(row, 7)()
+        if 'quality' in fields:
+            self.quality = Quality(row, 8)()
 
 class Sample(Entry, WithNames):
     """Represents an entry in the Samples tab.  
@@ -152,18 +211,116 @@ class Sample(Entry, WithNames):
     Attributes:
         samples (list[SampleUsed]): The samples used by a song.
     """
+    __slots__ = (
+        'era_name', 'notes', 'links', 'samples',
+        'full_name', 'main_name', 'emojis', 'version', 'contribs', 'alt_names', 'artist'
+    )
+
     def __init__(self, row: Row):
-        super().__init__(row)
+        self._parse(row, self._fields)
 
+    def _parse(self, row: Row, fields: frozenset[str]):
         self.era_name: str = SimpleColumn(row, 0)()
         self.notes = SimpleColumn(row, 3)()
         self.links = SimpleColumn(row, 4)()
 
-        self.samples = SampleColumn(row, 2)()
-        self.samples = SampleColumn.modify_samples_used(
-            self.samples, 
-            self.notes,
-            self.links
-        )
+        if 'samples' in fields:
+            self.samples = SampleColumn(row, 2)()
+            self.samples = SampleColumn.modify_samples_used(
+                self.samples, 
+                self.notes,
+                self.links
+            )
+
+        if not fields.isdisjoint(_NAME_FIELDS):
+            self._set_name_attrs(row)
+
+class PartialEntry:
+    """Base class of the entries of a tab built with only some `fields`.
+
+    A partial entry is an instance of the entry class it stands in for,
+    such as :class:`Unreleased`, with the same attributes. The attributes 
+    that weren't asked for are parsed from the entry's row 
+    the first time one of them is accessed.
+    """
+    __slots__ = ()
+
+    _entry_cls: ClassVar[type[Entry]]
+    _row: Row
+
+    @classmethod
+    def _from_row(cls, row: Row, fields: frozenset[str]) -> Self:
+        entry = cls.__new__(cls)
+        entry._row = row
+        entry._parse(row, fields) # type: ignore
+        return entry
+
+    def __getattr__(self, name: str) -> Any:
+        if name not in self._entry_cls._fields:
+            raise AttributeError(f'{type(self).__name__!r} object has no attribute {name!r}')
+
+        self._parse_rest()
+        return object.__getattribute__(self, name)
+
+    def _parse_rest(self):
+        """Set every attribute that wasn't parsed yet, from a fully parsed entry.  
+        The attributes that are already set, such as the entry's era, are kept."""
+        try:
+            row = object.__getattribute__(self, '_row')
+        except AttributeError:
+            return
+
+        full_entry = self._entry_cls(row)
+        for field in self._entry_cls._fields:
+            try:
+                object.__getattribute__(self, field)
+            except AttributeError:
+                setattr(self, field, getattr(full_entry, field))
+
+        del self._row
+
+    def __reduce__(self) -> tuple:
+        # Pickled as a regular entry, so that it can be unpickled anywhere.
+        self._parse_rest()
+
+        state = {field: getattr(self, field) for field in self._entry_cls._fields}
+        return _restore_entry, (self._entry_cls, state)
+
+def _restore_entry[T: Entry](entry_cls: type[T], state: dict[str, Any]) -> T:
+    entry = entry_cls.__new__(entry_cls)
+    for field, value in state.items():
+        setattr(entry, field, value)
+
+    return entry
+
+def _copy_entry[T: Entry](entry: T) -> T:
+    """Make a shallow copy of an entry, without parsing 
+    the attributes of a partial entry that weren't parsed yet."""
+    cls = type(entry)
+    copy = cls.__new__(cls)
+    for base in cls.__mro__:
+        for slot in base.__dict__.get('__slots__', ()):
+            try:
+                setattr(copy, slot, object.__getattribute__(entry, slot))
+            except AttributeError:
+                pass
+
+    return copy
+
+_partial_entry_classes: dict[type[Entry], type[PartialEntry]] = {}
+
+def _get_partial_entry_cls(entry_cls: type[Entry]) -> type[PartialEntry]:
+    """Get a subclass of both :class:`PartialEntry` and `entry_cls`."""
+    partial_cls = _partial_entry_classes.get(entry_cls)
+    if partial_cls is not None:
+        return partial_cls
+
+    namespace: dict[str, Any] = {
+        '__slots__': ('_row',),
+        '__module__': entry_cls.__module__,
+        '_entry_cls': entry_cls
+    }
+    partial_cls = type(f'Partial{entry_cls.__name__}', (PartialEntry, entry_cls), namespace)
+    _partial_entry_classes[entry_cls] = partial_cls
 
-        self._set_name_attrs(row)
+    return partial_cls
@@ -17,6 +17,8 @@ __all__ = [
 
 @add_repr
 class Era(ABC):
+    __slots__ = ()
+
     @abstractmethod
     def __init__(self, row: Row) -> None:
         pass
@@ -36,6 +38,8 @@ class BasicEra(Era):
         main_name (str): The main name of the era.
         alt_names (str): Alternative names the era is known by.
     """
+    __slots__ = ('notes', 'stats', 'events', 'main_name', 'alt_names')
+
     def __init__(self, row: Row):
         self.notes = SimpleColumn(row, 5)()
 
@@ -52,6 +56,8 @@ class BasicEra(Era):
 
 @add_repr
 class SubEra(ABC):
+    __slots__ = ()
+
     @abstractmethod
     def __init__(self, row: Row) -> None:
         pass
@@ -68,6 +74,8 @@ class BasicSubEra(SubEra):
         events (dict[str, str]): The events within an era with the date they happened.
         name (str): The subera's name.
     """
+    __slots__ = ('name', 'events')
+
     def __init__(self, row: Row):
         self.name = SimpleColumn(row, 1)()
         self.events = EraEvents(row, 2)()
@@ -82,6 +90,8 @@ class StemSubEra(SubEra):
     Attributes:
         stem_type (StemTypeEnum | None): The type of the stem.
     """
+    __slots__ = ('stem_type',)
+
     def __init__(self, row):
         self.stem_type = StemType(row, 1)()
 
@@ -90,6 +100,8 @@ class StemSubEra(SubEra):
         return len(row) == 2
 
 class MusicVideosSubEra(SubEra):
+    __slots__ = ('release_status',)
+
     def __init__(self, row: Row):
         self.release_status = MVStatus(row, 1)()
 
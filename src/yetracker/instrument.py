@@ -0,0 +1,214 @@
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from dataclasses import dataclass
+from functools import wraps
+from typing import Any, ContextManager, Iterator
+import threading
+import time
+
+from yetracker.column import Column
+
+__all__ = [
+    'Span',
+    'Tracer',
+    'tracing',
+    'get_tracer'
+]
+
+_active_tracer: ContextVar['Tracer | None'] = ContextVar('yetracker_tracer', default=None)
+#: The tab of the innermost span, which spans and counts default to.
+_current_tab: ContextVar[str | None] = ContextVar('yetracker_traced_tab', default=None)
+#: Whether a column is being timed in the current thread or task, 
+#: so that columns calling their base class's `__call__` are only timed once.
+_in_column: ContextVar[bool] = ContextVar('yetracker_in_column', default=False)
+
+@dataclass(slots=True)
+class Span:
+    """A timed stage of getting a tab, such as fetching or parsing it."""
+    name: str #: The stage, such as ``'fetch'``, ``'decode'``, ``'parse'`` or ``'eras'``.
+    tab: str | None #: The name of the tab, if known.
+    seconds: float #: How long the stage took.
+
+class Tracer:
+    """Receives timings and counts of what the tracker does, while it's active
+    (see :func:`tracing`). By default, everything is kept in the tracer's attributes.
+    To export to a metrics system, override :meth:`on_span` and :meth:`on_count`.
+
+    The spans are:
+
+    - ``get`` and ``refresh``: the whole of getting or refreshing a tab through a tracker.
+    - ``fetch``: getting the values of a tab from the data source, including decoding.
+    - ``decode``: decoding JSON values, for JSON and cached data sources.
+    - ``parse``: parsing the values into a tab.
+    - ``eras``: the total time spent telling era and subera rows apart, per parse.
+
+    The counts are ``rows``, ``ignored_rows``, ``era_rows``, ``subera_rows``,
+    ``entry_rows``, ``parse_errors`` (see :class:`Diagnostics`), 
+    ``parse_cache.hit``, ``parse_cache.miss``, ``raw_cache.hit``, ``raw_cache.miss``, 
+    ``tab_cache.hit`` and ``tab_cache.stale``.
+
+    Tabs parsed in other processes, with `workers`, aren't traced.
+
+    Attributes:
+        spans (list[Span]): Every span, in the order they ended.
+        counts (dict[tuple[str, str | None], int]): The total of each count,
+            by count name and tab name.
+        column_seconds (dict[tuple[str, str | None], float]): The total time
+            spent in each column class, by class name and tab name.
+        column_calls (dict[tuple[str, str | None], int]): How many cells
+            each column class parsed, by class name and tab name.
+    """
+    def __init__(self):
+        self.spans: list[Span] = []
+        self.counts: dict[tuple[str, str | None], int] = {}
+        self.column_seconds: dict[tuple[str, str | None], float] = {}
+        self.column_calls: dict[tuple[str, str | None], int] = {}
+
+        # Tabs may be parsed in several threads at once, all reporting to the same tracer.
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def span(self, name: str, tab: str | None = None) -> Iterator[None]:
+        """Time the body of the `with` statement as a span.
+        Spans and counts inside it default to the same tab."""
+        if tab is None:
+            tab = _current_tab.get()
+
+        token = _current_tab.set(tab)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            seconds = time.perf_counter() - start
+            _current_tab.reset(token)
+            self.on_span(Span(name, tab, seconds))
+
+    def count(self, name: str, value: int = 1, tab: str | None = None):
+        """Add to a count."""
+        if tab is None:
+            tab = _current_tab.get()
+
+        key = (name, tab)
+        with self._lock:
+            self.counts[key] = self.counts.get(key, 0) + value
+        self.on_count(name, value, tab)
+
+    def add_span(self, name: str, seconds: float, tab: str | None = None):
+        """Record a span that was timed elsewhere."""
+        self.on_span(Span(name, tab if tab is not None else _current_tab.get(), seconds))
+
+    def _add_column_time(self, column_name: str, seconds: float):
+        key = (column_name, _current_tab.get())
+        with self._lock:
+            self.column_seconds[key] = self.column_seconds.get(key, 0) + seconds
+            self.column_calls[key] = self.column_calls.get(key, 0) + 1
+
+    def on_span(self, span: Span):
+        """Called whenever a span ends. Keeps the span by default."""
+        self.spans.append(span)
+
+    def on_count(self, name: str, value: int, tab: str | None):
+        """Called whenever a count is added to. Does nothing by default,
+        since the totals are kept in :attr:`counts`."""
+        pass
+
+def get_tracer() -> Tracer | None:
+    """Get the active tracer, if there is one."""
+    return _active_tracer.get()
+
+def traced(name: str, tab: str | None = None) -> ContextManager[Any]:
+    """Time a span with the active tracer, or do nothing if there isn't one."""
+    tracer = _active_tracer.get()
+    if tracer is None:
+        return nullcontext()
+
+    return tracer.span(name, tab)
+
+@contextmanager
+def untraced() -> Iterator[None]:
+    """Stop the active tracer in the body of the `with` statement."""
+    token = _active_tracer.set(None)
+    try:
+        yield
+    finally:
+        _active_tracer.reset(token)
+
+def count(name: str, value: int = 1, tab: str | None = None):
+    """Add to a count of the active tracer, if there is one."""
+    tracer = _active_tracer.get()
+    if tracer is not None:
+        tracer.count(name, value, tab)
+
+def _wrap_column_call(call):
+    @wraps(call)
+    def wrapper(self: Column, *args, **kwargs):
+        tracer = _active_tracer.get()
+
+        if tracer is None or _in_column.get():
+            return call(self, *args, **kwargs)
+
+        token = _in_column.set(True)
+        start = time.perf_counter()
+        try:
+            return call(self, *args, **kwargs)
+        finally:
+            _in_column.reset(token)
+            tracer._add_column_time(type(self).__name__, time.perf_counter() - start)
+
+    return wrapper
+
+#: The `__call__` method of each column class that's wrapped, to restore it afterwards.
+_original_calls: dict[type[Column], Any] = {}
+#: How many `tracing` blocks are running, in any thread or task.
+_tracing_count = 0
+_tracing_lock = threading.Lock()
+
+def _instrument_columns(cls: type[Column] = Column):
+    """Wrap the `__call__` method of every column class, so that it's timed
+    while a tracer is active. Columns are only wrapped while a tracer is in use, 
+    so that parsing has no overhead otherwise."""
+    call = cls.__dict__.get('__call__')
+    if call is not None and cls not in _original_calls:
+        _original_calls[cls] = call
+        setattr(cls, '__call__', _wrap_column_call(call))
+
+    for subclass in cls.__subclasses__():
+        _instrument_columns(subclass)
+
+def _restore_columns():
+    """Undo :func:`_instrument_columns`."""
+    for cls, call in _original_calls.items():
+        setattr(cls, '__call__', call)
+    _original_calls.clear()
+
+@contextmanager
+def tracing(tracer: Tracer | None = None) -> Iterator[Tracer]:
+    """Make a tracer active in the body of the `with` statement,
+    in the current thread or asyncio task.
+
+    Arguments:
+        tracer: The tracer to use. Defaults to a new :class:`Tracer`.
+
+    Returns:
+        The active tracer.
+    """
+    global _tracing_count
+
+    if tracer is None:
+        tracer = Tracer()
+
+    with _tracing_lock:
+        if _tracing_count == 0:
+            _instrument_columns()
+        _tracing_count += 1
+
+    token = _active_tracer.set(tracer)
+    try:
+        yield tracer
+    finally:
+        _active_tracer.reset(token)
+
+        with _tracing_lock:
+            _tracing_count -= 1
+            if _tracing_count == 0:
+                _restore_columns()
@@ -0,0 +1,320 @@
+from bisect import bisect_left
+from collections import deque
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Iterator
+import inspect
+import re
+
+from yetracker.entry import Entry
+from yetracker.tab import ChangeSet, Tab
+
+if TYPE_CHECKING:
+    from yetracker.tracker import Tracker
+
+__all__ = [
+    'SearchIndex',
+    'SearchResult'
+]
+
+_TOKEN_PATTERN = re.compile(r'\w+')
+
+# How much a match in each field counts towards an entry's score.
+_NAME_WEIGHT = 3.0
+_ALT_NAME_WEIGHT = 2.0
+_CONTRIB_WEIGHT = 1.5
+_NOTES_WEIGHT = 1.0
+
+# How much prefix and fuzzy matches count, compared to exact matches.
+_PREFIX_FACTOR = 0.7
+_FUZZY_FACTOR = 0.4
+
+_MIN_FUZZY_LENGTH = 3
+
+def tokenize(text: str) -> list[str]:
+    """Split text into case-folded words."""
+    return _TOKEN_PATTERN.findall(text.casefold())
+
+def _get_texts(entry: Entry) -> Iterator[tuple[float, str]]:
+    """Yield the searchable text of an entry, with the weight of each text."""
+    yield _NAME_WEIGHT, getattr(entry, 'main_name', '')
+
+    artist = getattr(entry, 'artist', None)
+    if artist is not None:
+        yield _NAME_WEIGHT, artist
+
+    for alt_name in getattr(entry, 'alt_names', []):
+        yield _ALT_NAME_WEIGHT, alt_name
+
+    contribs = getattr(entry, 'contribs', None)
+    if contribs is not None:
+        for contrib in (contribs.feat, contribs.ref, contribs.with_, contribs.prod, contribs.ques):
+            if contrib is not None:
+                yield _CONTRIB_WEIGHT, contrib
+
+    for sample in getattr(entry, 'samples', []):
+        yield _CONTRIB_WEIGHT, f'{sample.artist or ""} {sample.name or ""}'
+
+    yield _NOTES_WEIGHT, getattr(entry, 'notes', '')
+
+def _deletions(token: str) -> Iterator[str]:
+    for i in range(len(token)):
+        yield token[:i] + token[i + 1:]
+
+@dataclass
+class SearchResult:
+    """An entry matched by a search."""
+    entry: Entry #: The matched entry.
+    tab_name: str #: The name of the tab the entry is from.
+    score: float #: How well the entry matched. Higher is better.
+
+class SearchIndex:
+    """An in-memory inverted index over the names, alternative names, 
+    contributors, and notes of the entries of one or more tabs.  
+
+    Adding a tab under a name that's already indexed replaces 
+    the previous version of the tab, so the index can be kept up to date 
+    as tabs are reloaded. Tabs refreshed with :meth:`Tracker.refresh` 
+    can be updated with only their changes, using :meth:`update_tab`.
+    """
+    def __init__(self):
+        self._entries: dict[int, tuple[str, Entry]] = {}
+        # The ID of each entry of each tab, by the `id` of the entry object.
+        self._tab_entry_ids: dict[str, dict[int, int]] = {}
+        self._next_id = 0
+
+        # Maps each token to the entries containing it, with the weight of its best field.
+        self._postings: dict[str, dict[int, float]] = {}
+
+        # Built on demand from the postings, when they have changed.
+        self._vocabulary: list[str] | None = None
+        self._deletion_index: dict[str, set[str]] | None = None
+
+    @classmethod
+    def from_tracker(cls, tracker: 'Tracker', tab_names: list[str] | None = None) -> 'SearchIndex':
+        """Create an index of a tracker's tabs.
+
+        Arguments:
+            tracker: The tracker to load the tabs from.
+            tab_names: The tabs to index. Defaults to every tab of the tracker.
+        """
+        tabs = tracker.load_tabs(tab_names)
+        if inspect.iscoroutine(tabs):
+            tabs.close()
+            raise TypeError('Asynchronous trackers must load their tabs first: '
+                            'use SearchIndex.from_tabs(await tracker.load_tabs()).')
+
+        return cls.from_tabs(tabs)
+
+    @classmethod
+    def from_tabs(cls, tabs: dict[str, Tab]) -> 'SearchIndex':
+        """Create an index of tabs, such as those returned by :meth:`Tracker.load_tabs`.
+
+        Arguments:
+            tabs: The tabs to index, mapped to their names.
+        """
+        index = cls()
+        for tab_name, tab in tabs.items():
+            index.add_tab(tab_name, tab)
+
+        return index
+
+    def add_tab(self, tab_name: str, tab: Tab):
+        """Index the entries of a tab, replacing any tab previously added with the same name."""
+        self.remove_tab(tab_name)
+
+        entry_ids: dict[int, int] = {}
+        for entry in tab:
+            entry_ids[id(entry)] = self._add_entry(tab_name, entry)
+
+        self._tab_entry_ids[tab_name] = entry_ids
+        self._vocabulary = self._deletion_index = None
+
+    def update_tab(self, tab_name: str, changes: ChangeSet):
+        """Update the index of a tab with the changes returned by :meth:`Tracker.refresh`, 
+        only indexing the entries that were added, removed, or modified.  
+        Adds the whole tab if no tab was added with the same name.
+
+        Arguments:
+            tab_name: The name of the tab.
+            changes: The changes since the version of the tab in the index.
+        """
+        entry_ids = self._tab_entry_ids.get(tab_name)
+        if entry_ids is None:
+            self.add_tab(tab_name, changes.tab)
+            return
+
+        for entry in (*changes.removed, *(old for old, _ in changes.modified)):
+            entry_id = entry_ids.pop(id(entry), None)
+            if entry_id is not None:
+                self._remove_entry(entry_id)
+
+        for entry in (*changes.added, *(new for _, new in changes.modified)):
+            entry_ids[id(entry)] = self._add_entry(tab_name, entry)
+
+        # Unchanged entries are usually shared with the new version of the tab, 
+        # but are copied if their era changed, so copies take the place of the originals.
+        new_ids = {id(entry) for entry in changes.tab}
+        copies = [entry for entry in changes.tab if id(entry) not in entry_ids]
+        if len(copies) > 0:
+            originals: dict[tuple, deque[int]] = {}
+            for key in [key for key in entry_ids if key not in new_ids]:
+                entry_id = entry_ids.pop(key)
+                _, original = self._entries[entry_id]
+                originals.setdefault(tuple(_get_texts(original)), deque()).append(entry_id)
+
+            for entry in copies:
+                matches = originals.get(tuple(_get_texts(entry)))
+                if matches:
+                    entry_id = matches.popleft()
+                    self._entries[entry_id] = (tab_name, entry)
+                else:
+                    entry_id = self._add_entry(tab_name, entry)
+                entry_ids[id(entry)] = entry_id
+
+            for unmatched in originals.values():
+                for entry_id in unmatched:
+                    self._remove_entry(entry_id)
+
+        if changes:
+            self._vocabulary = self._deletion_index = None
+
+    def remove_tab(self, tab_name: str):
+        """Remove the entries of a tab from the index, if it was added."""
+        entry_ids = self._tab_entry_ids.pop(tab_name, {})
+
+        for entry_id in entry_ids.values():
+            self._remove_entry(entry_id)
+
+        if len(entry_ids) > 0:
+            self._vocabulary = self._deletion_index = None
+
+    def _add_entry(self, tab_name: str, entry: Entry) -> int:
+        entry_id = self._next_id
+        self._next_id += 1
+        self._entries[entry_id] = (tab_name, entry)
+
+        for weight, text in _get_texts(entry):
+            for token in tokenize(text):
+                postings = self._postings.setdefault(token, {})
+                if postings.get(entry_id, 0) < weight:
+                    postings[entry_id] = weight
+
+        return entry_id
+
+    def _remove_entry(self, entry_id: int):
+        _, entry = self._entries.pop(entry_id)
+
+        for _, text in _get_texts(entry):
+            for token in tokenize(text):
+                postings = self._postings.get(token)
+                if postings is None:
+                    continue
+
+                postings.pop(entry_id, None)
+                if len(postings) == 0:
+                    del self._postings[token]
+
+    def _get_vocabulary(self) -> list[str]:
+        if self._vocabulary is None:
+            self._vocabulary = sorted(self._postings)
+
+        return self._vocabulary
+
+    def _get_deletion_index(self) -> dict[str, set[str]]:
+        """Maps each token, and each way to delete one letter from it, 
+        to the tokens it came from."""
+        if self._deletion_index is None:
+            deletion_index: dict[str, set[str]] = {}
+            for token in self._postings:
+                if len(token) < _MIN_FUZZY_LENGTH:
+                    continue
+
+                deletion_index.setdefault(token, set()).add(token)
+                for deletion in _deletions(token):
+                    deletion_index.setdefault(deletion, set()).add(token)
+
+            self._deletion_index = deletion_index
+
+        return self._deletion_index
+
+    def _expand(self, query_token: str, prefix: bool, fuzzy: bool, 
+                max_expansions: int) -> dict[str, float]:
+        """Get the indexed tokens a query token matches, with how much each match counts."""
+        matches: dict[str, float] = {}
+
+        if prefix:
+            vocabulary = self._get_vocabulary()
+            start = bisect_left(vocabulary, query_token)
+
+            for token in vocabulary[start:start + max_expansions]:
+                if not token.startswith(query_token):
+                    break
+                matches[token] = _PREFIX_FACTOR
+
+        if fuzzy and len(query_token) >= _MIN_FUZZY_LENGTH:
+            deletion_index = self._get_deletion_index()
+
+            for variant in (query_token, *_deletions(query_token)):
+                for token in deletion_index.get(variant, ()):
+                    matches.setdefault(token, _FUZZY_FACTOR)
+
+        if query_token in self._postings:
+            matches[query_token] = 1.0
+
+        return matches
+
+    def search(self, query: str, 
+               limit: int | None = 10, 
+               prefix: bool = True, 
+               fuzzy: bool = False,
+               max_expansions: int = 64) -> list[SearchResult]:
+        """Search for the entries matching every word of a query.
+
+        Arguments:
+            query: The text to search for.
+            limit: The maximum number of results. `None` returns every result.
+            prefix: Whether words can match the start of longer words.
+            fuzzy: Whether words can match words that are 
+                one typo away from them.
+            max_expansions: The maximum number of words a 
+                prefix can match.
+
+        Returns:
+            The matching entries, best matches first.
+        """
+        scores: dict[int, float] | None = None
+
+        for query_token in tokenize(query):
+            token_scores: dict[int, float] = {}
+
+            for token, factor in self._expand(query_token, prefix, fuzzy, max_expansions).items():
+                for entry_id, weight in self._postings[token].items():
+                    score = factor * weight
+                    if token_scores.get(entry_id, 0) < score:
+                        token_scores[entry_id] = score
+
+            if scores is None:
+                scores = token_scores
+            else:
+                scores = {
+                    entry_id: score + token_scores[entry_id]
+                    for entry_id, score in scores.items() 
+                    if entry_id in token_scores
+                }
+
+            if len(scores) == 0:
+                break
+
+        if scores is None:
+            return []
+
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+        if limit is not None:
+            ranked = ranked[:limit]
+
+        results: list[SearchResult] = []
+        for entry_id, score in ranked:
+            tab_name, entry = self._entries[entry_id]
+            results.append(SearchResult(entry, tab_name, score))
+
+        return results
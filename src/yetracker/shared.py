@@ -0,0 +1,502 @@
+from contextlib import suppress
+from datetime import datetime, timedelta
+from enum import Enum
+from typing import Any, Callable, Iterator, Sequence, overload
+import json
+import marshal
+import mmap
+import os
+import struct
+import sys
+import tempfile
+
+from yetracker.entry import Entry, PartialEntry
+from yetracker.era import Era, SubEra
+from yetracker.snapshot import SnapshotError, _get_class_path, _get_slots, _resolve_class
+from yetracker.tab import Tab
+
+__all__ = [
+    'write_shared_snapshot',
+    'SharedSnapshot',
+    'SharedTab',
+    'SharedEntry'
+]
+
+_MAGIC = b'YTSHRD'
+#: Increase whenever the layout of shared snapshots changes.
+SCHEMA_VERSION = 1
+
+# Magic, schema version, Python major and minor version,
+# whether the file is big-endian, and the length of the directory.
+_HEADER = struct.Struct('<6sHBBBxI')
+
+# Each field of a record is a 32-bit code. The lowest two bits are the kind
+# of the value, and the other bits are its index in the table of that kind.
+_WORD = 'I'
+_KIND_BITS = 2
+_KIND_MASK = (1 << _KIND_BITS) - 1
+
+_SPECIAL = 0
+_STRING = 1
+_VALUE = 2
+_REF = 3
+
+_NONE_CODE = _SPECIAL
+#: The code of a slot that was never set on the entry.
+_UNSET_CODE = 1 << _KIND_BITS | _SPECIAL
+
+def _align(buffer: bytearray):
+    buffer.extend(bytes(-len(buffer) % 4))
+
+class _TableWriter:
+    """Collects distinct byte strings, to be written as
+    an array of offsets followed by the byte strings themselves."""
+    def __init__(self):
+        self.items: list[bytes] = []
+        self._indices: dict[bytes, int] = {}
+
+    def add(self, item: bytes) -> int:
+        index = self._indices.get(item)
+        if index is None:
+            index = self._indices[item] = len(self.items)
+            self.items.append(item)
+
+        return index
+
+    def write(self, buffer: bytearray) -> int:
+        _align(buffer)
+        start = len(buffer)
+
+        offsets = [0]
+        for item in self.items:
+            offsets.append(offsets[-1] + len(item))
+
+        data_start = start + len(offsets) * 4
+        buffer.extend(struct.pack(f'={len(offsets)}{_WORD}',
+                                  *(data_start + offset for offset in offsets)))
+        for item in self.items:
+            buffer.extend(item)
+
+        return start
+
+class _ValueEncoder:
+    """Turns parsed values into nested tuples, lists, and dicts of 
+    primitive values that `marshal` can write, each of which can be decoded 
+    on its own, unlike the tables of :mod:`yetracker.snapshot`.  
+
+    Objects that aren't primitive are written as tuples starting with a tag:
+    classes, including enums, are referred to by their index in :attr:`classes`, 
+    and eras and suberas by their index in :attr:`eras`."""
+    def __init__(self):
+        self.classes: list[str] = []
+        self.eras: list[Any] = []
+
+        self._class_codes: dict[type, int] = {}
+        self._era_codes: dict[int, int] = {}
+
+    def get_class_code(self, cls: type) -> int:
+        code = self._class_codes.get(cls)
+        if code is None:
+            code = self._class_codes[cls] = len(self.classes)
+            self.classes.append(_get_class_path(cls))
+
+        return code
+
+    def get_era_code(self, era: Era | SubEra) -> int:
+        code = self._era_codes.get(id(era))
+        if code is None:
+            code = self._era_codes[id(era)] = len(self.eras)
+            self.eras.append(None)
+            self.eras[code] = self.encode_object(era)
+
+        return code
+
+    def encode_object(self, obj: object) -> tuple:
+        # Partial entries are written as the entry class they stand in for, 
+        # and getting each of their attributes parses the rest of them.
+        cls = obj._entry_cls if isinstance(obj, PartialEntry) else type(obj)
+        values = tuple(self.encode(getattr(obj, slot, None)) for slot in _get_slots(cls))
+        return ('o', self.get_class_code(cls), values)
+
+    def encode(self, value: object) -> Any:
+        # Checked first, since some enums are also strings.
+        if isinstance(value, Enum):
+            return ('e', self.get_class_code(type(value)), value.value)
+        elif value is None or isinstance(value, (str, int, float)):
+            return value
+        elif isinstance(value, list):
+            return [self.encode(x) for x in value]
+        elif isinstance(value, dict):
+            return {key: self.encode(x) for key, x in value.items()}
+        elif isinstance(value, tuple):
+            return ('t', tuple(self.encode(x) for x in value))
+        elif isinstance(value, datetime):
+            return ('d', value.toordinal(), value.hour, value.minute, value.second, value.microsecond)
+        elif isinstance(value, timedelta):
+            return ('l', value.days, value.seconds, value.microseconds)
+        elif isinstance(value, (Era, SubEra)):
+            return ('r', self.get_era_code(value))
+        else:
+            return self.encode_object(value)
+
+class _ValueDecoder:
+    def __init__(self, class_paths: list[str]):
+        self.classes = [_resolve_class(path) for path in class_paths]
+        self.class_slots = [_get_slots(cls) for cls in self.classes]
+        self.eras: list[Any] = []
+
+    def decode_object(self, class_code: int, values: tuple) -> object:
+        cls = self.classes[class_code]
+        slots = self.class_slots[class_code]
+        if len(slots) != len(values):
+            raise SnapshotError(f'The attributes of {cls.__qualname__} have changed.')
+
+        obj = cls.__new__(cls)
+        for slot, value in zip(slots, values):
+            object.__setattr__(obj, slot, self.decode(value))
+
+        return obj
+
+    def decode(self, value: Any) -> Any:
+        if isinstance(value, list):
+            return [self.decode(x) for x in value]
+        elif isinstance(value, dict):
+            return {key: self.decode(x) for key, x in value.items()}
+        elif not isinstance(value, tuple):
+            return value
+
+        tag = value[0]
+        if tag == 'o':
+            return self.decode_object(value[1], value[2])
+        elif tag == 'r':
+            return self.eras[value[1]]
+        elif tag == 'e':
+            return self.classes[value[1]](value[2])
+        elif tag == 'd':
+            date = datetime.fromordinal(value[1])
+            return date.replace(hour=value[2], minute=value[3], second=value[4], microsecond=value[5])
+        elif tag == 'l':
+            return timedelta(days=value[1], seconds=value[2], microseconds=value[3])
+        else:
+            return tuple(self.decode(x) for x in value[1])
+
+class _RecordEncoder:
+    def __init__(self):
+        self.values = _ValueEncoder()
+        self.strings = _TableWriter()
+        self.blobs = _TableWriter()
+
+    def encode_field(self, entry: Entry, field: str) -> int:
+        try:
+            value = getattr(entry, field)
+        except AttributeError:
+            return _UNSET_CODE
+
+        if value is None:
+            return _NONE_CODE
+        elif type(value) is str:
+            return self.strings.add(value.encode()) << _KIND_BITS | _STRING
+        elif isinstance(value, (Era, SubEra)):
+            return self.values.get_era_code(value) << _KIND_BITS | _REF
+        else:
+            blob = marshal.dumps(self.values.encode(value))
+            return self.blobs.add(blob) << _KIND_BITS | _VALUE
+
+def _get_fields(entry_cls: type[Entry]) -> list[str]:
+    return list(dict.fromkeys(_get_slots(entry_cls)))
+
+def write_shared_snapshot(file_name: str, tabs: dict[str, Tab]):
+    """Write parsed tabs to a file that can be opened with :class:`SharedSnapshot`.
+
+    Each entry is written as a fixed-width record with a code for each attribute,
+    which refers to a table of strings or of other encoded values.
+    Equal values are only written once. The file is replaced in a single step,
+    so processes that have the old file open keep seeing the old file.
+
+    Arguments:
+        file_name: The name of the file to be written to.
+        tabs: The tabs to write, mapped to their names.
+    """
+    encoder = _RecordEncoder()
+    buffer = bytearray()
+    tab_dirs: dict[str, dict[str, Any]] = {}
+
+    for tab_name, tab in tabs.items():
+        entry_cls = tab._entry_cls
+        fields = _get_fields(entry_cls)
+
+        words = [encoder.encode_field(entry, field) for entry in tab for field in fields]
+
+        _align(buffer)
+        tab_dirs[tab_name] = {
+            'tab': _get_class_path(type(tab)),
+            'entry': _get_class_path(entry_cls),
+            'fields': fields,
+            'count': len(tab),
+            'records': len(buffer),
+            'eras': [encoder.values.get_era_code(era) for era in tab.eras]
+        }
+        buffer.extend(struct.pack(f'={len(words)}{_WORD}', *words))
+
+    strings_start = encoder.strings.write(buffer)
+    blobs_start = encoder.blobs.write(buffer)
+
+    refs = marshal.dumps(encoder.values.eras)
+    directory = json.dumps({
+        'classes': encoder.values.classes,
+        'tabs': tab_dirs,
+        'strings': [strings_start, len(encoder.strings.items)],
+        'values': [blobs_start, len(encoder.blobs.items)],
+        'refs': [len(buffer), len(refs)]
+    }).encode()
+    buffer.extend(refs)
+    _align(buffer)
+
+    header = _HEADER.pack(_MAGIC, SCHEMA_VERSION,
+                          sys.version_info.major, sys.version_info.minor,
+                          sys.byteorder == 'big', len(directory))
+
+    # Offsets in the directory are relative to the start of the data,
+    # which is aligned so that codes can be read as 32-bit words.
+    padding = bytes(-(len(header) + len(directory)) % 8)
+
+    fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(file_name)),
+                                     suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(header)
+            f.write(directory)
+            f.write(padding)
+            f.write(buffer)
+        os.replace(temp_path, file_name)
+    except BaseException:
+        with suppress(OSError):
+            os.remove(temp_path)
+        raise
+
+class SharedEntry:
+    """Base class of the entries of a :class:`SharedTab`.
+
+    A shared entry is an instance of the entry class it stands in for,
+    such as :class:`~yetracker.entry.Unreleased`, with the same attributes.
+    Each attribute is decoded from the snapshot whenever it's accessed,
+    and can't be assigned to.
+    """
+    __slots__ = ()
+
+    _tab: 'SharedTab'
+    _row: int
+
+    def __init__(self, tab: 'SharedTab', row: int):
+        object.__setattr__(self, '_tab', tab)
+        object.__setattr__(self, '_row', row)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, SharedEntry):
+            return NotImplemented
+
+        return self._tab is other._tab and self._row == other._row
+
+    def __hash__(self) -> int:
+        return hash((id(self._tab), self._row))
+
+def _field_getter(position: int) -> Callable[[SharedEntry], Any]:
+    def get_field(self: SharedEntry) -> Any:
+        return self._tab._get_field(self._row, position)
+
+    return get_field
+
+_shared_entry_classes: dict[type[Entry], type[SharedEntry]] = {}
+
+def _get_shared_entry_cls(entry_cls: type[Entry], fields: list[str]) -> type[SharedEntry]:
+    """Get a subclass of both :class:`SharedEntry` and `entry_cls`,
+    whose fields are properties that decode their value.
+    The properties take the place of the entry class's slots."""
+    shared_cls = _shared_entry_classes.get(entry_cls)
+    if shared_cls is not None:
+        return shared_cls
+
+    namespace: dict[str, Any] = {'__slots__': ('_tab', '_row')}
+    for position, field in enumerate(fields):
+        namespace[field] = property(_field_getter(position))
+
+    shared_cls = type(f'Shared{entry_cls.__name__}', (SharedEntry, entry_cls), namespace)
+    _shared_entry_classes[entry_cls] = shared_cls
+
+    return shared_cls
+
+class SharedTab[T: Entry](Sequence[T]):
+    """A read-only tab stored in a :class:`SharedSnapshot`.
+
+    Entries are :class:`SharedEntry` objects, which only decode
+    their attributes when they're accessed. Methods of the regular tab class,
+    such as :meth:`~yetracker.tab.UnreleasedTab.get_best_of`,
+    work on a regular tab of the shared entries.
+
+    Attributes:
+        eras (list[Era]): The eras of the tab.
+    """
+    def __init__(self, snapshot: 'SharedSnapshot', tab_dir: dict[str, Any]):
+        self._snapshot = snapshot
+        self._tab_cls: type[Tab[T]] = _resolve_class(tab_dir['tab'])
+
+        entry_cls = _resolve_class(tab_dir['entry'])
+        if _get_fields(entry_cls) != tab_dir['fields']:
+            raise SnapshotError(f'The attributes of {entry_cls.__qualname__} have changed.')
+
+        self._entry_cls = _get_shared_entry_cls(entry_cls, tab_dir['fields'])
+        self._width = len(tab_dir['fields'])
+        self._count: int = tab_dir['count']
+        self._start = tab_dir['records'] // 4
+        self._materialized: Tab[T] | None = None
+
+        self.eras: list[Era] = [snapshot._refs[code] for code in tab_dir['eras']]
+
+    def _get_field(self, row: int, position: int) -> Any:
+        code = self._snapshot._words[self._start + row * self._width + position]
+        return self._snapshot._decode(code)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _get_entry(self, index: int) -> T:
+        if index < 0:
+            index += self._count
+
+        if not 0 <= index < self._count:
+            raise IndexError('tab index out of range')
+
+        return self._entry_cls(self, index) # type: ignore
+
+    @overload
+    def __getitem__(self, index: int) -> T: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[T]: ...
+
+    def __getitem__(self, index: int | slice) -> T | list[T]:
+        if isinstance(index, slice):
+            return [self._get_entry(i) for i in range(*index.indices(len(self)))]
+
+        return self._get_entry(index)
+
+    def __iter__(self) -> Iterator[T]:
+        for i in range(self._count):
+            yield self._entry_cls(self, i) # type: ignore
+
+    def materialize(self) -> Tab[T]:
+        """Get the shared entries as a regular tab.
+        The entries' attributes are still decoded when they're accessed."""
+        if self._materialized is None:
+            tab = self._tab_cls([])
+            tab.extend(self)
+            tab.eras = self.eras
+            self._materialized = tab
+
+        return self._materialized
+
+    def __getattr__(self, name: str):
+        if name.startswith('_'):
+            raise AttributeError(name)
+
+        return getattr(self.materialize(), name)
+
+class SharedSnapshot:
+    """Parsed tabs written with :func:`write_shared_snapshot`, opened with `mmap`.
+
+    The file is mapped read-only, so every process that opens the same file
+    shares one copy of it in memory. Only the list of tabs and the eras
+    are decoded when the snapshot is opened; entries are decoded as they're used.
+
+    Attributes:
+        tabs (dict[str, SharedTab]): The tabs of the snapshot, mapped to their names.
+    """
+    def __init__(self, file_name: str):
+        """
+        Args:
+            file_name: The name of the file to open.
+
+        Raises:
+            SnapshotError: If the file isn't a shared snapshot, or was written
+                with a different schema, Python version, or byte order.
+        """
+        with open(file_name, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            self._open(file_name)
+        except BaseException:
+            self.close()
+            raise
+
+    def _open(self, file_name: str):
+        if len(self._mmap) < _HEADER.size:
+            raise SnapshotError(f'{file_name} is not a shared snapshot.')
+
+        magic, schema_version, major, minor, big_endian, directory_length \
+            = _HEADER.unpack_from(self._mmap)
+        if magic != _MAGIC:
+            raise SnapshotError(f'{file_name} is not a shared snapshot.')
+
+        if schema_version != SCHEMA_VERSION \
+                or (major, minor) != sys.version_info[:2] \
+                or bool(big_endian) != (sys.byteorder == 'big'):
+            raise SnapshotError(f'{file_name} was written by an incompatible version.')
+
+        directory_end = _HEADER.size + directory_length
+        directory = json.loads(self._mmap[_HEADER.size:directory_end])
+
+        data_start = directory_end + -directory_end % 8
+        self._bytes = memoryview(self._mmap)[data_start:]
+        self._words = self._bytes.cast(_WORD)
+
+        self._decoder = _ValueDecoder(directory['classes'])
+        self._strings_start = directory['strings'][0] // 4
+        self._values_start = directory['values'][0] // 4
+
+        refs_start, refs_length = directory['refs']
+        encoded_refs = marshal.loads(self._bytes[refs_start:refs_start + refs_length])
+
+        # Eras and suberas only refer to primitive values, so they can be decoded in any order.
+        self._refs: list[Era | SubEra] = [self._decoder.decode(ref) for ref in encoded_refs]
+        self._decoder.eras = self._refs
+
+        self.tabs: dict[str, SharedTab] = {
+            tab_name: SharedTab(self, tab_dir)
+            for tab_name, tab_dir in directory['tabs'].items()
+        }
+
+    def _decode(self, code: int) -> Any:
+        kind = code & _KIND_MASK
+        index = code >> _KIND_BITS
+
+        if kind == _STRING:
+            start = self._strings_start + index
+            return str(self._bytes[self._words[start]:self._words[start + 1]], 'utf-8')
+        elif kind == _VALUE:
+            start = self._values_start + index
+            blob = self._bytes[self._words[start]:self._words[start + 1]]
+            return self._decoder.decode(marshal.loads(blob))
+        elif kind == _REF:
+            return self._refs[index]
+        elif code == _NONE_CODE:
+            return None
+        else:
+            raise AttributeError('The attribute was not set on the entry.')
+
+    def __getitem__(self, tab_name: str) -> SharedTab:
+        return self.tabs[tab_name]
+
+    def close(self):
+        """Unmap the file. The snapshot's tabs and entries can't be used afterwards."""
+        for view in (getattr(self, '_words', None), getattr(self, '_bytes', None)):
+            if view is not None:
+                view.release()
+
+        self._mmap.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
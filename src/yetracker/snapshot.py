@@ -0,0 +1,469 @@
+from collections import deque
+from datetime import datetime, timedelta
+from enum import Enum
+from typing import Any, Iterable
+import importlib
+import json
+import marshal
+import struct
+import sys
+import zlib
+
+from yetracker._raw_values import RawTabDict, RawValuesFetcher, Range
+from yetracker.entry import PartialEntry
+from yetracker.tab import Tab
+
+__all__ = [
+    'save_snapshot',
+    'load_snapshot',
+    'SnapshotRawValues',
+    'SnapshotError'
+]
+
+_MAGIC = b'YTSNAP'
+#: Increase whenever the encoding of parsed values changes.
+SCHEMA_VERSION = 2
+
+# Magic, schema version, Python major and minor version, length of the raw section.
+_HEADER = struct.Struct('>6sHBBI')
+
+class SnapshotError(Exception):
+    pass
+
+def _get_class_path(cls: type) -> str:
+    return f'{cls.__module__}:{cls.__qualname__}'
+
+def _resolve_class(path: str) -> type:
+    """Get a class by the path written by :func:`_get_class_path`.  
+    Only classes of this package can be loaded, so that a snapshot 
+    can't import arbitrary modules."""
+    module_name, _, qualname = path.partition(':')
+    if module_name != 'yetracker' and not module_name.startswith('yetracker.'):
+        raise SnapshotError(f'{path} is not a class of yetracker.')
+
+    obj: Any = importlib.import_module(module_name)
+    for name in qualname.split('.'):
+        obj = getattr(obj, name)
+
+    if not isinstance(obj, type):
+        raise SnapshotError(f'{path} is not a class.')
+
+    return obj
+
+def _get_slots(cls: type) -> list[str]:
+    slots: list[str] = []
+    for base in reversed(cls.__mro__):
+        base_slots = base.__dict__.get('__slots__', ())
+        slots.extend((base_slots,) if isinstance(base_slots, str) else base_slots)
+
+    return slots
+
+def _get_slot_setters(cls: type) -> list[Any]:
+    """Get the function that sets each slot of a class, in the order of :func:`_get_slots`.  
+    The slots' descriptors are used directly, so that neither `__setattr__` 
+    nor properties of subclasses with the same name get in the way."""
+    setters: list[Any] = []
+    for base in reversed(cls.__mro__):
+        base_slots = base.__dict__.get('__slots__', ())
+        for slot in (base_slots,) if isinstance(base_slots, str) else base_slots:
+            setters.append(base.__dict__[slot].__set__)
+
+    return setters
+
+def _is_plain(value: object) -> bool:
+    """Whether `marshal` writes a value as it is, to be read back unchanged."""
+    if value is None or type(value) in (str, int, float, bool):
+        return True
+    elif type(value) is list:
+        return all(_is_plain(x) for x in value) # type: ignore
+    elif type(value) is dict:
+        return all(_is_plain(key) and _is_plain(x) for key, x in value.items()) # type: ignore
+
+    return False
+
+# How the values of a slot are written, for every object of a class. 
+# Each kind is read back with one function for the whole column, 
+# instead of checking the type of each value.
+_PLAIN = 0 #: Strings, numbers, `None`, and lists and dicts of them, as they are.
+_ENUM = 1 #: Members of one enum, or `None`, as their values.
+_ENUM_LIST = 2 #: Lists of members of one enum, or `None`.
+_REF = 3 #: Objects of one class, as their index in the class's table, or strings or `None`.
+_REF_LIST = 4 #: Lists of objects of one class, or `None`.
+_DATETIME = 5 #: Datetimes, as tuples, or strings or `None`.
+_TIMEDELTA = 6 #: Timedeltas, as tuples, or `None`.
+_GENERIC = 7 #: Anything else, with a tag for each value that isn't plain.
+
+def _encode_datetime(value: datetime) -> tuple:
+    return (value.year, value.month, value.day, 
+            value.hour, value.minute, value.second, value.microsecond)
+
+def _decode_datetime(value: tuple) -> datetime:
+    return datetime(*value)
+
+def _encode_timedelta(value: timedelta) -> tuple:
+    return (value.days, value.seconds, value.microseconds)
+
+def _decode_timedelta(value: tuple) -> timedelta:
+    return timedelta(*value)
+
+class _Encoder:
+    """Writes the objects making up parsed tabs as a table per class, 
+    with one flat tuple per slot, holding the slot's value for every object of the class.  
+
+    Objects are referred to by their class's index in :attr:`classes` 
+    and their index in the class's table, so objects shared between entries, 
+    such as eras, are written once."""
+    def __init__(self):
+        self.classes: list[str] = []
+        self._types: list[type] = []
+        self._class_codes: dict[type, int] = {}
+        #: The slot values of each object of each class, by class code.
+        self._rows: list[list[tuple]] = []
+        self._refs: dict[int, tuple[int, int]] = {}
+        # Keeps the objects alive, so that their `id` isn't reused.
+        self._objects: list[object] = []
+
+    def get_class_code(self, cls: type) -> int:
+        code = self._class_codes.get(cls)
+        if code is None:
+            code = self._class_codes[cls] = len(self.classes)
+            self.classes.append(_get_class_path(cls))
+            self._types.append(cls)
+            self._rows.append([])
+
+        return code
+
+    def add(self, obj: object) -> tuple[int, int]:
+        """Add an object, and the objects it refers to, to the tables of their classes."""
+        ref = self._refs.get(id(obj))
+        if ref is not None:
+            return ref
+
+        # Partial entries are written as the entry class they stand in for, 
+        # and getting each of their attributes parses the rest of them.
+        cls = obj._entry_cls if isinstance(obj, PartialEntry) else type(obj)
+        code = self.get_class_code(cls)
+        rows = self._rows[code]
+        ref = self._refs[id(obj)] = (code, len(rows))
+        self._objects.append(obj)
+
+        rows.append(())
+        values = tuple(getattr(obj, slot, None) for slot in _get_slots(cls))
+        rows[ref[1]] = values
+        for value in values:
+            self._add_nested(value)
+
+        return ref
+
+    def _add_nested(self, value: object):
+        if isinstance(value, Enum):
+            self.get_class_code(type(value))
+        elif isinstance(value, (list, tuple)):
+            for x in value:
+                self._add_nested(x)
+        elif isinstance(value, dict):
+            for x in value.values():
+                self._add_nested(x)
+        elif not (value is None or isinstance(value, (str, int, float, datetime, timedelta))):
+            self.add(value)
+
+    def add_refs(self, objects: Iterable[object]) -> tuple[tuple[int, ...], tuple[int, ...]]:
+        """Add objects, returning the class code and the index of each of them."""
+        refs = [self.add(obj) for obj in objects]
+        return tuple(code for code, _ in refs), tuple(index for _, index in refs)
+
+    def _get_kind(self, values: list) -> tuple[int, int | None]:
+        """Get the kind of a column, and the class it refers to, if any."""
+        if all(_is_plain(value) for value in values):
+            return _PLAIN, None
+
+        present = [value for value in values if value is not None]
+        # Checked first, since some enums are also strings.
+        if all(isinstance(value, Enum) for value in present):
+            classes = {type(value) for value in present}
+            if len(classes) == 1:
+                return _ENUM, self._class_codes[classes.pop()]
+        
+        others = [value for value in present if type(value) is not str]
+        if all(isinstance(value, datetime) for value in others):
+            return _DATETIME, None
+        if len(others) == len(present) and all(type(value) is timedelta for value in others):
+            return _TIMEDELTA, None
+
+        codes = {self._refs.get(id(value), (None,))[0] for value in others}
+        if len(codes) == 1 and None not in codes:
+            return _REF, codes.pop()
+
+        if len(others) == len(present) and all(type(value) is list for value in present):
+            items = [x for value in present for x in value]
+            if all(isinstance(x, Enum) for x in items):
+                classes = {type(x) for x in items}
+                if len(classes) == 1:
+                    return _ENUM_LIST, self._class_codes[classes.pop()]
+            codes = {self._refs.get(id(x), (None,))[0] for x in items}
+            if len(codes) == 1 and None not in codes:
+                return _REF_LIST, codes.pop()
+
+        return _GENERIC, None
+
+    def _encode_column(self, kind: int, values: list) -> tuple:
+        refs = self._refs
+        if kind == _PLAIN:
+            return tuple(values)
+        elif kind == _ENUM:
+            return tuple(None if value is None else value.value for value in values)
+        elif kind == _ENUM_LIST:
+            return tuple(None if value is None else [x.value for x in value] for value in values)
+        elif kind == _REF:
+            return tuple(value if value is None or type(value) is str else refs[id(value)][1] 
+                         for value in values)
+        elif kind == _REF_LIST:
+            return tuple(None if value is None else [refs[id(x)][1] for x in value] 
+                         for value in values)
+        elif kind == _DATETIME:
+            return tuple(_encode_datetime(value) if isinstance(value, datetime) else value 
+                         for value in values)
+        elif kind == _TIMEDELTA:
+            return tuple(None if value is None else _encode_timedelta(value) for value in values)
+        else:
+            return tuple(self.encode(value) for value in values)
+
+    def encode(self, value: object) -> Any:
+        """Write a value of a generic column, with tags for values that aren't plain."""
+        if isinstance(value, Enum):
+            return ('e', self._class_codes[type(value)], value.value)
+        elif value is None or isinstance(value, (str, int, float)):
+            return value
+        elif isinstance(value, list):
+            return [self.encode(x) for x in value]
+        elif isinstance(value, dict):
+            return {key: self.encode(x) for key, x in value.items()}
+        elif isinstance(value, tuple):
+            return ('t', tuple(self.encode(x) for x in value))
+        elif isinstance(value, datetime):
+            return ('d', *_encode_datetime(value))
+        elif isinstance(value, timedelta):
+            return ('l', *_encode_timedelta(value))
+        else:
+            return ('o', *self._refs[id(value)])
+
+    def get_tables(self) -> list[tuple | None]:
+        """Get the slots of each class, along with the kind and values of each slot, 
+        or `None` for enums."""
+        tables: list[tuple | None] = []
+        for cls, rows in zip(self._types, self._rows):
+            if len(rows) == 0:
+                tables.append(None)
+                continue
+
+            slots = _get_slots(cls)
+            columns = []
+            for values in map(list, zip(*rows)) if slots else []:
+                kind, class_code = self._get_kind(values)
+                columns.append((kind, class_code, self._encode_column(kind, values)))
+
+            tables.append((tuple(slots), len(rows), tuple(columns)))
+
+        return tables
+
+class _Decoder:
+    def __init__(self, class_paths: list[str], tables: list[tuple | None]):
+        self.classes = [_resolve_class(path) for path in class_paths]
+        self.tables = tables
+        #: The objects of each class, created empty before any of their slots are set.
+        self.objects: list[list[Any]] = []
+
+        for cls, table in zip(self.classes, tables):
+            if table is None:
+                self.objects.append([])
+                continue
+
+            slots, count, _ = table
+            if list(slots) != _get_slots(cls):
+                raise SnapshotError(f'The attributes of {cls.__qualname__} have changed.')
+
+            new = cls.__new__
+            self.objects.append([new(cls) for _ in range(count)])
+
+    def fill(self):
+        """Set the slots of every object, one slot of a class at a time."""
+        for cls, table, objects in zip(self.classes, self.tables, self.objects):
+            if table is None:
+                continue
+
+            _, _, columns = table
+            for setter, (kind, class_code, values) in zip(_get_slot_setters(cls), columns):
+                # Consumes the iterator without keeping the results.
+                deque(map(setter, objects, self._decode_column(kind, class_code, values)), maxlen=0)
+
+    def _decode_column(self, kind: int, class_code: int | None, values: tuple) -> Iterable[Any]:
+        if kind == _PLAIN:
+            return values
+        elif kind == _ENUM or kind == _ENUM_LIST:
+            members = {member.value: member for member in self.classes[class_code]} # type: ignore
+            if kind == _ENUM:
+                return [None if value is None else members[value] for value in values]
+            return [None if value is None else [members[x] for x in value] for value in values]
+        elif kind == _REF:
+            objects = self.objects[class_code] # type: ignore
+            return [objects[value] if type(value) is int else value for value in values]
+        elif kind == _REF_LIST:
+            objects = self.objects[class_code] # type: ignore
+            return [None if value is None else [objects[x] for x in value] for value in values]
+        elif kind == _DATETIME:
+            return [_decode_datetime(value) if type(value) is tuple else value for value in values]
+        elif kind == _TIMEDELTA:
+            return [None if value is None else _decode_timedelta(value) for value in values]
+        else:
+            return [self.decode(value) for value in values]
+
+    def decode(self, value: Any) -> Any:
+        if isinstance(value, list):
+            return [self.decode(x) for x in value]
+        elif isinstance(value, dict):
+            return {key: self.decode(x) for key, x in value.items()}
+        elif not isinstance(value, tuple):
+            return value
+
+        tag = value[0]
+        if tag == 'o':
+            return self.objects[value[1]][value[2]]
+        elif tag == 'e':
+            return self.classes[value[1]](value[2])
+        elif tag == 'd':
+            return _decode_datetime(value[1:])
+        elif tag == 'l':
+            return _decode_timedelta(value[1:])
+        else:
+            return tuple(self.decode(x) for x in value[1])
+
+    def get_refs(self, refs: tuple[tuple[int, ...], tuple[int, ...]]) -> list[Any]:
+        objects = self.objects
+        return [objects[code][index] for code, index in zip(*refs)]
+
+class SnapshotRawValues(RawValuesFetcher):
+    """The raw values saved in a snapshot, 
+    which are only decompressed and decoded once they're needed."""
+    def __init__(self, compressed: bytes):
+        super().__init__()
+        self.authenticated = True
+        self._compressed = compressed
+        self._section: dict[str, Any] | None = None
+
+    def _get_section(self) -> dict[str, Any]:
+        if self._section is None:
+            self._section = json.loads(zlib.decompress(self._compressed))
+            self._compressed = b''
+
+        return self._section
+
+    @property
+    def tab_classes(self) -> dict[str, str]:
+        """The path of each tab's class, by the tab's name."""
+        return self._get_section()['tabs']
+
+    def to_list(self) -> list[RawTabDict]:
+        """Get the raw values of every tab."""
+        return self._get_section()['raw']
+
+    def get_raw_values(self, tab_name: str) -> Range:
+        for raw_tab in self.to_list():
+            if raw_tab['range'] == tab_name:
+                return raw_tab['values']
+
+        raise KeyError(f'The snapshot has no tab named {tab_name!r}.')
+
+    def authenticate(self, *args) -> Any:
+        pass
+
+def save_snapshot(file_name: str, tabs: dict[str, tuple[Range, Tab]]):
+    """Write parsed tabs, along with the raw values they were parsed from, to a file.
+
+    Arguments:
+        file_name: The name of the file to be written to.
+        tabs: The raw values and parsed tab of each tab, mapped to the tab's name.
+    """
+    raw_section = {
+        'tabs': {tab_name: _get_class_path(type(tab)) for tab_name, (_, tab) in tabs.items()},
+        'raw': [{'range': tab_name, 'values': raw_values} 
+                for tab_name, (raw_values, _) in tabs.items()]
+    }
+    raw_bytes = zlib.compress(json.dumps(raw_section).encode())
+
+    encoder = _Encoder()
+    parsed_tabs: dict[str, tuple] = {}
+    for tab_name, (_, tab) in tabs.items():
+        parsed_tabs[tab_name] = (
+            encoder.get_class_code(type(tab)), 
+            encoder.add_refs(tab.eras), 
+            encoder.add_refs(tab)
+        )
+
+    tables = encoder.get_tables()
+    parsed_bytes = marshal.dumps((encoder.classes, tables, parsed_tabs))
+
+    header = _HEADER.pack(_MAGIC, SCHEMA_VERSION, 
+                          sys.version_info.major, sys.version_info.minor, 
+                          len(raw_bytes))
+
+    with open(file_name, 'wb') as f:
+        f.write(header)
+        f.write(raw_bytes)
+        f.write(parsed_bytes)
+
+def load_snapshot(file_name: str) -> tuple[dict[str, Tab], SnapshotRawValues]:
+    """Read the tabs written by :func:`save_snapshot`, without parsing them again.  
+    If the snapshot was written with a different schema or Python version, 
+    or the entry classes have changed since, 
+    the tabs are parsed from the snapshot's raw values instead.
+
+    Arguments:
+        file_name: The name of the file to read.
+
+    Returns:
+        The tabs mapped to their names, and the raw values of the tabs, 
+        which are only decoded if the tabs had to be parsed again, 
+        or once they're first used.
+    """
+    with open(file_name, 'rb') as f:
+        header = f.read(_HEADER.size)
+        if len(header) < _HEADER.size:
+            raise SnapshotError(f'{file_name} is not a snapshot.')
+
+        magic, schema_version, major, minor, raw_length = _HEADER.unpack(header)
+        if magic != _MAGIC:
+            raise SnapshotError(f'{file_name} is not a snapshot.')
+
+        raw_values = SnapshotRawValues(f.read(raw_length))
+        parsed_bytes = f.read()
+
+    compatible = schema_version == SCHEMA_VERSION \
+        and (major, minor) == sys.version_info[:2]
+
+    if compatible:
+        try:
+            return _decode_tabs(marshal.loads(parsed_bytes)), raw_values
+        except (SnapshotError, ValueError, TypeError, AttributeError, ImportError, 
+                IndexError, KeyError, EOFError):
+            pass
+
+    tabs: dict[str, Tab] = {}
+    for raw_tab in raw_values.to_list():
+        tab_cls = _resolve_class(raw_values.tab_classes[raw_tab['range']])
+        tabs[raw_tab['range']] = tab_cls(raw_tab['values'])
+
+    return tabs, raw_values
+
+def _decode_tabs(parsed: tuple) -> dict[str, Tab]:
+    class_paths, tables, parsed_tabs = parsed
+    decoder = _Decoder(class_paths, tables)
+    decoder.fill()
+
+    tabs: dict[str, Tab] = {}
+    for tab_name, (class_code, era_refs, entry_refs) in parsed_tabs.items():
+        tab = decoder.classes[class_code]([])
+        tab.extend(decoder.get_refs(entry_refs))
+        tab.eras = decoder.get_refs(era_refs)
+        tabs[tab_name] = tab
+
+    return tabs
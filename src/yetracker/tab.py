@@ -1,11 +1,24 @@
 from abc import ABC, abstractmethod
-from typing import Any, TypeGuard
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from functools import wraps
+from itertools import repeat
+from typing import (
+    Any, Callable, Generator, Hashable, Iterable, Iterator, Self, Sequence, TypeGuard, overload
+)
 import json
 import pprint
+import time
 
+from yetracker.column import parse_cache
+from yetracker.columnar import ColumnarTab
+from yetracker.diagnostics import Diagnostics, collecting, report_unmatched_era
 from yetracker.common import *
 from yetracker.era import *
 from yetracker.entry import *
+from yetracker.entry import _copy_entry, _get_partial_entry_cls
+from yetracker.instrument import Tracer, get_tracer, untraced
 
 class _EraManager:
     def __init__(self, 
@@ -23,17 +36,28 @@ class _EraManager:
         self._current_era: Era | None = None
         self._current_subera: SubEra | None = None
 
+        #: Eras and suberas of an earlier build of the tab, by their type and repr, 
+        #: which are used instead of newly parsed ones with the same contents.
+        self._reusable: dict[tuple[type, str], deque[Era | SubEra]] = {}
+
+    def _reuse[E: Era | SubEra](self, parsed: E) -> E:
+        if not self._reusable:
+            return parsed
+
+        matches = self._reusable.get((type(parsed), repr(parsed)))
+        return matches.popleft() if matches else parsed # type: ignore
+
     def manage_era(self, row: Row) -> bool:
         if self.no_eras:
             return False
 
         if self._era_cls._is_era(row):
-            era = self._era_cls(row)
+            era = self._reuse(self._era_cls(row))
             self._current_era = era
             self._current_subera = None
             self.eras.append(era)
         elif self._subera_cls._is_subera(row):
-            subera = self._subera_cls(row)
+            subera = self._reuse(self._subera_cls(row))
             self._current_subera = subera
             self.suberas.append(subera)
         else:
@@ -48,8 +72,62 @@ class _EraManager:
         if self._current_subera is not None:
             entry.set_subera(self._current_subera)
         
+def _normalize_name(name: str) -> str:
+    return name.strip().casefold()
+
+def _index_attr(attr: str) -> Callable[[Entry], Iterable[Hashable]]:
+    return lambda entry: (getattr(entry, attr, None),)
+
+_INDEX_KEYS: dict[str, Callable[[Entry], Iterable[Hashable]]] = {
+    'emoji': lambda entry: getattr(entry, 'emojis', ()),
+    'era': _index_attr('era'),
+    'era_name': _index_attr('era_name'),
+    'subera': _index_attr('subera'),
+    'quality': _index_attr('quality'),
+    'available_length': _index_attr('available_length'),
+    'type': _index_attr('type'),
+    'artist': _index_attr('artist'),
+    'main_name': lambda entry: (_normalize_name(getattr(entry, 'main_name', '')),)
+}
+
+def _clears_indexes[F: Callable](method: F) -> F:
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        # Lists are filled before their attributes are restored when unpickled.
+        indexes = getattr(self, '_indexes', None)
+        if indexes:
+            indexes.clear()
+
+        return method(self, *args, **kwargs)
+
+    return wrapper # type: ignore
+
 class Tab[T: Entry](list[T], ABC):
-    "Base class for a tab/sheet within a tracker."
+    """Base class for a tab/sheet within a tracker.  
+
+    Tabs can be filtered with :meth:`where`, which looks entries up 
+    in hash indexes that are built the first time they're needed.
+    Modifying the tab discards the indexes.
+
+    Attributes:
+        diagnostics (Diagnostics): The cells that couldn't be parsed 
+            while the tab was built.
+        fields (frozenset[str] | None): The attributes of the entries that were 
+            parsed up front, or `None` if all of them were.
+    """
+
+    append = _clears_indexes(list.append)
+    extend = _clears_indexes(list.extend)
+    insert = _clears_indexes(list.insert)
+    remove = _clears_indexes(list.remove)
+    pop = _clears_indexes(list.pop)
+    clear = _clears_indexes(list.clear)
+    sort = _clears_indexes(list.sort)
+    reverse = _clears_indexes(list.reverse)
+    __setitem__ = _clears_indexes(list.__setitem__)
+    __delitem__ = _clears_indexes(list.__delitem__)
+    __iadd__ = _clears_indexes(list.__iadd__)
+    __imul__ = _clears_indexes(list.__imul__)
 
     @property
     @abstractmethod
@@ -66,18 +144,176 @@ class Tab[T: Entry](list[T], ABC):
     def _is_end(self, row: Row) -> bool:
         return False
 
-    def __init__(self, raw_values: Range):
+    def __init__(self, raw_values: Range, workers: int | None = None, 
+                 fields: Iterable[str] | None = None):
         """
         Args:
             values: The two-dimensional array representing 
                 a range of cells, or its JSON.
+            workers: The number of processes to parse entries in.
+                By default, entries are parsed in the current process.
+            fields: The attributes of the entries to parse up front, 
+                e.g. ``{'main_name', 'quality', 'era'}``. The other attributes 
+                of an entry are parsed the first time one of them is accessed.
+                By default, every attribute is parsed up front.
         """
 
         super().__init__()
+        self._indexes: dict[str, dict[Hashable, list[int]]] = {}
+        self.diagnostics = Diagnostics()
+        self._set_fields(fields)
+
+        if not raw_values:
+            # Empty tabs are made to get at a tab's rules, so they aren't traced.
+            self._build_all(raw_values, workers)
+            return
+
+        tracer = get_tracer()
+        with collecting(self.diagnostics):
+            if tracer is not None:
+                self._build_traced(raw_values, workers, tracer)
+            else:
+                self._build_all(raw_values, workers)
+
+    def _set_fields(self, fields: Iterable[str] | None):
+        self.fields: frozenset[str] | None = None
+        self._partial_entry_cls: type[PartialEntry] | None = None
+
+        if fields is None:
+            return
+
+        self.fields = frozenset(fields)
+        unknown = self.fields - self._entry_cls._fields
+        if unknown:
+            raise ValueError(f'{self._entry_cls.__name__} has no fields {sorted(unknown)}; '
+                             f'the fields are {sorted(self._entry_cls._fields)}.')
+
+        self._partial_entry_cls = _get_partial_entry_cls(self._entry_cls)
+
+    def __getstate__(self) -> dict[str, Any]:
+        # Partial entry classes are made at runtime, so they can't be pickled.
+        state = self.__dict__.copy()
+        state.pop('_partial_entry_cls', None)
+        return state
+
+    def __setstate__(self, state: dict[str, Any]):
+        self.__dict__.update(state)
+        self._set_fields(state.get('fields'))
+
+    def _build_all(self, raw_values: Range, workers: int | None):
+        if workers is not None and workers > 1:
+            self._build_parallel(raw_values, workers)
+            return
         
         era_manager = self._get_era_manager()
+        self._build(enumerate(raw_values), era_manager)
+        self.eras = era_manager.eras
 
-        for i, row in enumerate(raw_values):
+    def _build_traced(self, raw_values: Range, workers: int | None, tracer: Tracer):
+        hits, misses = parse_cache.hits, parse_cache.misses
+
+        with tracer.span('parse'):
+            self._build_all(raw_values, workers)
+
+            tracer.count('parse_cache.hit', parse_cache.hits - hits)
+            tracer.count('parse_cache.miss', parse_cache.misses - misses)
+            tracer.count('parse_errors', self.diagnostics.total)
+
+    @classmethod
+    def iter_entries(cls, rows: Iterable[Row]) -> Iterator[T]:
+        """Parse rows into entries one at a time, without keeping 
+        the rows or the entries. Entries are linked to their eras 
+        and suberas the same way as in a regular tab.
+
+        Args:
+            rows: The rows of the tab, which can be any iterable, 
+                such as a generator that reads them from a file.
+        """
+        rules = cls([])
+        era_manager = rules._get_era_manager()
+
+        for row in rules._iter_entry_rows(enumerate(rows), era_manager):
+            yield rules._make_entry(row, era_manager._current_era, era_manager._current_subera)
+
+    def _get_index(self, key: str) -> dict[Hashable, list[int]]:
+        """Get the index mapping each value of `key` 
+        to the positions of the entries with that value."""
+        index = self._indexes.get(key)
+        if index is not None:
+            return index
+
+        get_values = _INDEX_KEYS[key]
+        index = {}
+        for i, entry in enumerate(self):
+            for value in get_values(entry):
+                positions = index.setdefault(value, [])
+                if len(positions) == 0 or positions[-1] != i:
+                    positions.append(i)
+
+        self._indexes[key] = index
+        return index
+
+    def _subtab(self, positions: Iterable[int]) -> Self:
+        new_tab = type(self)([], fields=self.fields)
+        new_tab.eras = self.eras
+        new_tab.extend(list.__getitem__(self, i) for i in positions)
+
+        return new_tab
+
+    def where(self, **conditions: Hashable) -> Self:
+        """Returns a filtered tab with only the entries that match every condition,
+        e.g. ``tab.where(quality=QualityEnum.LOSSLESS, era=tab.eras[0])``.
+
+        The supported conditions are `emoji`, `era`, `era_name`, `subera`, 
+        `quality`, `available_length`, `type`, `artist`, and `main_name`, 
+        which is matched case-insensitively.
+
+        Raises:
+            ValueError: If a condition isn't one of the supported ones.
+        """
+        unknown = conditions.keys() - _INDEX_KEYS.keys()
+        if unknown:
+            raise ValueError(f'Unsupported conditions {sorted(unknown)}; '
+                             f'the supported conditions are {list(_INDEX_KEYS)}.')
+
+        positions: list[int] | None = None
+
+        for key, value in conditions.items():
+            if key == 'main_name' and isinstance(value, str):
+                value = _normalize_name(value)
+
+            matched = self._get_index(key).get(value, [])
+
+            if positions is None:
+                positions = matched
+            else:
+                matched_set = set(matched)
+                positions = [i for i in positions if i in matched_set]
+
+        if positions is None:
+            positions = range(len(self))
+
+        return self._subtab(positions)
+
+    def to_columns(self) -> ColumnarTab:
+        """Get a :class:`~yetracker.columnar.ColumnarTab` 
+        of the tab's entries, for fast aggregate queries."""
+        return ColumnarTab(self)
+
+    def _iter_entry_rows(self, 
+                         rows: Iterable[tuple[int, Row]], 
+                         era_manager: _EraManager) -> Generator[Row, None, bool]:
+        """Yield the numbered rows that hold entries, 
+        updating `era_manager` with the era rows along the way.
+
+        Returns:
+            Whether the end of the tab was reached.
+        """
+        tracer = get_tracer()
+        if tracer is not None:
+            return (yield from self._iter_entry_rows_traced(rows, era_manager, tracer))
+
+        for i, row in rows:
             if self._ignore_row(i, row):
                 continue
 
@@ -85,17 +321,421 @@ class Tab[T: Entry](list[T], ABC):
                 continue
             
             if self._is_end(row):
-                break
-            
+                return True
+
+            yield row
+
+        return False
+
+    def _iter_entry_rows_traced(self, 
+                                rows: Iterable[tuple[int, Row]], 
+                                era_manager: _EraManager,
+                                tracer: Tracer) -> Generator[Row, None, bool]:
+        """Same as :meth:`_iter_entry_rows`, but counting each kind of row 
+        and timing era detection, for `tracer`."""
+        counts = dict.fromkeys(['rows', 'ignored_rows', 'era_rows', 'subera_rows', 'entry_rows'], 0)
+        era_seconds = 0.0
+
+        try:
+            for i, row in rows:
+                counts['rows'] += 1
+
+                if self._ignore_row(i, row):
+                    counts['ignored_rows'] += 1
+                    continue
+
+                subera_count = len(era_manager.suberas)
+                start = time.perf_counter()
+                is_era = era_manager.manage_era(row)
+                era_seconds += time.perf_counter() - start
+
+                if is_era:
+                    if len(era_manager.suberas) > subera_count:
+                        counts['subera_rows'] += 1
+                    else:
+                        counts['era_rows'] += 1
+                    continue
+                
+                if self._is_end(row):
+                    return True
+
+                counts['entry_rows'] += 1
+                yield row
+
+            return False
+        finally:
+            if counts['rows']:
+                for name, value in counts.items():
+                    tracer.count(name, value)
+                tracer.add_span('eras', era_seconds)
+
+    def _make_entry(self, row: Row, era: Era | None, subera: SubEra | None) -> T:
+        if self._partial_entry_cls is None:
             entry = self._entry_cls(row)
+        else:
+            entry: T = self._partial_entry_cls._from_row(row, self.fields) # type: ignore
+
+        if isinstance(entry, WithEras):
+            if era is not None:
+                entry.set_era(era)
 
-            if isinstance(entry, WithEras):
-                era_manager.set_era_and_subera(entry)
+                era_name = getattr(era, 'main_name', None)
+                if era_name is not None and row[0] != era_name:
+                    report_unmatched_era(row[0], era_name)
 
-            self.append(entry)
+            if subera is not None:
+                entry.set_subera(subera)
+
+        return entry
+
+    def _relink_entry(self, entry: T, era: Era | None, subera: SubEra | None) -> T:
+        """Get an existing entry as it belongs under `era` and `subera`.  
+        The entry is still part of the tab it came from, so it's copied 
+        instead of changed if its era or subera is different."""
+        if not isinstance(entry, WithEras):
+            return entry
+
+        new_era = entry.era_name if era is None else era
+        if entry.era == new_era and entry.subera is subera:
+            return entry
+
+        entry = _copy_entry(entry)
+        entry.era = new_era
+        entry.subera = subera
+        return entry
+
+    def _get_reusable_eras(self) -> dict[tuple[type, str], deque[Era | SubEra]]:
+        """Get the eras and suberas of this tab, to be reused by a rebuild 
+        (see :attr:`_EraManager._reusable`)."""
+        found: dict[int, Era | SubEra] = {id(era): era for era in getattr(self, 'eras', [])}
+        for entry in self:
+            if isinstance(entry, WithEras) and entry.subera is not None:
+                found.setdefault(id(entry.subera), entry.subera)
+
+        reusable: dict[tuple[type, str], deque[Era | SubEra]] = {}
+        for era in found.values():
+            reusable.setdefault((type(era), repr(era)), deque()).append(era)
+
+        return reusable
+
+    def _entry_key(self, row: Row) -> tuple[str, ...]:
+        """Get the part of an entry row that identifies the entry, 
+        used to tell a modified entry apart from an added one."""
+        return tuple(row[:2])
+
+    def _rebuild(self, old_raw_values: Range, raw_values: Range) -> 'ChangeSet[T]':
+        """Build the tab again from new values, only parsing the entry rows 
+        that differ from `old_raw_values`, the values this tab was built from.  
+        The entries of unchanged rows are shared with the new tab, or copied 
+        if their era or subera changed, so that this tab is left as it was."""
+        new_tab = type(self)([], fields=self.fields)
+        with collecting(new_tab.diagnostics):
+            return self._rebuild_into(new_tab, old_raw_values, raw_values)
+
+    def _rebuild_into(self, new_tab: 'Tab[T]', old_raw_values: Range, raw_values: Range) -> 'ChangeSet[T]':
+
+        # Only the new rows are counted by tracers, as the old ones aren't parsed.
+        with untraced():
+            old_rows = list(self._iter_entry_rows(enumerate(old_raw_values), self._get_era_manager()))
+        if len(old_rows) != len(self):
+            # The tab was modified since it was built, so its rows can't be matched up.
+            era_manager = new_tab._get_era_manager()
+            new_tab._build(enumerate(raw_values), era_manager)
+            new_tab.eras = era_manager.eras
+            return ChangeSet(new_tab, added=list(new_tab), removed=list(self))
+
+        unchanged: dict[tuple[str, ...], deque[tuple[Row, T]]] = {}
+        for row, entry in zip(old_rows, self):
+            unchanged.setdefault(tuple(row), deque()).append((row, entry))
+
+        reused: set[int] = set()
+        parsed: list[tuple[Row, T]] = []
+
+        # Eras and suberas that didn't change are kept, so that most entries 
+        # of unchanged rows can be shared with this tab as they are.
+        era_manager = new_tab._get_era_manager()
+        era_manager._reusable = self._get_reusable_eras()
+
+        for row in new_tab._iter_entry_rows(enumerate(raw_values), era_manager):
+            era = era_manager._current_era
+            subera = era_manager._current_subera
+
+            matches = unchanged.get(tuple(row))
+            if matches:
+                _, old_entry = matches.popleft()
+                entry = new_tab._relink_entry(old_entry, era, subera)
+                reused.add(id(old_entry))
+            else:
+                entry = new_tab._make_entry(row, era, subera)
+                parsed.append((row, entry))
+
+            new_tab.append(entry)
+
+        new_tab.eras = era_manager.eras
+
+        # Old entries whose rows weren't reused were either modified or removed.
+        leftovers: dict[tuple[str, ...], deque[T]] = {}
+        for row, entry in zip(old_rows, self):
+            if id(entry) not in reused:
+                leftovers.setdefault(self._entry_key(row), deque()).append(entry)
+
+        changes = ChangeSet(new_tab)
+        for row, entry in parsed:
+            key = self._entry_key(row)
+            old_entries = leftovers.get(key)
+            if old_entries:
+                old_entry = old_entries.popleft()
+                changes.modified.append((old_entry, entry))
+                changes._keys[id(old_entry)] = key
+            else:
+                changes.added.append(entry)
+            changes._keys[id(entry)] = key
+
+        modified_old = {id(old_entry) for old_entry, _ in changes.modified}
+        for row, entry in zip(old_rows, self):
+            if id(entry) not in reused and id(entry) not in modified_old:
+                changes.removed.append(entry)
+                changes._keys[id(entry)] = self._entry_key(row)
+
+        return changes
+
+    def _build(self, rows: Iterable[tuple[int, Row]], era_manager: _EraManager) -> bool:
+        """Parse numbered rows into entries, appending them to the tab.
+
+        Returns:
+            Whether the end of the tab was reached.
+        """
+        entry_rows = self._iter_entry_rows(rows, era_manager)
+
+        # Iterate by hand to get at the generator's return value.
+        try:
+            while True:
+                row = next(entry_rows)
+                entry = self._make_entry(row, 
+                                         era_manager._current_era, 
+                                         era_manager._current_subera)
+                self.append(entry)
+        except StopIteration as stop:
+            return stop.value
+
+    def _split_at_eras(self, raw_values: Range, chunk_count: int) -> list[int]:
+        """Get the starting indices of roughly equal chunks of rows, 
+        where every chunk but the first starts on an era row. 
+        Each chunk can then be parsed with its own `_EraManager`."""
+        era_manager = self._get_era_manager()
+        chunk_size = len(raw_values) / chunk_count
+
+        starts = [0]
+        for i, row in enumerate(raw_values):
+            if i - starts[-1] < chunk_size:
+                continue
+
+            if era_manager.no_eras:
+                starts.append(i)
+            elif not self._ignore_row(i, row) and era_manager._era_cls._is_era(row):
+                starts.append(i)
+
+        return starts
+
+    def _build_parallel(self, raw_values: Range, workers: int):
+        self.eras: list[Era] = []
+
+        starts = self._split_at_eras(raw_values, workers * 4)
+        ends = starts[1:] + [len(raw_values)]
+        chunks = [raw_values[start:end] for start, end in zip(starts, ends)]
+
+        with ProcessPoolExecutor(workers) as executor:
+            results = executor.map(_build_chunk, repeat(type(self)), repeat(self.fields), 
+                                   starts, chunks)
+
+            # Entries come back in the same pickle as their eras and suberas, 
+            # so they still refer to the same era objects.
+            for entries, eras, diagnostics, ended in results:
+                self.extend(entries)
+                self.eras.extend(eras)
+                self.diagnostics.merge(diagnostics)
+
+                if ended:
+                    break
+
+def _build_chunk[T: Entry](tab_cls: type[Tab[T]], 
+                           fields: frozenset[str] | None,
+                           start: int, 
+                           rows: Range) -> tuple[list[T], list[Era], Diagnostics, bool]:
+    tab = tab_cls([], fields=fields)
+    era_manager = tab._get_era_manager()
+    with collecting(tab.diagnostics):
+        ended = tab._build(enumerate(rows, start), era_manager)
+
+    return list(tab), era_manager.eras, tab.diagnostics, ended
+
+@dataclass
+class ChangeSet[T: Entry]:
+    """The differences between two versions of a tab."""
+    tab: Tab[T] #: The new version of the tab.
+    added: list[T] = field(default_factory=list) #: Entries that are new.
+    removed: list[T] = field(default_factory=list) #: Entries that no longer exist.
+    #: Pairs of the old and new versions of entries that changed.
+    modified: list[tuple[T, T]] = field(default_factory=list)
+
+    #: The key of each entry's row (see :meth:`Tab._entry_key`), by the entry's `id`. 
+    #: The new version of a modified entry has the same key as the old one.
+    _keys: dict[int, Hashable] = field(default_factory=dict, repr=False, compare=False)
+
+    def __bool__(self) -> bool:
+        return len(self.added) > 0 or len(self.removed) > 0 or len(self.modified) > 0
+
+    def _get_key(self, entry: T) -> Hashable:
+        """Get the key of an entry, which is the entry itself if its row isn't known."""
+        return self._keys.get(id(entry), entry)
+
+    def merge(self, later: 'ChangeSet[T]') -> 'ChangeSet[T]':
+        """Combine this change set with one made after it into their net changes.  
+        For example, an entry that was added and then modified is only added.
+
+        Entries are matched by the key of their row rather than by identity, 
+        since an entry may have been copied between the two change sets 
+        (see :meth:`Tab._relink_entry`)."""
+        added: list[T | None] = list(self.added)
+        modified: list[tuple[T, T] | None] = list(self.modified)
+        removed = list(self.removed)
+
+        added_at: dict[Hashable, deque[int]] = {}
+        for i, entry in enumerate(self.added):
+            added_at.setdefault(self._get_key(entry), deque()).append(i)
+        modified_at: dict[Hashable, deque[int]] = {}
+        for i, (_, new) in enumerate(self.modified):
+            modified_at.setdefault(self._get_key(new), deque()).append(i)
+
+        def pop_index(indices: dict[Hashable, deque[int]], key: Hashable) -> int | None:
+            matches = indices.get(key)
+            return matches.popleft() if matches else None
+
+        for entry in later.removed:
+            key = later._get_key(entry)
+            if (i := pop_index(added_at, key)) is not None:
+                added[i] = None
+            elif (i := pop_index(modified_at, key)) is not None:
+                removed.append(modified[i][0]) # type: ignore[index]
+                modified[i] = None
+            else:
+                removed.append(entry)
+
+        # An entry isn't both modified and removed in the same change set, 
+        # so modified entries don't need to be indexed again.
+        for old, new in later.modified:
+            key = later._get_key(old)
+            if (i := pop_index(added_at, key)) is not None:
+                added[i] = new
+            elif (i := pop_index(modified_at, key)) is not None:
+                modified[i] = (modified[i][0], new) # type: ignore[index]
+            else:
+                modified.append((old, new))
+
+        merged = ChangeSet(
+            later.tab,
+            [entry for entry in added if entry is not None] + later.added,
+            removed,
+            [pair for pair in modified if pair is not None]
+        )
+
+        keys = self._keys | later._keys
+        for entry in (*merged.added, *merged.removed, *(new for _, new in merged.modified)):
+            if id(entry) in keys:
+                merged._keys[id(entry)] = keys[id(entry)]
+        for old, _ in merged.modified:
+            if id(old) in keys:
+                merged._keys[id(old)] = keys[id(old)]
+
+        return merged
+
+class LazyTab[T: Entry](Sequence[T]):
+    """A tab whose entries are only parsed when they're first accessed, 
+    whether by index, slice, or iteration. Each entry is parsed at most once.  
+
+    Eras are parsed up front. Methods of the regular tab class, 
+    such as :meth:`UnreleasedTab.get_best_of`, parse every entry first.
+
+    Attributes:
+        eras (list[Era]): The eras of the tab.
+        diagnostics (Diagnostics): The cells that couldn't be parsed 
+            in the eras and the entries parsed so far.
+    """
+    def __init__(self, tab_cls: type[Tab[T]], raw_values: Range, 
+                 fields: Iterable[str] | None = None):
+        """
+        Args:
+            tab_cls: The regular tab class, which determines how rows are parsed.
+            raw_values: The two-dimensional array representing 
+                a range of cells.
+            fields: The attributes parsed when an entry is first accessed. 
+                See :class:`Tab`.
+        """
+        self._tab_cls = tab_cls
+        self._rules = tab_cls([], fields=fields)
+
+        self.diagnostics = Diagnostics()
+
+        era_manager = self._rules._get_era_manager()
+        entry_rows = self._rules._iter_entry_rows(enumerate(raw_values), era_manager)
+
+        # The era manager is up to date with each row by the time it's yielded.
+        with collecting(self.diagnostics):
+            self._rows: list[tuple[Row, Era | None, SubEra | None]] = [
+                (row, era_manager._current_era, era_manager._current_subera)
+                for row in entry_rows
+            ]
+        self._entries: list[T | None] = [None] * len(self._rows)
+        self._materialized: Tab[T] | None = None
 
         self.eras = era_manager.eras
 
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def _get_entry(self, index: int) -> T:
+        entry = self._entries[index]
+
+        if entry is None:
+            with collecting(self.diagnostics):
+                entry = self._rules._make_entry(*self._rows[index])
+            self._entries[index] = entry
+
+        return entry
+
+    @overload
+    def __getitem__(self, index: int) -> T: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[T]: ...
+
+    def __getitem__(self, index: int | slice) -> T | list[T]:
+        if isinstance(index, slice):
+            return [self._get_entry(i) for i in range(*index.indices(len(self)))]
+
+        return self._get_entry(index)
+
+    def __iter__(self) -> Iterator[T]:
+        for i in range(len(self)):
+            yield self._get_entry(i)
+
+    def materialize(self) -> Tab[T]:
+        """Parse every entry, and return them as a regular tab."""
+        if self._materialized is None:
+            tab = self._tab_cls([], fields=self._rules.fields)
+            tab.extend(self)
+            tab.eras = self.eras
+            tab.diagnostics = self.diagnostics
+            self._materialized = tab
+
+        return self._materialized
+
+    def __getattr__(self, name: str):
+        if name.startswith('_'):
+            raise AttributeError(name)
+
+        return getattr(self.materialize(), name)
+
 class UnreleasedTab(Tab[Unreleased]):
     """List of entries in the Unreleased tab."""
     @property
@@ -113,15 +753,13 @@ class UnreleasedTab(Tab[Unreleased]):
         return _EraManager()
 
     def _get_emoji_subtab(self, *match_emojis: Emoji) -> 'UnreleasedTab':
-        new_tab = UnreleasedTab([])
-        new_tab.eras = self.eras
+        index = self._get_index('emoji')
 
-        for entry in self:
-            if any(match_emoji in entry.emojis 
-                   for match_emoji in match_emojis):
-                new_tab.append(entry)
+        positions: set[int] = set()
+        for match_emoji in match_emojis:
+            positions.update(index.get(match_emoji, []))
             
-        return new_tab
+        return self._subtab(sorted(positions))
 
     def get_best_of(self):
         """Returns a filtered `UnreleasedTab` with only 
@@ -1,9 +1,19 @@
 from abc import ABC, abstractmethod
+from concurrent.futures import Future, ThreadPoolExecutor
 from googleapiclient.discovery import build
-from typing import Callable, TextIO, overload
+from typing import Any, Callable, ClassVar, ContextManager, Iterable, Iterator, TextIO, overload
+import threading
+import time
 
 from yetracker._raw_values import *
+from yetracker.instrument import *
+from yetracker.instrument import count, traced
+from yetracker.shared import *
+from yetracker.shared import write_shared_snapshot
+from yetracker.snapshot import SnapshotRawValues, load_snapshot, save_snapshot
 from yetracker.tab import *
+from yetracker.watch import *
+from yetracker.watch import _WatchSchedule, _add_pending, get_events
 
 # __all__ = [
 #     'Tracker',
@@ -14,7 +24,21 @@ class NotAuthenticatedError(Exception):
     pass
 
 class Tracker(ABC):
-    "Base class for a tracker. Inherit to create a specific tracker."
+    """Base class for a tracker. Inherit to create a specific tracker.
+    
+    Attributes:
+        workers (int | None): The number of processes tabs are parsed in.
+            By default, tabs are parsed in the current process.
+        raw_store (RawValuesStore): The values fetched for each tab. 
+            Only the latest values of a tab are kept, unless 
+            :attr:`RawValuesStore.history` is raised.
+        tab_cache_ttl (float | None): How long, in seconds, getters return 
+            the tab they built before, instead of fetching it again. 
+            `None` unless :meth:`use_tab_cache` was called.
+    """
+
+    #: The tabs of the tracker, mapped to the class used to parse them.
+    tab_classes: ClassVar[dict[str, type[Tab]]] = {}
 
     @overload
     def __init__(self, *, spreadsheet_id: str, api_key: str):
@@ -48,7 +72,23 @@ class Tracker(ABC):
                  raw_json: str | TextIO | None = None
         ):
         
-        self.collected_raw_values: list[RawTabDict] = []
+        self.raw_store = RawValuesStore()
+        self._built_tabs: dict[str, tuple[Range, Tab]] = {}
+        # Tabs loaded from a snapshot whose raw values weren't needed yet.
+        self._snapshot_raw: dict[str, SnapshotRawValues] = {}
+        self.workers: int | None = None
+
+        self.tab_cache_ttl: float | None = None
+        self.validate_tabs = False
+        self.refresh_in_background = True
+        self._built_at: dict[str, float] = {}
+        self._tab_versions: dict[str, str | None] = {}
+        self._revalidations: dict[str, Future] = {}
+        self._revalidation_executor: ThreadPoolExecutor | None = None
+
+        # The Google Sheets API client isn't thread-safe, 
+        # and tabs may be revalidated in a background thread.
+        self._fetcher_lock = threading.Lock()
 
         if spreadsheet_id is not None and api_key is not None:
             self.use_api(spreadsheet_id, api_key)
@@ -63,19 +103,98 @@ class Tracker(ABC):
                 or as a file handler to a JSON file of that format.
         """
         self.raw_values_fetcher = RawValuesFromJson(json)
+
+    @property
+    def collected_raw_values(self) -> list[RawTabDict]:
+        """The latest values fetched for each tab."""
+        self._load_snapshot_raw()
+        return self.raw_store.to_list()
         
-    def use_api(self, spreadsheet_id: str, api_key: str):
+    def use_api(self, spreadsheet_id: str, api_key: str, http: Any = None, 
+                detect_changes: bool = False):
         """Set the tracker to use the Google Sheets API.
         
         Arguments:
             spreadsheet_id: The ID of the Google Sheets spreadsheet.
             api_key: The API key used to access the sheet.
+            http: Optional HTTP transport to send requests through.
+            detect_changes: Whether to skip downloading tabs that haven't changed. 
+                See :meth:`RawValuesFromAPI.has_changed`.
         """
-        self.raw_values_fetcher = RawValuesFromAPI(spreadsheet_id)
+        self.raw_values_fetcher = RawValuesFromAPI(spreadsheet_id, http=http, 
+                                                   detect_changes=detect_changes)
         self.raw_values_fetcher.authenticate(api_key)
-    
+
+    def use_cache(self, cache_dir: str, ttl: float = 3600, max_bytes: int = 256 * 2**20):
+        """Cache the values of the current data source on disk.  
+        Must be called after the data source is set.
+        
+        Arguments:
+            cache_dir: The directory the values are cached in. 
+                It can be shared between processes.
+            ttl: How long, in seconds, cached values are used 
+                before being fetched again.
+            max_bytes: The maximum size of the cached values. 
+                Other files in the directory aren't counted or removed.
+        """
+        self.raw_values_fetcher = CachedRawValues(
+            self.raw_values_fetcher, cache_dir, ttl=ttl, max_bytes=max_bytes
+        )
+
+    def use_tab_cache(self, ttl: float = 60, validate: bool = False, background: bool = True):
+        """Keep the tabs built by the getters, such as :meth:`get_tab`.  
+        Until a tab is older than `ttl`, getting it again returns the same tab object.
+        Once it's older, it's rebuilt with :meth:`refresh`, 
+        so only the rows that changed are parsed again.
+
+        Arguments:
+            ttl: How long, in seconds, a built tab is returned as is.
+            validate: Whether to first check if the tab changed at all, 
+                through the data source's version of the tab 
+                (for the Google Sheets API, the spreadsheet's `modifiedTime`).
+                Unchanged tabs are kept for another `ttl` seconds without being fetched.
+            background: Whether an expired tab is returned as is while it's rebuilt 
+                in a background thread. Otherwise, getters wait for the rebuild.
+        """
+        self.tab_cache_ttl = ttl
+        self.validate_tabs = validate
+        self.refresh_in_background = background
+
+    def invalidate(self, tab_name: str | None = None):
+        """Make the next getter of a tab fetch it again, 
+        even if it was built less than :attr:`tab_cache_ttl` seconds ago.
+
+        Arguments:
+            tab_name: The name of the tab. Defaults to every tab.
+        """
+        tab_names = list(self._built_at) if tab_name is None else [tab_name]
+        for name in tab_names:
+            self._built_at.pop(name, None)
+            self._tab_versions.pop(name, None)
+
+    def trace(self, tracer: Tracer | None = None) -> ContextManager[Tracer]:
+        """Time and count what the tracker does in the body of a `with` statement,
+        per tab: fetching, decoding and parsing, each column, the kinds of rows,
+        and cache hits. Outside of it, nothing is measured.
+
+        Example::
+
+            with tracker.trace() as tracer:
+                tracker.load_tabs()
+
+            for span in tracer.spans:
+                print(span.tab, span.name, span.seconds)
+
+        Tabs revalidated in the background aren't traced.
+
+        Arguments:
+            tracer: The tracer to report to, such as a subclass of :class:`Tracer`
+                that exports to a metrics system. Defaults to a new :class:`Tracer`.
+        """
+        return tracing(tracer)
+
     def save_data_to_file(self, file_name: str):
-        """Save the raw data collected to a file.  
+        """Save the latest raw data collected for each tab to a file.  
         The file can subsequently be loaded in with `use_json`.
         
         Arguments:
@@ -84,31 +203,360 @@ class Tracker(ABC):
         with open(file_name, 'w') as f:
             json.dump(self.collected_raw_values, f)
     
-    def _get_general[T: Tab](self, sheet_name: str, tab_cls: type[T]) -> T:
+    def save_snapshot(self, file_name: str):
+        """Save the tabs last fetched by the tracker, already parsed, to a file.  
+        The file can subsequently be loaded in with :meth:`load_snapshot`.
+        
+        Arguments:
+            file_name: name of the file to be written to.
+        """
+        self._load_snapshot_raw()
+        save_snapshot(file_name, self._built_tabs)
+
+    def load_snapshot(self, file_name: str) -> dict[str, Tab]:
+        """Load the tabs saved with :meth:`save_snapshot`, without parsing them again. 
+        Later calls to :meth:`refresh` only parse the rows that differ from the snapshot.  
+        If the tracker has no data source yet, the snapshot's raw values become its data source.  
+        The raw values are only decoded, and added to :attr:`raw_store`, once they're needed.
+
+        Arguments:
+            file_name: name of the file to read.
+
+        Returns:
+            The loaded tabs, mapped to their names.
+        """
+        tabs, raw_values = load_snapshot(file_name)
+
+        # The raw values are only decoded once they're needed, such as by `refresh`.
+        for tab_name, tab in tabs.items():
+            self._store_built(tab_name, [], tab)
+            self._snapshot_raw[tab_name] = raw_values
+
+        if not hasattr(self, 'raw_values_fetcher'):
+            self.raw_values_fetcher = raw_values
+
+        return tabs
+
+    def save_shared_snapshot(self, file_name: str):
+        """Save the tabs last fetched by the tracker to a file 
+        that several processes can share with :meth:`open_shared_snapshot`.
+        
+        Arguments:
+            file_name: name of the file to be written to.
+        """
+        write_shared_snapshot(file_name, {
+            tab_name: tab for tab_name, (_, tab) in self._built_tabs.items()
+        })
+
+    def open_shared_snapshot(self, file_name: str) -> SharedSnapshot:
+        """Open a file saved with :meth:`save_shared_snapshot`, without parsing it.  
+        The file is memory-mapped, so processes that open the same file 
+        share one copy of it, and entries are only decoded as they're used.
+
+        Arguments:
+            file_name: name of the file to open.
+
+        Returns:
+            The snapshot, whose :attr:`~SharedSnapshot.tabs` are read-only 
+            tabs of :class:`SharedEntry` objects.
+        """
+        return SharedSnapshot(file_name)
+
+    def _fetch_raw_values(self, sheet_name: str) -> Range:
+        if not self.raw_values_fetcher.authenticated:
+            raise NotAuthenticatedError()
+
+        with self._fetcher_lock, traced('fetch', sheet_name):
+            raw_values: Range = self.raw_values_fetcher.get_raw_values(sheet_name)
+
+        self.raw_store.add(sheet_name, raw_values)
+
+        return raw_values
+
+    def _prefetch(self, *sheet_names: str):
+        with self._fetcher_lock:
+            self.raw_values_fetcher.prefetch(*sheet_names)
+
+    def _discard_prefetched(self):
+        with self._fetcher_lock:
+            self.raw_values_fetcher.discard_prefetched()
+
+    def _get_tab_version(self, sheet_name: str) -> str | None:
+        if self.tab_cache_ttl is None or not self.validate_tabs:
+            return None
+
+        with self._fetcher_lock:
+            return self.raw_values_fetcher.get_version(sheet_name)
+
+    def _store_built(self, sheet_name: str, raw_values: Range, tab: Tab, 
+                     version: str | None = None):
+        self._snapshot_raw.pop(sheet_name, None)
+        self._built_tabs[sheet_name] = (raw_values, tab)
+        self._built_at[sheet_name] = time.monotonic()
+        self._tab_versions[sheet_name] = version
+
+    def _get_built_raw(self, sheet_name: str) -> Range:
+        """Get the raw values a built tab was parsed from, 
+        decoding them first if the tab was loaded from a snapshot."""
+        raw_values, tab = self._built_tabs[sheet_name]
+
+        snapshot_raw = self._snapshot_raw.pop(sheet_name, None)
+        if snapshot_raw is not None:
+            raw_values = snapshot_raw.get_raw_values(sheet_name)
+            self.raw_store.add(sheet_name, raw_values)
+            self._built_tabs[sheet_name] = (raw_values, tab)
+
+        return raw_values
+
+    def _load_snapshot_raw(self):
+        for sheet_name in list(self._snapshot_raw):
+            self._get_built_raw(sheet_name)
+
+    def _revalidate(self, sheet_name: str):
+        """Rebuild a cached tab, unless its version shows that it hasn't changed."""
+        version = self._get_tab_version(sheet_name)
+        if version is not None and version == self._tab_versions.get(sheet_name):
+            self._built_at[sheet_name] = time.monotonic()
+            return
+
+        self._refresh_built(sheet_name)
+
+    def _needs_fetch(self, sheet_name: str, background: bool | None = None) -> bool:
+        """Whether getting a tab fetches its values right away, 
+        instead of returning the tab built before (see :meth:`_get_cached`)."""
+        if self.tab_cache_ttl is None or sheet_name not in self._built_at:
+            return True
+
+        _, tab = self._built_tabs[sheet_name]
+        if type(tab) is not self.tab_classes.get(sheet_name):
+            return True
+
+        if time.monotonic() - self._built_at[sheet_name] < self.tab_cache_ttl:
+            return False
+
+        if background is None:
+            background = self.refresh_in_background
+
+        # Expired tabs revalidated in the background are returned as is, 
+        # and with validation, unchanged tabs aren't fetched at all.
+        return not background and not self.validate_tabs
+
+    def _get_cached[T: Tab](self, sheet_name: str, tab_cls: type[T], 
+                            background: bool | None = None) -> T | None:
+        """Get the tab built before, if the tab cache is used and it wasn't invalidated.  
+        If the tab is older than the TTL, it's revalidated first, or in the background."""
+        if self.tab_cache_ttl is None or sheet_name not in self._built_at:
+            return None
+
+        _, tab = self._built_tabs[sheet_name]
+        if type(tab) is not tab_cls:
+            return None
+
+        if time.monotonic() - self._built_at[sheet_name] < self.tab_cache_ttl:
+            count('tab_cache.hit', tab=sheet_name)
+            return tab # type: ignore
+
+        count('tab_cache.stale', tab=sheet_name)
+
+        if background is None:
+            background = self.refresh_in_background
+
+        if not background:
+            self._revalidate(sheet_name)
+            return self._built_tabs[sheet_name][1] # type: ignore
+
+        pending = self._revalidations.get(sheet_name)
+        if pending is None or pending.done():
+            if self._revalidation_executor is None:
+                self._revalidation_executor = ThreadPoolExecutor(1)
+
+            self._revalidations[sheet_name] = self._revalidation_executor.submit(
+                self._revalidate, sheet_name
+            )
+
+        return tab # type: ignore
+
+    def _get_general[T: Tab](self, sheet_name: str, tab_cls: type[T], 
+                             fields: Iterable[str] | None = None) -> T:
+        tab = self._get_cached(sheet_name, tab_cls)
+        if tab is not None:
+            return tab
+
+        with traced('get', sheet_name):
+            version = self._get_tab_version(sheet_name)
+            raw_values = self._fetch_raw_values(sheet_name)
+            tab = tab_cls(raw_values, workers=self.workers, fields=fields)
+            self._store_built(sheet_name, raw_values, tab, version)
+
+        return tab
+
+    def get_tab(self, tab_name: str, fields: Iterable[str] | None = None) -> Tab:
+        """Get a tab of the tracker by its name.
+
+        Arguments:
+            tab_name: The name of the tab, as found in :attr:`tab_classes`.
+            fields: The attributes of the entries to parse up front, 
+                e.g. ``{'main_name', 'quality', 'era'}``. The other attributes 
+                are parsed when they're first accessed. Defaults to every attribute.
+                A tab returned from the tab cache keeps the fields it was built with.
+        """
+        return self._get_general(tab_name, self.tab_classes[tab_name], fields)
+
+    def refresh(self, tab_name: str) -> ChangeSet:
+        """Fetch a tab again, only parsing the rows that changed since 
+        the tab was last fetched. Entries of unchanged rows are reused.
+
+        Arguments:
+            tab_name: The name of the tab, as found in :attr:`tab_classes`.
+
+        Returns:
+            The new version of the tab, along with the entries that were added, 
+            removed, or modified. If the tab wasn't fetched before, 
+            every entry counts as added.
+        """
+        if tab_name not in self._built_tabs:
+            tab = self.get_tab(tab_name)
+            return ChangeSet(tab, added=list(tab))
+
+        return self._refresh_built(tab_name)
+
+    def _refresh_built(self, tab_name: str) -> ChangeSet:
+        """Refresh a tab that was already built. See :meth:`refresh`."""
+        old_raw_values = self._get_built_raw(tab_name)
+        _, old_tab = self._built_tabs[tab_name]
+        with traced('refresh', tab_name):
+            version = self._get_tab_version(tab_name)
+            raw_values = self._fetch_raw_values(tab_name)
+
+            with traced('parse'):
+                changes = old_tab._rebuild(old_raw_values, raw_values)
+
+            self._store_built(tab_name, raw_values, changes.tab, version)
+
+        return changes
+
+    def watch(self, 
+              tab_names: list[str] | None = None,
+              interval: float = 60,
+              max_interval: float | None = None,
+              settle: float = 5,
+              max_settle_polls: int = 12,
+              sleep: Callable[[float], object] = time.sleep) -> Iterator[ChangeEvent]:
+        """Poll tabs for changes, forever, yielding an event for each change.  
+        Each poll uses :meth:`refresh`, so only changed rows are parsed.
+
+        When a poll finds no changes, the time until the next poll doubles, 
+        up to `max_interval`. When a poll does find changes, the tabs are polled 
+        every `settle` seconds until they stop changing, and the net changes 
+        of the whole burst are yielded at once.
+
+        Arguments:
+            tab_names: The tabs to watch. Defaults to every tab in :attr:`tab_classes`.
+            interval: The shortest time, in seconds, between polls.
+            max_interval: The longest time between polls. Defaults to 16 times `interval`.
+            settle: The time between polls while the tabs are changing.
+            max_settle_polls: The most polls made while waiting for changes to stop.
+            sleep: The function used to wait between polls.
+        """
+        if tab_names is None:
+            tab_names = list(self.tab_classes)
+
+        schedule = _WatchSchedule(interval, max_interval, settle, max_settle_polls)
+        tabs = {tab_name: self.refresh(tab_name).tab for tab_name in tab_names}
+        pending: dict[str, ChangeSet] = {}
+
+        while True:
+            sleep(schedule.wait)
+
+            changed = _add_pending(pending, {tab_name: self.refresh(tab_name) for tab_name in tab_names})
+            if not schedule.record(changed):
+                continue
+
+            for tab_name, changes in pending.items():
+                yield from get_events(tab_name, tabs[tab_name], changes)
+                tabs[tab_name] = changes.tab
+            pending = {}
+
+    def get_lazy_tab(self, tab_name: str, fields: Iterable[str] | None = None) -> LazyTab:
+        """Get a tab of the tracker by its name, 
+        only parsing each of its entries when it is first accessed.
+
+        Arguments:
+            tab_name: The name of the tab, as found in :attr:`tab_classes`.
+            fields: The attributes parsed when an entry is first accessed. 
+                See :meth:`get_tab`.
+        """
+        raw_values = self._fetch_raw_values(tab_name)
+        return LazyTab(self.tab_classes[tab_name], raw_values, fields)
+
+    def iter_tab(self, tab_name: str) -> Iterator[Entry]:
+        """Parse the entries of a tab one at a time, as its rows are read.  
+        Neither the rows nor the entries are kept, so unlike with :meth:`get_tab`, 
+        the tab can't be saved or refreshed afterwards.
+
+        Arguments:
+            tab_name: The name of the tab, as found in :attr:`tab_classes`.
+        """
         if not self.raw_values_fetcher.authenticated:
             raise NotAuthenticatedError()
 
-        raw_values: Range = self.raw_values_fetcher.get_raw_values(sheet_name)
+        rows = self.raw_values_fetcher.iter_raw_values(tab_name)
+        return self.tab_classes[tab_name].iter_entries(rows)
+
+    def load_tabs(self, tab_names: list[str] | None = None) -> dict[str, Tab]:
+        """Fetch several tabs at once, then parse each of them.  
+        With the Google Sheets API, all of the tabs are fetched in one request.
 
-        raw_tab_dict: RawTabDict = {
-            'range': sheet_name,
-            'values': raw_values
-        }
-        self.collected_raw_values.append(raw_tab_dict)
+        Arguments:
+            tab_names: The names of the tabs to load. 
+                Defaults to every tab in :attr:`tab_classes`.
 
-        return tab_cls(raw_values)
+        Returns:
+            The parsed tabs, mapped to their names.
+        """
+        if not self.raw_values_fetcher.authenticated:
+            raise NotAuthenticatedError()
+
+        if tab_names is None:
+            tab_names = list(self.tab_classes)
+
+        # Tabs returned from the tab cache would leave their prefetched values unused.
+        self._prefetch(*(tab_name for tab_name in tab_names if self._needs_fetch(tab_name)))
+        try:
+            return {tab_name: self.get_tab(tab_name) for tab_name in tab_names}
+        finally:
+            self._discard_prefetched()
 
 class YeTracker(Tracker):
     """Class representing the Ye Tracker."""
 
-    def get_unreleased(self):
-        return self._get_general("Unreleased", UnreleasedTab)
+    tab_classes = {
+        "Unreleased": UnreleasedTab,
+        "Released": ReleasedTab,
+        "Stems": StemsTab,
+        "Samples": SamplesTab
+    }
+
+    def get_unreleased(self, fields: Iterable[str] | None = None):
+        return self._get_general("Unreleased", UnreleasedTab, fields)
     
-    def get_released(self):
-        return self._get_general("Released", ReleasedTab)
+    def get_released(self, fields: Iterable[str] | None = None):
+        return self._get_general("Released", ReleasedTab, fields)
 
-    def get_stems(self):
-        return self._get_general("Stems", StemsTab)
+    def get_stems(self, fields: Iterable[str] | None = None):
+        return self._get_general("Stems", StemsTab, fields)
     
-    def get_samples(self):
-        return self._get_general("Samples", SamplesTab)
+    def get_samples(self, fields: Iterable[str] | None = None):
+        return self._get_general("Samples", SamplesTab, fields)
+
+    def iter_unreleased(self) -> Iterator[Unreleased]:
+        return self.iter_tab("Unreleased") # type: ignore
+
+    def iter_released(self) -> Iterator[Released]:
+        return self.iter_tab("Released") # type: ignore
+
+    def iter_stems(self) -> Iterator[Stem]:
+        return self.iter_tab("Stems") # type: ignore
+
+    def iter_samples(self) -> Iterator[Sample]:
+        return self.iter_tab("Samples") # type: ignore
@@ -0,0 +1,153 @@
+from dataclasses import dataclass
+from typing import Iterator
+
+from yetracker.column import AvailableLengthEnum, QualityEnum
+from yetracker.entry import Entry
+from yetracker.era import Era
+from yetracker.tab import ChangeSet, Tab
+
+__all__ = [
+    'ChangeEvent',
+    'NewEntry',
+    'RemovedEntry',
+    'ModifiedEntry',
+    'QualityChanged',
+    'AvailableLengthChanged',
+    'NewEra'
+]
+
+@dataclass
+class ChangeEvent:
+    """Base class for a change to a tab, as yielded by :meth:`Tracker.watch`."""
+    tab_name: str #: The name of the tab that changed.
+
+@dataclass
+class NewEntry(ChangeEvent):
+    """An entry was added, such as a new leak."""
+    entry: Entry #: The added entry.
+
+@dataclass
+class RemovedEntry(ChangeEvent):
+    """An entry was removed."""
+    entry: Entry #: The removed entry, as it was last seen.
+
+@dataclass
+class ModifiedEntry(ChangeEvent):
+    """An entry changed in a way not covered by a more specific event."""
+    old: Entry #: The entry before the change.
+    new: Entry #: The entry after the change.
+
+@dataclass
+class QualityChanged(ModifiedEntry):
+    """The quality of an entry changed."""
+
+    @property
+    def is_upgrade(self) -> bool:
+        """Whether the new quality is better than the old one."""
+        qualities = list(QualityEnum)
+
+        def rank(quality: QualityEnum | None) -> int:
+            return -1 if quality is None else qualities.index(quality)
+
+        return rank(getattr(self.new, 'quality')) > rank(getattr(self.old, 'quality'))
+
+@dataclass
+class AvailableLengthChanged(ModifiedEntry):
+    """How much of an entry is available changed."""
+
+@dataclass
+class NewEra(ChangeEvent):
+    """An era was added."""
+    era: Era #: The added era.
+
+def _get_era_name(era: Era) -> str | None:
+    return getattr(era, 'main_name', None)
+
+def get_events(tab_name: str, old_tab: Tab, changes: ChangeSet) -> Iterator[ChangeEvent]:
+    """Turn the changes between two versions of a tab into events.
+
+    Arguments:
+        tab_name: The name of the tab.
+        old_tab: The tab before the changes.
+        changes: The changes made since `old_tab`.
+    """
+    old_era_names = {_get_era_name(era) for era in old_tab.eras}
+    for era in changes.tab.eras:
+        if _get_era_name(era) not in old_era_names:
+            yield NewEra(tab_name, era)
+
+    for entry in changes.added:
+        yield NewEntry(tab_name, entry)
+
+    for old, new in changes.modified:
+        specific = False
+
+        if getattr(old, 'quality', None) != getattr(new, 'quality', None):
+            specific = True
+            yield QualityChanged(tab_name, old, new)
+
+        if getattr(old, 'available_length', None) != getattr(new, 'available_length', None):
+            specific = True
+            yield AvailableLengthChanged(tab_name, old, new)
+
+        if not specific:
+            yield ModifiedEntry(tab_name, old, new)
+
+    for entry in changes.removed:
+        yield RemovedEntry(tab_name, entry)
+
+class _WatchSchedule:
+    """When to poll tabs that are being watched, shared by the synchronous 
+    and asynchronous versions of :meth:`Tracker.watch`. 
+
+    The time until the next poll doubles after each poll that finds no changes. 
+    After a poll that finds changes, tabs are polled every `settle` seconds 
+    until a poll finds none, or `max_settle_polls` were made, ending the burst.
+    """
+    def __init__(self, interval: float, max_interval: float | None, 
+                 settle: float, max_settle_polls: int):
+        self.interval = interval
+        self.max_interval = interval * 16 if max_interval is None else max_interval
+        self.settle = settle
+        self.max_settle_polls = max_settle_polls
+
+        #: How long to wait before the next poll.
+        self.wait = interval
+        #: How many polls were made since the burst of changes started, if one did.
+        self._settle_polls: int | None = None
+
+    def record(self, changed: bool) -> bool:
+        """Record whether a poll found changes. Returns whether a burst 
+        of changes ended, in which case its changes should be reported."""
+        if self._settle_polls is None:
+            if not changed:
+                self.wait = min(self.wait * 2, self.max_interval)
+                return False
+
+            self._settle_polls = 0
+        else:
+            self._settle_polls += 1
+
+        if changed and self._settle_polls < self.max_settle_polls:
+            self.wait = self.settle
+            return False
+
+        self._settle_polls = None
+        self.wait = self.interval
+        return True
+
+def _add_pending(pending: dict[str, ChangeSet], changes: dict[str, ChangeSet]) -> bool:
+    """Merge the changes found by a poll into those of the current burst. 
+    Returns whether any tab changed."""
+    changed = False
+    for tab_name, tab_changes in changes.items():
+        if not tab_changes:
+            continue
+
+        changed = True
+        if tab_name in pending:
+            pending[tab_name] = pending[tab_name].merge(tab_changes)
+        else:
+            pending[tab_name] = tab_changes
+
+    return changed
@@ -0,0 +1,102 @@
+"""A fake Google Sheets and Google Drive service, 
+serving the bundled fixture without network access."""
+import copy
+import json
+
+from googleapiclient.errors import HttpError
+import httplib2
+import pytest
+
+from benchmarks.fixtures import FIXTURE_PATH
+import yetracker._raw_values
+
+class FakeRequest:
+    def __init__(self, response: dict | None = None, error: HttpError | None = None):
+        self.response = response
+        self.error = error
+
+    def execute(self) -> dict:
+        if self.error is not None:
+            raise self.error
+
+        assert self.response is not None
+        return self.response
+
+class FakeValues:
+    """Serves the values of tabs, recording each request."""
+    def __init__(self, tabs: dict[str, list[list[str]]]):
+        self.tabs = tabs
+        self.requests: list[tuple[str, str | tuple[str, ...]]] = []
+
+    def get(self, spreadsheetId: str, range: str) -> FakeRequest:
+        self.requests.append(('get', range))
+        return FakeRequest({'range': range, 'values': copy.deepcopy(self.tabs[range])})
+
+    def batchGet(self, spreadsheetId: str, ranges: list[str]) -> FakeRequest:
+        self.requests.append(('batchGet', tuple(ranges)))
+        return FakeRequest({'valueRanges': [
+            {'range': range, 'values': copy.deepcopy(self.tabs[range])} for range in ranges
+        ]})
+
+class FakeSpreadsheets:
+    def __init__(self, tabs: dict[str, list[list[str]]]):
+        self.tabs = tabs
+        self._values = FakeValues(tabs)
+        self.probes: list[str] = []
+
+    def values(self) -> FakeValues:
+        return self._values
+
+    def get(self, spreadsheetId: str, ranges: list[str], **kwargs) -> FakeRequest:
+        # Probes the size of the tab and its first rows, like the real response does.
+        tab_name = yetracker._raw_values._get_sheet_name(ranges[0])
+        self.probes.append(tab_name)
+        values = self.tabs[tab_name]
+        return FakeRequest({'sheets': [{
+            'properties': {'gridProperties': {'rowCount': len(values)}},
+            'data': [{'rowData': values[:20]}]
+        }]})
+
+class FakeFiles:
+    """Serves the spreadsheet's modification time, as the Drive API does."""
+    def __init__(self):
+        self.modified_time = '2024-01-01T00:00:00.000Z'
+        #: The HTTP status to fail with, if any.
+        self.error_status: int | None = None
+        self.requests = 0
+
+    def get(self, fileId: str, fields: str) -> FakeRequest:
+        self.requests += 1
+        if self.error_status is not None:
+            response = httplib2.Response({'status': self.error_status})
+            return FakeRequest(error=HttpError(response, b''))
+
+        return FakeRequest({'modifiedTime': self.modified_time})
+
+class FakeService:
+    def __init__(self, tabs: dict[str, list[list[str]]]):
+        self._spreadsheets = FakeSpreadsheets(tabs)
+        self._files = FakeFiles()
+
+    def spreadsheets(self) -> FakeSpreadsheets:
+        return self._spreadsheets
+
+    def files(self) -> FakeFiles:
+        return self._files
+
+    @property
+    def requests(self) -> list[tuple[str, str | tuple[str, ...]]]:
+        """The requests for values, in the order they were made."""
+        return self._spreadsheets.values().requests
+
+@pytest.fixture
+def tabs() -> dict[str, list[list[str]]]:
+    with open(FIXTURE_PATH, encoding='utf-8') as f:
+        return {tab['range']: tab['values'] for tab in json.load(f)}
+
+@pytest.fixture
+def service(tabs, monkeypatch) -> FakeService:
+    """Replace the Sheets and Drive clients built by `use_api` with a fake service."""
+    service = FakeService(tabs)
+    monkeypatch.setattr(yetracker._raw_values, 'build', lambda *args, **kwargs: service)
+    return service
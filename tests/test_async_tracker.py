@@ -0,0 +1,132 @@
+"""Tests of the asynchronous tracker, sending requests through a fake HTTP 
+transport given to `use_api`, so that the real Google Sheets API client is used."""
+import asyncio
+import json
+import threading
+import time
+from urllib.parse import parse_qs, unquote, urlparse
+
+import httplib2
+import pytest
+
+from yetracker import AsyncYeTracker, YeTracker
+from yetracker._raw_values import Range
+
+TAB_NAMES = ['Unreleased', 'Released', 'Stems', 'Samples']
+
+class SheetsHttp:
+    """An `httplib2.Http` stand-in that answers Google Sheets API requests 
+    for the values of tabs, like `googleapiclient.http.HttpMock`, 
+    recording the path and query of each request."""
+    def __init__(self, tabs: dict[str, Range], delay: float = 0):
+        self.tabs = tabs
+        #: How long each request takes, in seconds.
+        self.delay = delay
+        self.requests: list[tuple[str, dict[str, list[str]]]] = []
+        #: The most requests that were being answered at once.
+        self.max_concurrent = 0
+
+        self._concurrent = 0
+        self._lock = threading.Lock()
+
+    def request(self, uri: str, method: str = 'GET', body=None, headers=None,
+                redirections: int = 1, connection_type=None) -> tuple[httplib2.Response, bytes]:
+        url = urlparse(uri)
+        query = parse_qs(url.query)
+        with self._lock:
+            self.requests.append((url.path, query))
+            self._concurrent += 1
+            self.max_concurrent = max(self.max_concurrent, self._concurrent)
+
+        try:
+            time.sleep(self.delay)
+            path = unquote(url.path)
+            if path.endswith('/values:batchGet'):
+                content = {'valueRanges': [self._value_range(range) for range in query['ranges']]}
+            else:
+                content = self._value_range(path.rpartition('/values/')[2])
+        finally:
+            with self._lock:
+                self._concurrent -= 1
+
+        return httplib2.Response({'status': 200}), json.dumps(content).encode()
+
+    def _value_range(self, range: str) -> dict:
+        return {'range': range, 'values': self.tabs[range]}
+
+    def paths(self) -> list[str]:
+        return [unquote(path).rpartition('/')[2] for path, _ in self.requests]
+
+@pytest.fixture
+def http(tabs) -> SheetsHttp:
+    return SheetsHttp(tabs)
+
+@pytest.fixture
+def tracker(http) -> AsyncYeTracker:
+    tracker = AsyncYeTracker()
+    tracker.use_api('spreadsheet', 'key', http=http)
+    return tracker
+
+def test_load_tabs_fetches_once_and_parses_every_tab(tracker, http, tabs):
+    loaded = asyncio.run(tracker.load_tabs())
+
+    assert http.paths() == ['values:batchGet']
+    assert http.requests[0][1]['ranges'] == TAB_NAMES
+
+    expected = YeTracker()
+    expected.use_json(json.dumps([{'range': name, 'values': tabs[name]} for name in TAB_NAMES]))
+    for tab_name in TAB_NAMES:
+        assert repr(loaded[tab_name]) == repr(expected.get_tab(tab_name))
+
+def test_concurrent_gets_fetch_one_at_a_time(tracker, http):
+    http.delay = 0.01
+
+    async def get_all():
+        return await asyncio.gather(*(tracker.get_tab(tab_name) for tab_name in TAB_NAMES))
+
+    tabs = asyncio.run(get_all())
+
+    assert sorted(http.paths()) == sorted(TAB_NAMES)
+    # The Google Sheets API client isn't thread-safe.
+    assert http.max_concurrent == 1
+    assert [tab.__class__ for tab in tabs] == [tracker.tab_classes[name] for name in TAB_NAMES]
+
+def test_fetching_does_not_block_the_event_loop(tracker, http):
+    http.delay = 0.05
+    ticks = 0
+
+    async def tick():
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0.005)
+
+    async def load():
+        ticker = asyncio.create_task(tick())
+        try:
+            await tracker.load_tabs()
+        finally:
+            ticker.cancel()
+
+    asyncio.run(load())
+
+    assert ticks > 3
+
+def test_concurrent_refreshes(tracker, http, tabs):
+    async def refresh_all():
+        await tracker.load_tabs()
+
+        tabs['Unreleased'][2][2] = 'Edited'
+        del tabs['Released'][2]
+
+        return await asyncio.gather(*(tracker.refresh(tab_name) for tab_name in TAB_NAMES))
+
+    changes = dict(zip(TAB_NAMES, asyncio.run(refresh_all())))
+
+    assert sorted(http.paths()[1:]) == sorted(TAB_NAMES)
+    assert http.max_concurrent == 1
+
+    assert [new.notes for _, new in changes['Unreleased'].modified] == ['Edited']
+    assert not changes['Unreleased'].added and not changes['Unreleased'].removed
+    assert len(changes['Released'].removed) == 1
+    assert not changes['Stems'] and not changes['Samples']
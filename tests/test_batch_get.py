@@ -0,0 +1,68 @@
+"""Tests of fetching several tabs in one `values.batchGet` request, 
+against a fake Google Sheets service (see conftest.py)."""
+import json
+
+import pytest
+
+from yetracker import YeTracker
+
+TAB_NAMES = ['Unreleased', 'Released', 'Stems', 'Samples']
+
+@pytest.fixture
+def tracker(service) -> YeTracker:
+    tracker = YeTracker()
+    tracker.use_api('spreadsheet', 'key')
+    return tracker
+
+def test_load_tabs_sends_one_batch_get(tracker, service):
+    loaded = tracker.load_tabs()
+
+    assert service.requests == [('batchGet', tuple(TAB_NAMES))]
+    assert list(loaded) == TAB_NAMES
+
+def test_load_tabs_matches_getters(tracker, service, tabs):
+    loaded = tracker.load_tabs(['Unreleased', 'Stems'])
+    expected = YeTracker(raw_json=json.dumps([
+        {'range': tab_name, 'values': values} for tab_name, values in tabs.items()
+    ]))
+
+    assert repr(list(loaded['Unreleased'])) == repr(list(expected.get_unreleased()))
+    assert repr(list(loaded['Stems'])) == repr(list(expected.get_stems()))
+
+def test_getters_are_fed_from_the_batch(tracker, service):
+    tracker.raw_values_fetcher.prefetch('Unreleased', 'Released')
+    tracker.get_unreleased()
+    tracker.get_released()
+
+    assert service.requests == [('batchGet', ('Unreleased', 'Released'))]
+
+def test_prefetched_values_are_used_once(tracker, service):
+    tracker.raw_values_fetcher.prefetch('Unreleased')
+    tracker.get_unreleased()
+    tracker.get_unreleased()
+
+    assert service.requests == [('batchGet', ('Unreleased',)), ('get', 'Unreleased')]
+
+def test_discarded_values_are_fetched_again(tracker, service):
+    tracker.raw_values_fetcher.prefetch('Unreleased')
+    tracker.raw_values_fetcher.discard_prefetched()
+    tracker.get_unreleased()
+
+    assert service.requests == [('batchGet', ('Unreleased',)), ('get', 'Unreleased')]
+
+def test_expired_tabs_are_refreshed_from_the_batch(tracker, service, tabs):
+    tracker.use_tab_cache(ttl=0, background=False)
+    tracker.load_tabs(['Unreleased'])
+
+    tabs['Unreleased'] = tabs['Unreleased'][:10]
+    tracker.load_tabs(['Unreleased'])
+
+    assert service.requests == [('batchGet', ('Unreleased',)), ('batchGet', ('Unreleased',))]
+    assert len(tracker.get_unreleased()) < 10
+
+def test_tabs_from_the_tab_cache_are_not_prefetched(tracker, service):
+    tracker.use_tab_cache(ttl=60)
+    tracker.load_tabs()
+    tracker.load_tabs()
+
+    assert service.requests == [('batchGet', tuple(TAB_NAMES))]
@@ -0,0 +1,130 @@
+"""Tests of the on-disk cache of fetched tab values."""
+import os
+
+import pytest
+
+from yetracker._raw_values import CachedRawValues, RawValuesFetcher
+import yetracker._raw_values
+
+class CountingFetcher(RawValuesFetcher):
+    """Serves the same values for every tab, counting how often each tab is fetched."""
+    def __init__(self, rows: int = 10):
+        super().__init__()
+        self.authenticated = True
+        self.values = [['cell'] * 5 for _ in range(rows)]
+        self.fetches: dict[str, int] = {}
+
+    def get_raw_values(self, tab_name: str):
+        self.fetches[tab_name] = self.fetches.get(tab_name, 0) + 1
+        return self.values
+
+    def authenticate(self, *args):
+        pass
+
+class Clock:
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def time(self) -> float:
+        return self.now
+
+@pytest.fixture
+def clock(monkeypatch) -> Clock:
+    clock = Clock()
+    monkeypatch.setattr(yetracker._raw_values.time, 'time', clock.time)
+    return clock
+
+def test_values_are_read_from_disk(tmp_path):
+    fetcher = CountingFetcher()
+    assert CachedRawValues(fetcher, str(tmp_path)).get_raw_values('Unreleased') == fetcher.values
+
+    # Another cache on the same directory, such as in another process.
+    assert CachedRawValues(fetcher, str(tmp_path)).get_raw_values('Unreleased') == fetcher.values
+    assert fetcher.fetches == {'Unreleased': 1}
+
+def test_expired_values_are_fetched_again(tmp_path, clock):
+    fetcher = CountingFetcher()
+    cache = CachedRawValues(fetcher, str(tmp_path), ttl=60)
+
+    cache.get_raw_values('Unreleased')
+    clock.now += 59
+    cache.get_raw_values('Unreleased')
+    assert fetcher.fetches == {'Unreleased': 1}
+
+    clock.now += 2
+    cache.get_raw_values('Unreleased')
+    assert fetcher.fetches == {'Unreleased': 2}
+
+@pytest.mark.parametrize('contents', [
+    '',
+    'not json',
+    '{"range": "Unreleased"}\n[]',
+    '[1, 2]\n[]',
+    '{"range": "Unreleased", "fetched_at": "yesterday"}\n[]',
+    '{"range": "Unreleased", "fetched_at": 1e20}\n{"values": []}',
+    '{"range": "Unreleased", "fetched_at": 1e20}\n[[',
+])
+def test_malformed_files_are_misses(tmp_path, contents):
+    fetcher = CountingFetcher()
+    cache = CachedRawValues(fetcher, str(tmp_path))
+    with open(cache._path('Unreleased'), 'w') as f:
+        f.write(contents)
+
+    assert cache.get_raw_values('Unreleased') == fetcher.values
+    assert fetcher.fetches == {'Unreleased': 1}
+
+def test_least_recently_used_tabs_are_evicted(tmp_path):
+    fetcher = CountingFetcher()
+    cache = CachedRawValues(fetcher, str(tmp_path))
+
+    cache.get_raw_values('Unreleased')
+    size = os.path.getsize(cache._path('Unreleased'))
+    cache.max_bytes = size * 2
+
+    cache.get_raw_values('Released')
+    os.utime(cache._path('Unreleased'), (1, 1))
+    os.utime(cache._path('Released'), (2, 2))
+
+    cache.get_raw_values('Stems')
+    assert not os.path.exists(cache._path('Unreleased'))
+    assert os.path.exists(cache._path('Released'))
+    assert os.path.exists(cache._path('Stems'))
+
+def test_eviction_keeps_other_files_and_the_latest_tab(tmp_path):
+    other_file = tmp_path / 'tracker.json'
+    other_file.write_text('[]')
+
+    fetcher = CountingFetcher(rows=1000)
+    cache = CachedRawValues(fetcher, str(tmp_path), max_bytes=1)
+
+    assert cache.get_raw_values('Unreleased') == fetcher.values
+    assert other_file.read_text() == '[]'
+    assert os.path.exists(cache._path('Unreleased'))
+
+def test_failed_writes_keep_the_previous_file(tmp_path, clock):
+    fetcher = CountingFetcher()
+    cache = CachedRawValues(fetcher, str(tmp_path), ttl=60)
+    cache.get_raw_values('Unreleased')
+    with open(cache._path('Unreleased')) as f:
+        previous = f.read()
+
+    # Values that can't be encoded fail partway through writing.
+    fetcher.values = [['cell'], [object()]]
+    clock.now += 61
+    with pytest.raises(TypeError):
+        cache.get_raw_values('Unreleased')
+
+    with open(cache._path('Unreleased')) as f:
+        assert f.read() == previous
+    assert os.listdir(tmp_path) == [os.path.basename(cache._path('Unreleased'))]
+
+def test_stale_temporary_files_are_removed(tmp_path):
+    stale = tmp_path / 'yetracker-interrupted.tmp'
+    stale.write_text('{')
+    os.utime(stale, (1, 1))
+    fresh = tmp_path / 'yetracker-writing.tmp'
+    fresh.write_text('{')
+
+    CachedRawValues(CountingFetcher(), str(tmp_path)).get_raw_values('Unreleased')
+    assert not stale.exists()
+    assert fresh.exists()
@@ -0,0 +1,80 @@
+"""Tests of skipping the download of unchanged tabs,
+against a fake Google Sheets and Google Drive service (see conftest.py)."""
+import pytest
+
+from yetracker._raw_values import RawValuesFromAPI
+
+TAB_NAMES = ['Unreleased', 'Released']
+
+@pytest.fixture
+def fetcher(service) -> RawValuesFromAPI:
+    fetcher = RawValuesFromAPI('spreadsheet', detect_changes=True)
+    fetcher.authenticate('key')
+    return fetcher
+
+def test_unchanged_tab_is_not_downloaded_again(fetcher, service):
+    first = fetcher.get_raw_values('Unreleased')
+    second = fetcher.get_raw_values('Unreleased')
+
+    assert second is first
+    assert service.requests == [('get', 'Unreleased')]
+    assert not fetcher.has_changed('Unreleased')
+
+def test_changed_tab_is_downloaded_again(fetcher, service, tabs):
+    fetcher.get_raw_values('Unreleased')
+
+    tabs['Unreleased'][1][1] = 'Edited'
+    service.files().modified_time = '2024-01-02T00:00:00.000Z'
+    assert fetcher.has_changed('Unreleased')
+
+    values = fetcher.get_raw_values('Unreleased')
+
+    assert values[1][1] == 'Edited'
+    assert service.requests == [('get', 'Unreleased'), ('get', 'Unreleased')]
+
+def test_prefetch_leaves_out_unchanged_tabs(fetcher, service):
+    fetcher.prefetch(*TAB_NAMES)
+    fetcher.discard_prefetched()
+    fetcher.prefetch(*TAB_NAMES)
+
+    assert service.requests == [('batchGet', tuple(TAB_NAMES))]
+    # One Drive request covers every tab of each prefetch.
+    assert service.files().requests == 2
+
+def test_prefetch_replaces_stale_prefetched_values(fetcher, service, tabs):
+    fetcher.prefetch(*TAB_NAMES)
+
+    # The prefetched values were never used before the tab changed.
+    tabs['Released'][1][1] = 'Edited'
+    service.files().modified_time = '2024-01-02T00:00:00.000Z'
+    fetcher.prefetch(*TAB_NAMES)
+
+    assert service.requests[-1] == ('batchGet', tuple(TAB_NAMES))
+    assert fetcher.get_raw_values('Released')[1][1] == 'Edited'
+
+def test_transient_drive_error_keeps_using_drive(fetcher, service):
+    service.files().error_status = 429
+    fetcher.get_raw_values('Unreleased')
+
+    assert service.spreadsheets().probes == ['Unreleased']
+
+    service.files().error_status = None
+    fetcher.get_raw_values('Released')
+
+    assert service.files().requests == 2
+    assert service.spreadsheets().probes == ['Unreleased']
+
+@pytest.mark.parametrize('status', [403, 404])
+def test_unusable_drive_falls_back_to_probing(fetcher, service, tabs, status):
+    service.files().error_status = status
+    fetcher.get_raw_values('Unreleased')
+    fetcher.get_raw_values('Unreleased')
+
+    # Drive isn't asked again once it's known not to work.
+    assert service.files().requests == 1
+    assert service.spreadsheets().probes == ['Unreleased', 'Unreleased']
+    assert service.requests == [('get', 'Unreleased')]
+
+    # Probes only see the first rows of the tab.
+    tabs['Unreleased'][1][1] = 'Edited'
+    assert fetcher.has_changed('Unreleased')
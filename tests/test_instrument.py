@@ -0,0 +1,23 @@
+"""Tests of timing column classes while tracing."""
+from yetracker.column import Column, Name
+from yetracker.instrument import tracing
+
+ROW = ['', 'Love Lockdown [V2]\n(feat. Kid Cudi)']
+
+def calls() -> dict[type[Column], object]:
+    return {cls: cls.__dict__['__call__'] for cls in [Column, *Column.__subclasses__()]
+            if '__call__' in cls.__dict__}
+
+def test_columns_are_restored_after_tracing():
+    before = calls()
+
+    with tracing() as outer:
+        with tracing() as inner:
+            Name(ROW, 1)()
+        # Columns stay timed while any tracer is still in use.
+        assert calls() != before
+        Name(ROW, 1)()
+
+    assert calls() == before
+    assert inner.column_calls == {('Name', None): 1}
+    assert outer.column_calls == {('Name', None): 1}
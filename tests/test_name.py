@@ -0,0 +1,112 @@
+"""Tests that the single-pass `Name` parser gives the same results 
+as the `Name.extract_*` pipeline it replaced."""
+from itertools import product
+import json
+
+import pytest
+
+from benchmarks.fixtures import FIXTURE_PATH
+from yetracker.column import Name
+from yetracker.tab import ReleasedTab, SamplesTab, StemsTab, UnreleasedTab
+
+TAB_CLASSES = {
+    'Unreleased': UnreleasedTab,
+    'Released': ReleasedTab,
+    'Stems': StemsTab,
+    'Samples': SamplesTab
+}
+
+def parse_with_pipeline(cell: str) -> tuple:
+    """Parse a cell the way `Name.__call__` did before it was a single pass."""
+    name = Name([cell], 0)
+    emojis, name_str = name.extract_emojis(cell)
+    version, name_str = name.extract_version(name_str)
+    contribs, name_str = name.extract_contribs(name_str)
+    alt_names, name_str = name.extract_alt_names(name_str)
+    artist, name_str = name.extract_artist(name_str)
+
+    return emojis, version, contribs, alt_names, artist, name_str
+
+def parse_with_name(cell: str) -> tuple:
+    name = Name([cell], 0)
+    name()
+    return (name.emojis, name.version, name.contribs, 
+            name.alt_names, name.artist, name.main_name)
+
+def get_output(parse, cell: str) -> str:
+    """Get the result of parsing a cell, or the exception it raised, as text."""
+    try:
+        emojis, version, contribs, alt_names, artist, main_name = parse(cell)
+    except Exception as e:
+        return f'raises {type(e).__name__}'
+
+    return repr((emojis, version, contribs, contribs(), alt_names, artist, main_name))
+
+def get_fixture_cells() -> list[str]:
+    """Get the "Name" cell of every entry row in the fixture."""
+    with open(FIXTURE_PATH) as f:
+        tabs = {tab['range']: tab['values'] for tab in json.load(f)}
+
+    cells: list[str] = []
+    for tab_name, tab_cls in TAB_CLASSES.items():
+        rules = tab_cls([])
+        for row in rules._iter_entry_rows(enumerate(tabs[tab_name]), rules._get_era_manager()):
+            cells.append(row[1])
+
+    return cells
+
+EDGE_CASES = [
+    '',
+    'Song',
+    '⭐ Song',
+    '⭐ ✨ Song [V2]',
+    '🗑️ Song [V1-V?]',
+    'Song [V3-V5] [V6]',
+    'Kid Cudi - Song',
+    'Kid Cudi - Song - Extended',
+    'Song\n(Other Name, Another Name)',
+    'Song\n(feat. Kid Cudi) (prod. Mike Dean)',
+    'Song\n(with Jay-Z) (ref. Consequence)\n(Other Name)',
+    'Song\n(???. Unknown) (feat. Pusha T & Nas)',
+    '🏆 Pusha T - Song [V2-V4]\n(feat. Kid Cudi)\n(Alt)',
+    'Song\n(not a tag)',
+    'Song\n\n(Alt)',
+    'Song\n',
+    'Song\n ',
+    '\n(feat. Kid Cudi)',
+]
+
+@pytest.mark.parametrize('cell', EDGE_CASES)
+def test_edge_cases(cell: str):
+    assert get_output(parse_with_name, cell) == get_output(parse_with_pipeline, cell)
+
+def test_fixture():
+    cells = get_fixture_cells()
+    assert len(cells) > 0
+
+    for cell in cells:
+        assert get_output(parse_with_name, cell) == get_output(parse_with_pipeline, cell), cell
+
+EMOJIS = ['', '⭐ ', '✨ ', '⭐ ✨ ', '🗑️ ', '🤖 ', '⁉️ ']
+ARTISTS = ['', 'Kid Cudi - ', 'Jay-Z - ']
+TITLES = ['Song', 'Love Lockdown', 'Song - Extended']
+VERSIONS = ['', ' [V2]', ' [V1-V3]', ' [V2-V?]', ' [V1] [V2]']
+CONTRIB_LINES = [None, '(feat. Kid Cudi)', '(prod. Mike Dean) (with Pusha T)', 
+                 '(???. Unknown Artist)', '(not a tag)']
+ALT_NAME_LINES = [None, '(Other Name)', '(Other Name, Another Name)']
+
+def get_combined_cells() -> list[str]:
+    """Get "Name" cells with every combination of the parts that `Name` extracts."""
+    cells: list[str] = []
+    for emoji, artist, title, version, contrib_line, alt_name_line, artist_first in product(
+        EMOJIS, ARTISTS, TITLES, VERSIONS, CONTRIB_LINES, ALT_NAME_LINES, [False, True]
+    ):
+        first_line = artist + emoji if artist_first else emoji + artist
+        lines = [first_line + title + version, contrib_line, alt_name_line]
+        cells.append('\n'.join(line for line in lines if line is not None))
+
+    return cells
+
+def test_combined_parts():
+    for cell in get_combined_cells():
+        assert get_output(parse_with_name, cell) == get_output(parse_with_pipeline, cell), cell
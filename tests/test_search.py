@@ -0,0 +1,52 @@
+"""Tests of updating a search index with the changes to a tab."""
+import copy
+import json
+
+import pytest
+
+from benchmarks.fixtures import load_fixture
+from yetracker import YeTracker
+from yetracker.search import SearchIndex
+import yetracker.search
+
+@pytest.fixture
+def values() -> list[list[str]]:
+    return load_fixture()[0]['values']
+
+def use_values(tracker: YeTracker, values: list[list[str]]):
+    tracker.use_json(json.dumps([{'range': 'Unreleased', 'values': values}]))
+
+def results(index: SearchIndex, query: str) -> list[tuple[str, float]]:
+    # Entries with the same score are in the order they were indexed, which differs.
+    return sorted((result.entry.full_name, result.score) for result in index.search(query, limit=None))
+
+def test_update_tab_matches_a_new_index(values, monkeypatch):
+    tracker = YeTracker()
+    use_values(tracker, values)
+    index = SearchIndex.from_tabs({'Unreleased': tracker.get_tab('Unreleased')})
+
+    edited = copy.deepcopy(values)
+    edited[2][2] = 'zeppelin notes'
+    edited[3][1] = 'Zeppelin Song'
+    del edited[4]
+    # Changing an era copies the entries under it.
+    edited[1][5] = 'edited era notes'
+    use_values(tracker, edited)
+    changes = tracker.refresh('Unreleased')
+
+    tokenized: list[str] = []
+    tokenize = yetracker.search.tokenize
+    monkeypatch.setattr(yetracker.search, 'tokenize', lambda text: tokenized.append(text) or tokenize(text))
+    index.update_tab('Unreleased', changes)
+    monkeypatch.undo()
+
+    # Only the changed entries are tokenized, while every entry has at least two texts.
+    assert 0 < len(tokenized) < len(changes.tab)
+
+    expected = SearchIndex.from_tabs({'Unreleased': changes.tab})
+    for query in ['zeppelin', 'love', 'kid cudi', edited[4][1].split()[0]]:
+        assert results(index, query) == results(expected, query)
+
+    # Results are the entries of the new version of the tab.
+    new_entries = {id(entry) for entry in changes.tab}
+    assert all(id(result.entry) in new_entries for result in index.search('love', limit=None))
@@ -0,0 +1,87 @@
+"""Tests of saving parsed tabs to a snapshot and loading them back."""
+import copy
+import json
+
+import pytest
+
+from benchmarks.fixtures import load_fixture
+from yetracker import YeTracker
+from yetracker.snapshot import SnapshotError, _resolve_class
+import yetracker.snapshot
+
+@pytest.fixture
+def tracker() -> YeTracker:
+    tracker = YeTracker(raw_json=json.dumps(load_fixture()))
+    tracker.load_tabs()
+    return tracker
+
+@pytest.fixture
+def path(tracker, tmp_path) -> str:
+    path = str(tmp_path / 'tracker.snapshot')
+    tracker.save_snapshot(path)
+    return path
+
+def test_tabs_are_restored(tracker, path):
+    loaded = YeTracker().load_snapshot(path)
+
+    for tab_name, (_, tab) in tracker._built_tabs.items():
+        assert type(loaded[tab_name]) is type(tab)
+        assert repr(list(loaded[tab_name])) == repr(list(tab))
+        assert repr(loaded[tab_name].eras) == repr(tab.eras)
+
+    # Eras are shared between the tab and its entries, as when parsed.
+    unreleased = loaded['Unreleased']
+    assert unreleased[0].era is unreleased.eras[0]
+
+def test_raw_values_are_decoded_when_needed(tracker, path):
+    other = YeTracker()
+    other.load_snapshot(path)
+
+    assert len(other.raw_store) == 0
+
+    changes = other.refresh('Unreleased')
+
+    assert not changes
+    assert list(other.raw_store) == ['Unreleased']
+    assert other.collected_raw_values == tracker.collected_raw_values
+
+def test_other_schema_versions_are_parsed_again(tracker, path, monkeypatch):
+    def fail(parsed):
+        raise AssertionError('The parsed section was read.')
+
+    monkeypatch.setattr(yetracker.snapshot, 'SCHEMA_VERSION', yetracker.snapshot.SCHEMA_VERSION + 1)
+    monkeypatch.setattr(yetracker.snapshot, '_decode_tabs', fail)
+    loaded = YeTracker().load_snapshot(path)
+
+    for tab_name, (_, tab) in tracker._built_tabs.items():
+        assert repr(list(loaded[tab_name])) == repr(list(tab))
+
+def test_only_yetracker_classes_are_resolved():
+    assert _resolve_class('yetracker.tab:UnreleasedTab').__name__ == 'UnreleasedTab'
+
+    with pytest.raises(SnapshotError):
+        _resolve_class('os:system')
+    with pytest.raises(SnapshotError):
+        _resolve_class('yetrackerx.tab:UnreleasedTab')
+
+def test_refresh_after_loading(path):
+    loaded = YeTracker()
+    loaded.load_snapshot(path)
+
+    values = copy.deepcopy(load_fixture())
+    values[0]['values'][2][2] = 'Edited'
+    loaded.use_json(json.dumps(values))
+    changes = loaded.refresh('Unreleased')
+
+    assert [new.notes for _, new in changes.modified] == ['Edited']
+
+def test_shared_snapshot_matches_the_tabs(tracker, tmp_path):
+    path = str(tmp_path / 'tracker.shared')
+    tracker.save_shared_snapshot(path)
+    snapshot = tracker.open_shared_snapshot(path)
+
+    for tab_name, (_, tab) in tracker._built_tabs.items():
+        shared = snapshot.tabs[tab_name]
+        for field in ('main_name', 'emojis', 'contribs', 'era', 'length', 'quality', 'samples'):
+            if hasattr(tab[3], field):
+                assert repr(getattr(shared[3], field)) == repr(getattr(tab[3], field))
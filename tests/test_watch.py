@@ -0,0 +1,114 @@
+"""Tests of watching tabs for changes, against a scripted fetcher."""
+import asyncio
+import copy
+
+import pytest
+
+from benchmarks.fixtures import load_fixture
+from yetracker import AsyncYeTracker, YeTracker
+from yetracker._raw_values import Range, RawValuesFetcher
+from yetracker.watch import ChangeEvent, NewEntry, QualityChanged
+
+class ScriptedFetcher(RawValuesFetcher):
+    """Returns the next values of a script each time a tab is fetched, 
+    then the last values forever."""
+    def __init__(self, script: list[Range]):
+        super().__init__()
+        self.script = script
+        self.fetches = 0
+        self.authenticated = True
+
+    def get_raw_values(self, tab_name: str) -> Range:
+        values = self.script[min(self.fetches, len(self.script) - 1)]
+        self.fetches += 1
+        return copy.deepcopy(values)
+
+    def authenticate(self, *args):
+        pass
+
+class Done(Exception):
+    pass
+
+@pytest.fixture
+def base() -> Range:
+    values = load_fixture()[0]['values']
+    # The header, an era row and its entries, and the rows that end the tab.
+    return values[:30] + values[-3:]
+
+def with_row(values: Range, index: int, row: list[str]) -> Range:
+    return values[:index] + [row] + values[index:]
+
+def with_cell(values: Range, row: int, column: int, value: str) -> Range:
+    values = copy.deepcopy(values)
+    values[row][column] = value
+    return values
+
+def test_bursts_are_coalesced(base):
+    leak = [base[2][0], 'New Leak', '', '3:00', '', '', 'Full', 'Low Quality', 'https://example.com/u']
+    added = with_row(base, 2, leak)
+    upgraded = with_cell(added, 2, 7, 'CD Quality')
+
+    events, waits = watch([base, base, base, added, upgraded, upgraded])
+
+    assert waits == [60, 120, 240, 5, 5, 60]
+    # The leak was added and then upgraded in the same burst, so it's only new.
+    assert [type(event) for event in events] == [NewEntry]
+    assert events[0].entry.quality == upgraded[2][7]
+
+def test_copied_entries_are_netted_out(base):
+    leak = [base[2][0], 'New Leak', '', '3:00', '', '', 'Full', 'Low Quality', 'https://example.com/u']
+    added = with_row(base, 2, leak)
+    # Changing the era copies the entries under it, including the new leak.
+    edited = with_cell(with_cell(added, 1, 5, 'edited notes'), 5, 7, 'Lossless')
+    removed = edited[:2] + edited[3:]
+
+    events, _ = watch([base, base, added, edited, removed, removed])
+
+    assert [type(event) for event in events] == [QualityChanged]
+    assert events[0].new.full_name == removed[4][1]
+
+def test_async_watch(base):
+    leak = [base[2][0], 'New Leak', '', '3:00', '', '', 'Full', 'Low Quality', 'https://example.com/u']
+    added = with_row(base, 2, leak)
+    script = [base, base, added, added]
+
+    tracker = AsyncYeTracker()
+    tracker.raw_values_fetcher = fetcher = ScriptedFetcher(script)
+    waits: list[float] = []
+
+    async def sleep(seconds: float):
+        waits.append(seconds)
+        if fetcher.fetches >= len(script):
+            raise Done()
+
+    async def collect() -> list[ChangeEvent]:
+        events = []
+        with pytest.raises(Done):
+            async for event in tracker.watch(['Unreleased'], sleep=sleep):
+                events.append(event)
+        return events
+
+    events = asyncio.run(collect())
+
+    assert waits == [60, 120, 5, 60]
+    assert [type(event) for event in events] == [NewEntry]
+    assert events[0].entry.full_name == 'New Leak'
+
+def watch(script: list[Range]) -> tuple[list[ChangeEvent], list[float]]:
+    """Watch the Unreleased tab until the script runs out, 
+    getting every event and the time waited before each poll."""
+    tracker = YeTracker()
+    tracker.raw_values_fetcher = fetcher = ScriptedFetcher(script)
+    waits: list[float] = []
+
+    def sleep(seconds: float):
+        waits.append(seconds)
+        if fetcher.fetches >= len(script):
+            raise Done()
+
+    events = []
+    with pytest.raises(Done):
+        for event in tracker.watch(['Unreleased'], sleep=sleep):
+            events.append(event)
+
+    return events, waits